@@ -0,0 +1,115 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""
+Micro-benchmark of Utils base64 helpers on JWT segment and card snapshot sizes.
+
+Compares the current helpers against the previous exception-driven implementation,
+run it with the SDK installed or from the repository root:
+
+    PYTHONPATH=. python benchmarks/base64_benchmark.py
+"""
+import base64
+import binascii
+import os
+import timeit
+
+from virgil_sdk.utils import Utils
+
+
+def legacy_b64_decode(source):
+    try:
+        if isinstance(source, bytes):
+            return base64.urlsafe_b64decode(source)
+        return base64.urlsafe_b64decode(bytearray(source, "utf-8"))
+    except (binascii.Error, TypeError):
+        missing_padding = len(source) % 4
+        if missing_padding != 0:
+            if isinstance(source, str):
+                source += '=' * (4 - missing_padding)
+            if isinstance(source, (bytes, bytearray)):
+                source += b'=' * (4 - missing_padding)
+        if isinstance(source, bytes):
+            return base64.urlsafe_b64decode(source)
+        return base64.urlsafe_b64decode(bytearray(source, "utf-8"))
+
+
+def legacy_b64_encode(source):
+    if isinstance(source, bytes):
+        encoded = base64.urlsafe_b64encode(source)
+    else:
+        encoded = base64.urlsafe_b64encode(bytearray(source, "utf-8"))
+    return bytearray(encoded).decode().rstrip("=")
+
+
+def legacy_b64encode(source):
+    return base64.b64encode(bytearray(source)).decode("utf-8", "ignore")
+
+
+SAMPLES = [
+    ("jwt header", os.urandom(70)),
+    ("jwt body", os.urandom(190)),
+    ("jwt signature", os.urandom(83)),
+    ("card snapshot", os.urandom(220)),
+]
+
+
+def measure(function, argument, number):
+    return min(timeit.repeat(lambda: function(argument), number=number, repeat=5)) / number * 1e9
+
+
+def main(number=100000):
+    row = "{:<14} {:<12} {:>12} {:>12} {:>8}"
+    print(row.format("sample", "operation", "legacy, ns", "current, ns", "gain"))
+    for name, data in SAMPLES:
+        encoded = Utils.b64_encode(data)
+        cases = [
+            ("b64_decode", legacy_b64_decode, Utils.b64_decode, encoded),
+            ("b64_encode", legacy_b64_encode, Utils.b64_encode, data),
+            ("b64encode", legacy_b64encode, Utils.b64encode, data),
+        ]
+        for operation, legacy, current, argument in cases:
+            assert legacy(argument) == current(argument)
+            legacy_time = measure(legacy, argument, number)
+            current_time = measure(current, argument, number)
+            print(row.format(
+                name,
+                operation,
+                "{:.0f}".format(legacy_time),
+                "{:.0f}".format(current_time),
+                "{:.2f}x".format(legacy_time / current_time)
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -48,7 +48,14 @@ app = Flask(__name__)
 user_storage = dict()  # primitive user storage
 
 
-def generate_jwt(identity):
+jwt_generator = None  # token generator is created once and reused for every request
+
+
+def get_jwt_generator():
+    global jwt_generator
+    if jwt_generator:
+        return jwt_generator
+
     crypto = VirgilCrypto()
 
     # Account data from dashboard
@@ -62,14 +69,18 @@ def generate_jwt(identity):
     imported_api_private_key = crypto.import_private_key(Utils.b64decode(api_private_key)).private_key
 
     # Instantiate token generator
-    builder = JwtGenerator(
+    jwt_generator = JwtGenerator(
         app_id,
         imported_api_private_key,
         api_key_id,
         token_ttl,
         AccessTokenSigner()
     )
-    token = builder.generate_token(identity).to_string()  # generating token and transforming to string
+    return jwt_generator
+
+
+def generate_jwt(identity):
+    token = get_jwt_generator().generate_token(identity).to_string()  # generating token and transforming to string
     return token
 
 
@@ -7,7 +7,8 @@ setup(
     packages=find_packages(exclude=["doc-source"]),
     package_data={"virgil_sdk": [
         "tests/*",
-        "tests/data/*.json"
+        "tests/data/*.json",
+        "tests/data/*.pem"
     ]},
     author=__author__,
     author_email="support@virgilsecurity.com",
@@ -23,7 +24,7 @@ setup(
         "Programming Language :: Python :: 3.7",
         "Topic :: Security :: Cryptography",
     ],
-    install_requires=["virgil_crypto>=5.0.0"],
+    install_requires=["virgil_crypto>=5.0.0", "futures; python_version < '3'"],
     license="BSD",
     description="""
     Virgil Security provides a set of APIs for adding security to any application. In a few simple steps you can encrypt communication, securely store data, provide passwordless login, and ensure data integrity.
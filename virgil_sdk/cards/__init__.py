@@ -31,8 +31,15 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import sys
 
 from .card import Card
 from .raw_card_content import RawCardContent
 from .card_signature import CardSignature
+from .card_result import CardResult
+from .card_cache import CardCache
+from .memory_card_cache import MemoryCardCache
 from .card_manager import CardManager
+
+if sys.version_info >= (3, 5):
+    from .async_card_manager import AsyncCardManager
@@ -0,0 +1,225 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import asyncio
+
+from virgil_sdk.client import RawSignedModel, ExpiredAuthorizationClientException
+from virgil_sdk.client.async_card_client import AsyncCardClient
+from virgil_sdk.jwt.token_context import TokenContext
+from .card_manager import CardManager
+from .card_result import CardResult
+
+
+class AsyncCardManager(CardManager):
+    """
+    The AsyncCardManager class provides coroutine-based methods to manage the VirgilCard entities.
+
+    Cards received from the service are verified the same way as in CardManager.
+    Network operations are coroutines running on the asyncio event loop,
+    import and export operations are inherited from CardManager.
+    """
+
+    def __init__(
+        self,
+        card_crypto,
+        access_token_provider,
+        card_verifier,
+        sign_callback=None,
+        api_url="https://api.virgilsecurity.com",
+        retry_on_unauthorized=False,
+        card_cache=None,
+        verification_executor=None
+    ):
+        super(AsyncCardManager, self).__init__(
+            card_crypto,
+            access_token_provider,
+            card_verifier,
+            sign_callback=sign_callback,
+            api_url=api_url,
+            retry_on_unauthorized=retry_on_unauthorized,
+            card_cache=card_cache,
+            verification_executor=verification_executor
+        )
+        self.__retry_on_unauthorized = retry_on_unauthorized
+
+    async def publish_card(self, *args, **kwargs):
+        # type: (...) -> Card
+        """
+        Publish a new Card using specified params.
+
+        Args:
+            *args:
+                raw_card: Unpublished raw signed model.
+                or
+                private_key: PrivateKey for generate self signature.
+                public_key: Card Public key.
+                identity: Unique identity value.
+                previous_card_id: Previous card id that current card is used to override to.
+                extra_fields: The additional data associated with the card.
+            **kwargs:
+                raw_card: Unpublished raw signed model.
+                or
+                private_key: PrivateKey for generate self signature.
+                public_key: Card Public key.
+                identity: Unique identity value.
+                previous_card_id: Previous card id that current card is used to override to.
+                extra_fields: The additional data associated with the card.
+
+        Returns:
+            The instance of newly published Card.
+        """
+        if len(args) == 1 and isinstance(args[0], RawSignedModel):
+            raw_card = args[0]
+        elif len(kwargs.keys()) == 1 and "raw_card" in kwargs.keys():
+            raw_card = kwargs["raw_card"]
+        else:
+            raw_card = self.generate_raw_card(*args, **kwargs)
+        token_context = self._publish_token_context(raw_card)
+        token = self._access_token_provider.get_token(token_context)
+        published_model = await self.__try_execute(self.card_client.publish_card, raw_card, token, token_context)
+        return self._verified_published_card(raw_card, published_model)
+
+    async def get_card(self, card_id):
+        # type: (str) -> Card
+        """
+        Gets the card by specified ID.
+
+        Args:
+            card_id: The card ID to be found.
+
+        Returns:
+            The instance of found Card
+        """
+        card = self._cached_card(card_id)
+        if card:
+            return card
+        token_context = TokenContext(None, "get")
+        access_token = self._access_token_provider.get_token(token_context)
+        raw_card, is_outdated = await self.__try_execute(
+            self.card_client.get_card,
+            card_id,
+            access_token,
+            token_context
+        )
+        return self._cache_card(self._verified_card(card_id, raw_card, is_outdated))
+
+    async def get_cards(self, card_ids, max_concurrency=10):
+        # type: (List[str], int) -> List[CardResult]
+        """
+        Gets the cards by specified IDs concurrently.
+
+        One access token is obtained for the whole batch. Failures are reported
+        per card ID and do not interrupt the rest of the batch.
+
+        Args:
+            card_ids: The card IDs to be found.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The list of CardResult in the order of card_ids.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        card_ids = list(card_ids)
+        results, missing_ids = self._cached_card_results(card_ids)
+        if missing_ids:
+            for result in await self.__fetch_cards(missing_ids, max_concurrency):
+                results[result.card_id] = result
+        return [results[card_id] for card_id in card_ids]
+
+    async def search_card(self, identity):
+        # type: (Union[str, list]) -> List[Card]
+        """
+        Searches for cards by specified identity.
+
+        Args:
+            identity: The identity (or list of identity) to be found.
+
+        Returns:
+            The list of found Card.
+        """
+        if not identity:
+            raise ValueError("Missing identity for search")
+        cards = self._cached_search_result(identity)
+        if cards is not None:
+            return cards
+        token_context = TokenContext(None, "search")
+        access_token = self._access_token_provider.get_token(token_context)
+        raw_cards = await self.__try_execute(self.card_client.search_card, identity, access_token, token_context)
+        return self._cache_search_result(identity, self._verified_search_result(identity, raw_cards))
+
+    async def close(self):
+        """
+        Closes idle connections of the card client.
+        """
+        await self.card_client.close()
+
+    async def __fetch_cards(self, card_ids, max_concurrency):
+        # type: (List[str], int) -> List[CardResult]
+        token_context = TokenContext(None, "get")
+        access_token = self._access_token_provider.get_token(token_context)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_card_result(card_id):
+            async with semaphore:
+                try:
+                    raw_card, is_outdated = await self.__try_execute(
+                        self.card_client.get_card, card_id, access_token, token_context
+                    )
+                    return CardResult(card_id, self._received_card(card_id, raw_card, is_outdated), None)
+                except Exception as e:
+                    return CardResult(card_id, None, e)
+
+        results = await asyncio.gather(*[get_card_result(card_id) for card_id in card_ids])
+        return self._verified_card_results(list(results))
+
+    async def __try_execute(self, card_function, card_arg, token, context):
+        # type: (function, Any, str, TokenContext) -> Any
+        attempts_number = 2 if self.__retry_on_unauthorized else 1
+        while attempts_number > 0:
+            try:
+                return await card_function(card_arg, token)
+            except ExpiredAuthorizationClientException as e:
+                token = self._access_token_provider.get_token(
+                    TokenContext(context.identity, context.operation, True, context.service)
+                )
+                if attempts_number - 1 < 1:
+                    raise e
+            attempts_number -= 1
+
+    @staticmethod
+    def _create_card_client(api_url, connection_pool):
+        # type: (Optional[str], Optional[ConnectionPool]) -> AsyncCardClient
+        if api_url:
+            return AsyncCardClient(api_url)
+        return AsyncCardClient()
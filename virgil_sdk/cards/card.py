@@ -67,20 +67,21 @@ class Card(object):
         self.__signatures = signatures
         self.previous_card = None
         self._content_snapshot = content_snapshot
+        self._raw_content_snapshot = None
         self.is_outdated = is_outdated
 
     @classmethod
     def __generate_card_id(cls, card_crypto, content_snapshot):
-        # type: (Any, dict) -> str
+        # type: (Any, memoryview) -> str
         """
         Generate card id from content snapshot
         Args:
             card_crypto: Users CardCrypto witch provides cryptographic operations.
-            content_snapshot: Card content snapshot
+            content_snapshot: Decoded card content snapshot
         Returns:
             Generated Card id.
         """
-        fingerprint = card_crypto.generate_sha512(bytearray(content_snapshot))
+        fingerprint = card_crypto.generate_sha512(content_snapshot)
         card_id = binascii.hexlify(bytearray(fingerprint)[:32]).decode()
         return card_id
 
@@ -96,7 +97,8 @@ class Card(object):
             Card created from model content snapshot.
         """
         card_content = cls.__new__(cls)
-        loaded_snapshot = Utils.json_loads(Utils.b64_decode(content_snapshot))
+        raw_content_snapshot = bytes(Utils.b64_decode(content_snapshot))
+        loaded_snapshot = Utils.json_loads(raw_content_snapshot)
         card_content._identity = loaded_snapshot["identity"]
         card_content._public_key = loaded_snapshot["public_key"]
         card_content._version = loaded_snapshot["version"]
@@ -106,6 +108,7 @@ class Card(object):
         else:
             card_content._previous_card_id = None
         card_content._content_snapshot = content_snapshot
+        card_content._raw_content_snapshot = raw_content_snapshot
         return card_content
 
     @classmethod
@@ -125,7 +128,7 @@ class Card(object):
         card.previous_card = None
         card.is_outdated = is_outdated
 
-        card._id = cls.__generate_card_id(card_crypto, Utils.b64_decode(raw_singed_model.content_snapshot))
+        card._id = cls.__generate_card_id(card_crypto, card.raw_content_snapshot)
         card._public_key = card_crypto.import_public_key(bytearray(Utils.b64_decode(card._public_key)))
         signatures = list()
         if raw_singed_model.signatures:
@@ -233,3 +236,13 @@ class Card(object):
             )
         return self._content_snapshot
 
+    @property
+    def raw_content_snapshot(self):
+        """
+        Decoded card content snapshot shared by id generation and signature checks.
+        Returns:
+            Read-only memoryview of snapshot bytes.
+        """
+        if self._raw_content_snapshot is None:
+            self._raw_content_snapshot = bytes(Utils.b64_decode(self.content_snapshot))
+        return memoryview(self._raw_content_snapshot)
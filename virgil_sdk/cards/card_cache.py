@@ -0,0 +1,114 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from abc import ABCMeta, abstractmethod
+
+
+class CardCache(object):
+    """The CardCache provides abstract for storing already verified cards on the client side."""
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def get_card(self, card_id):
+        """
+        Gets cached card by ID.
+
+        Args:
+            card_id: The card ID to be found.
+
+        Returns:
+            Cached Card or None.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def put_card(self, card):
+        """
+        Stores verified card by its ID.
+
+        Args:
+            card: Verified Card.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_identity_cards(self, identity):
+        """
+        Gets cached search result for identity.
+
+        Args:
+            identity: Card identity.
+
+        Returns:
+            List of cached actual Cards or None.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def put_identity_cards(self, identity, cards):
+        """
+        Stores verified search result for identity.
+
+        Args:
+            identity: Card identity.
+            cards: List of actual Cards found for identity.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def invalidate_card(self, card_id):
+        """
+        Drops cached card by ID.
+
+        Args:
+            card_id: Card ID.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def invalidate_identity(self, identity):
+        """
+        Drops cached search result for identity.
+
+        Args:
+            identity: Card identity.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self):
+        """
+        Drops all cached data.
+        """
+        raise NotImplementedError()
@@ -33,6 +33,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 import datetime
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from virgil_sdk.jwt.token_context import TokenContext
 from virgil_sdk.cards.raw_card_content import RawCardContent
@@ -40,6 +41,7 @@ from virgil_sdk.client import RawSignedModel, ExpiredAuthorizationClientExceptio
 from virgil_sdk.utils import Utils
 from virgil_sdk.verification import CardVerificationException
 from .card import Card
+from .card_result import CardResult
 from virgil_sdk.verification.virgil_card_verifier import VirgilCardVerifier
 from virgil_sdk.client.card_client import CardClient
 from virgil_sdk.signers.model_signer import ModelSigner
@@ -61,7 +63,10 @@ class CardManager(object):
         card_verifier,
         sign_callback=None,
         api_url="https://api.virgilsecurity.com",
-        retry_on_unauthorized=False
+        retry_on_unauthorized=False,
+        connection_pool=None,
+        card_cache=None,
+        verification_executor=None
     ):
         self._card_crypto = card_crypto
         self._model_signer = None
@@ -71,6 +76,9 @@ class CardManager(object):
         self._access_token_provider = access_token_provider
         self.__retry_on_unauthorized = retry_on_unauthorized
         self.__api_url = api_url
+        self.__connection_pool = connection_pool
+        self._card_cache = card_cache
+        self.__verification_executor = verification_executor
 
     def generate_raw_card(self, private_key, public_key, identity, previous_card_id="", extra_fields=None):
         # type: (VirgilPrivateKey, VirgilPublicKey, str, Optional[str], Optional[dict]) -> RawSignedModel
@@ -137,14 +145,37 @@ class CardManager(object):
         Returns:
             The instance of found Card
         """
+        card = self._cached_card(card_id)
+        if card:
+            return card
         token_context = TokenContext(None, "get")
         access_token = self._access_token_provider.get_token(token_context)
         raw_card, is_outdated = self.__try_execute(self.card_client.get_card, card_id, access_token, token_context)
-        card = Card.from_signed_model(self._card_crypto, raw_card, is_outdated)
-        if card.id != card_id:
-            raise CardVerificationException("Invalid card")
-        self.__validate(card)
-        return card
+        return self._cache_card(self._verified_card(card_id, raw_card, is_outdated))
+
+    def get_cards(self, card_ids, max_concurrency=10):
+        # type: (List[str], int) -> List[CardResult]
+        """
+        Gets the cards by specified IDs concurrently.
+
+        One access token is obtained for the whole batch. Failures are reported
+        per card ID and do not interrupt the rest of the batch.
+
+        Args:
+            card_ids: The card IDs to be found.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The list of CardResult in the order of card_ids.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        card_ids = list(card_ids)
+        results, missing_ids = self._cached_card_results(card_ids)
+        if missing_ids:
+            for result in self.__fetch_cards(missing_ids, max_concurrency):
+                results[result.card_id] = result
+        return [results[card_id] for card_id in card_ids]
 
     def search_card(self, identity):
         # type: (Union[str, list]) -> List[Card]
@@ -159,19 +190,13 @@ class CardManager(object):
         """
         if not identity:
             raise ValueError("Missing identity for search")
+        cards = self._cached_search_result(identity)
+        if cards is not None:
+            return cards
         token_context = TokenContext(None, "search")
         access_token = self._access_token_provider.get_token(token_context)
         raw_cards = self.__try_execute(self.card_client.search_card, identity, access_token, token_context)
-        cards = list(map(lambda x: Card.from_signed_model(self._card_crypto, x), raw_cards))
-        if isinstance(identity, list):
-            if any(list(map(lambda x: x.identity not in identity, cards))):
-                raise CardVerificationException("Invalid cards")
-        else:
-            if any(list(map(lambda x: x.identity != identity, cards))):
-                raise CardVerificationException("Invalid cards")
-        for card in cards:
-            self.__validate(card)
-        return self._linked_card_list(cards)
+        return self._cache_search_result(identity, self._verified_search_result(identity, raw_cards))
 
     def import_card(self, card_to_import):
         # type: (Union[str, dict, RawSignedModel]) -> Card
@@ -184,26 +209,25 @@ class CardManager(object):
         Returns:
             Imported and verified card.
         """
-        if isinstance(card_to_import, str) or Utils.check_unicode(card_to_import):
-            card_to_import = str(card_to_import)
-            try:
-                if isinstance(Utils.json_loads(card_to_import), dict):
-                    card = Card.from_signed_model(self._card_crypto, RawSignedModel.from_json(card_to_import))
-                else:
-                    raise JSONDecodeError
-            except (JSONDecodeError, ValueError) as e:
-                card = Card.from_signed_model(self._card_crypto, RawSignedModel.from_string(card_to_import))
-        elif isinstance(card_to_import, dict) or isinstance(card_to_import, bytes):
-            card = Card.from_signed_model(self._card_crypto, RawSignedModel.from_json(card_to_import))
-        elif isinstance(card_to_import, RawSignedModel):
-            card = Card.from_signed_model(self._card_crypto, card_to_import)
-        elif card_to_import is None:
-            raise ValueError("Missing card to import")
-        else:
-            raise TypeError("Unexpected type for card import")
+        card = self.__parse_card(card_to_import)
         self.__validate(card)
         return card
 
+    def import_cards(self, cards_to_import):
+        # type: (List[Union[str, dict, RawSignedModel]]) -> List[Card]
+        """
+        Imports and verifies list of Cards.
+
+        Args:
+            cards_to_import: List of exported data of signed models.
+
+        Returns:
+            List of imported and verified cards.
+        """
+        cards = list(map(self.__parse_card, cards_to_import))
+        self.__validate_cards(cards)
+        return cards
+
     def export_card_to_string(self, card):
         # type: (Card) -> str
         """
@@ -246,20 +270,168 @@ class CardManager(object):
             raw_signed_model.add_signature(signature)
         return raw_signed_model
 
+    def __parse_card(self, card_to_import):
+        # type: (Union[str, dict, RawSignedModel]) -> Card
+        if isinstance(card_to_import, str) or Utils.check_unicode(card_to_import):
+            card_to_import = str(card_to_import)
+            try:
+                if isinstance(Utils.json_loads(card_to_import), dict):
+                    card = Card.from_signed_model(self._card_crypto, RawSignedModel.from_json(card_to_import))
+                else:
+                    raise JSONDecodeError
+            except (JSONDecodeError, ValueError) as e:
+                card = Card.from_signed_model(self._card_crypto, RawSignedModel.from_string(card_to_import))
+        elif isinstance(card_to_import, dict) or isinstance(card_to_import, bytes):
+            card = Card.from_signed_model(self._card_crypto, RawSignedModel.from_json(card_to_import))
+        elif isinstance(card_to_import, RawSignedModel):
+            card = Card.from_signed_model(self._card_crypto, card_to_import)
+        elif card_to_import is None:
+            raise ValueError("Missing card to import")
+        else:
+            raise TypeError("Unexpected type for card import")
+        return card
+
+    def __fetch_cards(self, card_ids, max_concurrency):
+        # type: (List[str], int) -> List[CardResult]
+        token_context = TokenContext(None, "get")
+        access_token = self._access_token_provider.get_token(token_context)
+
+        def get_card_result(card_id):
+            try:
+                raw_card, is_outdated = self.__try_execute(
+                    self.card_client.get_card, card_id, access_token, token_context
+                )
+                return CardResult(card_id, self._received_card(card_id, raw_card, is_outdated), None)
+            except Exception as e:
+                return CardResult(card_id, None, e)
+
+        # ensure lazy client creation does not race between workers
+        self.card_client
+        workers = min(max_concurrency, len(card_ids))
+        if workers == 1:
+            results = list(map(get_card_result, card_ids))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(get_card_result, card_ids))
+
+        return self._verified_card_results(results)
+
+    def _cached_card_results(self, card_ids):
+        # type: (List[str]) -> Tuple[Dict[str, CardResult], List[str]]
+        results = dict()
+        for card_id in card_ids:
+            card = self._cached_card(card_id)
+            if card:
+                results[card_id] = CardResult(card_id, card, None)
+        missing_ids = [card_id for card_id in set(card_ids) if card_id not in results]
+        return results, missing_ids
+
+    def _verified_card_results(self, results):
+        # type: (List[CardResult]) -> List[CardResult]
+        received = [result for result in results if result.error is None]
+        verified = dict()
+        try:
+            verification_results = self.__verify_cards(list(map(lambda x: x.card, received)))
+            for result, is_verified in zip(received, verification_results):
+                if is_verified:
+                    verified[result.card_id] = CardResult(result.card_id, self._cache_card(result.card), None)
+                else:
+                    verified[result.card_id] = CardResult(
+                        result.card_id, None, CardVerificationException("Card verification failed!")
+                    )
+        except Exception as e:
+            for result in received:
+                verified[result.card_id] = CardResult(result.card_id, None, e)
+        return [verified.get(result.card_id, result) for result in results]
+
     def __publish_raw_card(self, raw_card):
         # type: (RawSignedModel) -> Card
+        token_context = self._publish_token_context(raw_card)
+        token = self._access_token_provider.get_token(token_context)
+        published_model = self.__try_execute(self.card_client.publish_card, raw_card, token, token_context)
+        return self._verified_published_card(raw_card, published_model)
+
+    def _publish_token_context(self, raw_card):
+        # type: (RawSignedModel) -> TokenContext
         if self._sign_callback:
             self._sign_callback(raw_card)
         card_content = RawCardContent.from_signed_model(self._card_crypto, raw_card)
-        token_context = TokenContext(card_content.identity, "publish_card")
-        token = self._access_token_provider.get_token(token_context)
-        published_model = self.__try_execute(self.card_client.publish_card, raw_card, token, token_context)
+        return TokenContext(card_content.identity, "publish_card")
+
+    def _verified_card(self, card_id, raw_card, is_outdated):
+        # type: (str, RawSignedModel, bool) -> Card
+        card = self._received_card(card_id, raw_card, is_outdated)
+        self.__validate(card)
+        return card
+
+    def _received_card(self, card_id, raw_card, is_outdated):
+        # type: (str, RawSignedModel, bool) -> Card
+        card = Card.from_signed_model(self._card_crypto, raw_card, is_outdated)
+        if card.id != card_id:
+            raise CardVerificationException("Invalid card")
+        return card
+
+    def _verified_search_result(self, identity, raw_cards):
+        # type: (Union[str, list], List[RawSignedModel]) -> List[Card]
+        cards = list(map(lambda x: Card.from_signed_model(self._card_crypto, x), raw_cards))
+        if isinstance(identity, list):
+            if any(list(map(lambda x: x.identity not in identity, cards))):
+                raise CardVerificationException("Invalid cards")
+        else:
+            if any(list(map(lambda x: x.identity != identity, cards))):
+                raise CardVerificationException("Invalid cards")
+        self.__validate_cards(cards)
+        return self._linked_card_list(cards)
+
+    def _verified_published_card(self, raw_card, published_model):
+        # type: (RawSignedModel, RawSignedModel) -> Card
         if published_model.content_snapshot != raw_card.content_snapshot:
             raise CardVerificationException("Publishing returns invalid card")
         card = Card.from_signed_model(self._card_crypto, published_model)
         self.__validate(card)
+        if self._card_cache is not None:
+            if card.previous_card_id:
+                self._card_cache.invalidate_card(card.previous_card_id)
+            self._card_cache.invalidate_identity(card.identity)
+            self._card_cache.put_card(card)
+        return card
+
+    def _cached_card(self, card_id):
+        # type: (str) -> Optional[Card]
+        if self._card_cache is None:
+            return None
+        return self._card_cache.get_card(card_id)
+
+    def _cache_card(self, card):
+        # type: (Card) -> Card
+        if self._card_cache is not None:
+            self._card_cache.put_card(card)
         return card
 
+    def _cached_search_result(self, identity):
+        # type: (Union[str, list]) -> Optional[List[Card]]
+        if self._card_cache is None:
+            return None
+        identities = identity if isinstance(identity, list) else [identity]
+        cards = list()
+        for item in identities:
+            identity_cards = self._card_cache.get_identity_cards(item)
+            if identity_cards is None:
+                return None
+            cards.extend(identity_cards)
+        return cards
+
+    def _cache_search_result(self, identity, cards):
+        # type: (Union[str, list], List[Card]) -> List[Card]
+        if self._card_cache is None:
+            return cards
+        identities = identity if isinstance(identity, list) else [identity]
+        for item in set(identities):
+            self._card_cache.put_identity_cards(item, [card for card in cards if card.identity == item])
+        for card in cards:
+            self._card_cache.put_card(card)
+        return cards
+
     def __validate(self, card):
         # type: (Card) -> None
         if card is None:
@@ -267,19 +439,35 @@ class CardManager(object):
         if not self.card_verifier.verify_card(card):
             raise CardVerificationException("Card verification failed!")
 
+    def __validate_cards(self, cards):
+        # type: (List[Card]) -> None
+        if any(map(lambda x: x is None, cards)):
+            raise ValueError("Missing card for validation")
+        if not all(self.__verify_cards(cards)):
+            raise CardVerificationException("Card verification failed!")
+
+    def __verify_cards(self, cards):
+        # type: (List[Card]) -> List[bool]
+        if not cards:
+            return []
+        card_verifier = self.card_verifier
+        if hasattr(card_verifier, "verify_cards"):
+            return card_verifier.verify_cards(cards, self.__verification_executor)
+        return list(map(card_verifier.verify_card, cards))
+
     def __try_execute(self, card_function, card_arg, token, context):
         # type: (function, Any, str, TokenContext) -> Any
         attempts_number = 2 if self.__retry_on_unauthorized else 1
-        result = None
         while attempts_number > 0:
             try:
-                result = card_function(card_arg, token)
+                return card_function(card_arg, token)
             except ExpiredAuthorizationClientException as e:
-                token = self._access_token_provider.get_token(context)
+                token = self._access_token_provider.get_token(
+                    TokenContext(context.identity, context.operation, True, context.service)
+                )
                 if attempts_number-1 < 1:
                     raise e
             attempts_number -= 1
-        return result
 
     @staticmethod
     def _linked_card_list(card_list):
@@ -293,6 +481,13 @@ class CardManager(object):
                     del unsorted[card.previous_card_id]
         return list(unsorted.values())
 
+    @staticmethod
+    def _create_card_client(api_url, connection_pool):
+        # type: (Optional[str], Optional[ConnectionPool]) -> CardClient
+        if api_url:
+            return CardClient(api_url, connection_pool=connection_pool)
+        return CardClient(connection_pool=connection_pool)
+
     @property
     def model_signer(self):
         """
@@ -314,16 +509,23 @@ class CardManager(object):
             Returns an instance of CardClient with provides card service operations.
         """
         if not self._card_client:
-            if self.__api_url:
-                self._card_client = CardClient(self.__api_url)
-            else:
-                self._card_client = CardClient()
+            self._card_client = self._create_card_client(self.__api_url, self.__connection_pool)
         return self._card_client
 
     @card_client.setter
     def card_client(self, card_client):
         self._card_client = card_client
 
+    @property
+    def card_cache(self):
+        """
+        Client-side cache of verified cards.
+
+        Returns:
+            Returns an instance of CardCache or None if caching is disabled.
+        """
+        return self._card_cache
+
     @property
     def card_verifier(self):
         """
@@ -0,0 +1,106 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from virgil_sdk.utils import TtlCache
+from .card_cache import CardCache
+
+
+class MemoryCardCache(CardCache):
+    """
+    In-memory CardCache with LRU eviction and TTL.
+
+    Cards are immutable by ID and may be kept for a long time, while search
+    results change whenever a new card is published for identity and
+    should be kept for a shorter time.
+
+    Args:
+        capacity: Maximum number of cached cards and of cached identities.
+        card_ttl: Lifetime of card cached by ID in seconds.
+        identity_ttl: Lifetime of identity search result in seconds.
+    """
+
+    def __init__(self, capacity=1000, card_ttl=3600, identity_ttl=60):
+        # type: (int, Optional[float], Optional[float]) -> None
+        self.__cards = TtlCache(capacity, card_ttl)
+        self.__identities = TtlCache(capacity, identity_ttl)
+
+    def get_card(self, card_id):
+        # type: (str) -> Optional[Card]
+        return self.__cards.get(card_id)
+
+    def put_card(self, card):
+        # type: (Card) -> None
+        self.__cards.put(card.id, card)
+
+    def get_identity_cards(self, identity):
+        # type: (str) -> Optional[List[Card]]
+        cards = self.__identities.get(identity)
+        return None if cards is None else list(cards)
+
+    def put_identity_cards(self, identity, cards):
+        # type: (str, List[Card]) -> None
+        self.__identities.put(identity, tuple(cards))
+
+    def invalidate_card(self, card_id):
+        # type: (str) -> None
+        self.__cards.pop(card_id)
+
+    def invalidate_identity(self, identity):
+        # type: (str) -> None
+        self.__identities.pop(identity)
+
+    def clear(self):
+        # type: () -> None
+        self.__cards.clear()
+        self.__identities.clear()
+
+    @property
+    def hits(self):
+        """
+        Number of card and identity lookups served from the cache.
+        """
+        return self.__cards.hits + self.__identities.hits
+
+    @property
+    def misses(self):
+        """
+        Number of card and identity lookups missed the cache.
+        """
+        return self.__cards.misses + self.__identities.misses
+
+    @property
+    def evictions(self):
+        """
+        Number of entries dropped because of capacity or expiration.
+        """
+        return self.__cards.evictions + self.__identities.evictions
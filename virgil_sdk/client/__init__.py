@@ -31,6 +31,7 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import sys
 
 from .client_exception import ClientException
 from .unauthorized_client_exception import UnauthorizedClientException
@@ -39,3 +40,6 @@ from .raw_signed_model import RawSignedModel
 from .raw_signature import RawSignature
 from .base_card_client import BaseCardClient
 from .card_client import CardClient
+
+if sys.version_info >= (3, 5):
+    from .async_card_client import AsyncCardClient
@@ -0,0 +1,113 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+from virgil_sdk import __version__
+from virgil_sdk.client.connections.virgil_agent_adapter import VirgilAgentAdapter
+from .card_client import CardClient
+from .connections.async_service_connection import AsyncServiceConnection
+from .raw_signed_model import RawSignedModel
+
+
+class AsyncCardClient(CardClient):
+    """
+    The AsyncCardClient class provides coroutine-based operations with Virgil Cards service.
+    """
+
+    def __init__(
+        self,
+        api_url="https://api.virgilsecurity.com",  # type: str
+        connection=None  # type: AsyncServiceConnection
+    ):
+        super(AsyncCardClient, self).__init__(
+            api_url,
+            connection=connection or AsyncServiceConnection(
+                api_url,
+                adapters=[VirgilAgentAdapter("sdk", __version__)]
+            )
+        )
+
+    async def publish_card(self, raw_card, token):
+        # type: (RawSignedModel, str) -> RawSignedModel
+        """
+        Publishes card in Virgil Cards service.
+
+        Args:
+            raw_card: An instance of RawSignedModel class.
+            token: The string representation of Jwt token.
+
+        Returns:
+            Published raw card.
+        """
+        response, headers = await self.connection.send(self._publish_card_request(raw_card, token))
+        return RawSignedModel(**response)
+
+    async def search_card(self, identity, token):
+        # type: (Union[str, list], str) -> List[RawSignedModel]
+        """
+        Searches a cards on Virgil Services by specified identity.
+
+        Args:
+            identity: The identity (or list of identity).
+            token: The string representation of Jwt token.
+
+        Returns:
+           A list of found cards in raw form.
+        """
+        response, headers = await self.connection.send(self._search_card_request(identity, token))
+        return self._parse_cards_from_response(response)
+
+    async def get_card(self, card_id, token):
+        # type: (str, str) -> Tuple[RawSignedModel, bool]
+        """
+        Gets a card from Virgil Services by specified card ID.
+
+        Args:
+            card_id: The Card ID.
+            token: The string representation of Jwt token.
+
+        Returns:
+            An instance of RawSignedModel class and flag,
+            which determines whether or not this raw card is superseded.
+
+        Raises:
+            ValueError: Missed argument.
+        """
+        response, headers = await self.connection.send(self._get_card_request(card_id, token))
+        return self._parse_card_from_response(response, headers)
+
+    async def close(self):
+        """
+        Closes idle connections of the client.
+        """
+        await self.connection.close()
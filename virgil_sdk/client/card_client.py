@@ -37,6 +37,7 @@ from virgil_sdk.client import RawSignedModel
 from virgil_sdk.client.connections.virgil_agent_adapter import VirgilAgentAdapter
 from virgil_sdk.utils import Utils
 from .base_card_client import BaseCardClient
+from .connections.connection_pool import ConnectionPool
 from .connections.request import Request
 from .connections.service_connection import ServiceConnection
 
@@ -49,12 +50,14 @@ class CardClient(BaseCardClient):
     def __init__(
         self,
         api_url="https://api.virgilsecurity.com",  # type: str
-        connection=None  # type: ServiceConnection
+        connection=None,  # type: ServiceConnection
+        connection_pool=None  # type: ConnectionPool
     ):
         self._api_url = api_url
         self.__connection = connection or ServiceConnection(
             self.api_url,
-            adapters=[VirgilAgentAdapter("sdk", __version__)]
+            adapters=[VirgilAgentAdapter("sdk", __version__)],
+            connection_pool=connection_pool or ConnectionPool()
         )
 
     def publish_card(self, raw_card, token):
@@ -69,20 +72,7 @@ class CardClient(BaseCardClient):
         Returns:
             Published raw card.
         """
-        if not raw_card:
-            raise ValueError("Missing raw card")
-
-        if not token:
-            raise ValueError("Missing JWT token")
-
-        request = Request(
-            "/card/v5",
-            Utils.json_loads(raw_card.to_json()),
-            method=Request.POST
-        )
-
-        request.authorization(token)
-        response, headers = self.__connection.send(request)
+        response, headers = self.__connection.send(self._publish_card_request(raw_card, token))
         return RawSignedModel(**response)
 
     def search_card(self, identity, token):
@@ -97,6 +87,63 @@ class CardClient(BaseCardClient):
         Returns:
            A list of found cards in raw form.
         """
+        response, headers = self.__connection.send(self._search_card_request(identity, token))
+        return self._parse_cards_from_response(response)
+
+    def get_card(self, card_id, token):
+        # type: (str, str) -> Tuple[RawSignedModel, bool]
+        """
+        Gets a card from Virgil Services by specified card ID.
+
+        Args:
+            card_id: The Card ID.
+            token: The string representation of Jwt token.
+
+        Returns:
+            An instance of RawSignedModel class and flag,
+            which determines whether or not this raw card is superseded.
+
+        Raises:
+            ValueError: Missed argument.
+        """
+        response, headers = self.__connection.send(self._get_card_request(card_id, token))
+        return self._parse_card_from_response(response, headers)
+
+    @property
+    def api_url(self):
+        """
+        Get service url.
+        """
+        return self._api_url
+
+    @property
+    def connection(self):
+        """
+        Get connection used to send requests to the service.
+        """
+        return self.__connection
+
+    @staticmethod
+    def _publish_card_request(raw_card, token):
+        # type: (RawSignedModel, str) -> Request
+        if not raw_card:
+            raise ValueError("Missing raw card")
+
+        if not token:
+            raise ValueError("Missing JWT token")
+
+        request = Request(
+            "/card/v5",
+            Utils.json_loads(raw_card.to_json()),
+            method=Request.POST
+        )
+
+        request.authorization(token)
+        return request
+
+    @staticmethod
+    def _search_card_request(identity, token):
+        # type: (Union[str, list], str) -> Request
         if not identity:
             raise ValueError("Missing identity")
 
@@ -117,28 +164,11 @@ class CardClient(BaseCardClient):
         )
 
         request.authorization(token)
+        return request
 
-        response, headers = self.__connection.send(request)
-        cards = self.__parse_cards_from_response(response)
-
-        return cards
-
-    def get_card(self, card_id, token):
-        # type: (str, str) -> Tuple[RawSignedModel, bool]
-        """
-        Gets a card from Virgil Services by specified card ID.
-
-        Args:
-            card_id: The Card ID.
-            token: The string representation of Jwt token.
-
-        Returns:
-            An instance of RawSignedModel class and flag,
-            which determines whether or not this raw card is superseded.
-
-        Raises:
-            ValueError: Missed argument.
-        """
+    @staticmethod
+    def _get_card_request(card_id, token):
+        # type: (str, str) -> Request
         if not card_id:
             raise ValueError("Missing card id")
 
@@ -150,9 +180,11 @@ class CardClient(BaseCardClient):
         )
 
         request.authorization(token)
+        return request
 
-        response, headers = self.__connection.send(request)
-
+    @staticmethod
+    def _parse_card_from_response(response, headers):
+        # type: (dict, dict) -> Tuple[RawSignedModel, bool]
         card_raw = RawSignedModel(**response)
 
         superseded = False
@@ -162,14 +194,9 @@ class CardClient(BaseCardClient):
 
         return card_raw, superseded
 
-    @property
-    def api_url(self):
-        """
-        Get service url.
-        """
-        return self._api_url
-
-    def __parse_cards_from_response(self, response):
+    @staticmethod
+    def _parse_cards_from_response(response):
+        # type: (list) -> List[RawSignedModel]
         if response:
             result = list()
             for card in response:
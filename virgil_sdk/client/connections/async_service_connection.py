@@ -0,0 +1,292 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import asyncio
+import time
+
+from virgil_sdk.utils import Utils
+from .connection_pool import ConnectionPool
+from .service_connection import ServiceConnection
+from .tls_session_cache import TlsSessionCache
+from .urllib import httplib, urllib2, urlparse
+
+
+class AsyncServiceConnection(ServiceConnection):
+    """
+    Asyncio-native connection to Virgil Services.
+
+    Requests are sent over keep-alive HTTP/1.1 connections opened with asyncio streams,
+    so a single event loop can run many concurrent requests without threads.
+    The send method is a coroutine. Proxies are taken from the environment the
+    same way as by ConnectionPool.
+
+    Args:
+        base_url: Base address for the connection.
+        adapters: List of HttpRequestAdapter applied to each request.
+        max_size: Maximum number of idle connections kept per host.
+        idle_timeout: Seconds an idle connection may stay in the pool.
+        max_connections: Maximum number of simultaneously open connections per host.
+        timeout: Seconds to wait for a response, no limit if None.
+        tls_session_cache: Cache providing shared SSL context, process-wide cache if None.
+    """
+
+    MAX_CONNECTIONS = 100
+
+    def __init__(
+        self,
+        base_url,  # type: str
+        adapters=None,  # type: List[HttpRequestAdapter]
+        max_size=ConnectionPool.MAX_SIZE,  # type: int
+        idle_timeout=ConnectionPool.IDLE_TIMEOUT,  # type: Union[int, float]
+        max_connections=MAX_CONNECTIONS,  # type: int
+        timeout=None,  # type: Optional[Union[int, float]]
+        tls_session_cache=None  # type: Optional[TlsSessionCache]
+    ):
+        super(AsyncServiceConnection, self).__init__(base_url, adapters)
+        self.__max_size = max_size
+        self.__idle_timeout = idle_timeout
+        self.__max_connections = max_connections
+        self.__timeout = timeout
+        self.__tls_session_cache = tls_session_cache or TlsSessionCache.default()
+        self.__idle_connections = dict()
+        self.__semaphores = dict()
+
+    async def send(self, request):
+        # type: (Request) -> Tuple[dict, dict]
+        """
+        Sends an HTTP request to the API.
+
+        Args:
+            request: The HTTP request details.
+
+        Returns:
+            Response.
+
+        Raises:
+            ClientException: Gets some connection or api errors.
+            UnauthorizedClientException: Request without or wrong access token.
+        """
+        prepared_request = self._prepare_request(request)
+        url = prepared_request.get_full_url()
+        try:
+            if self.__timeout is not None:
+                response = await asyncio.wait_for(self.__send(prepared_request), self.__timeout)
+            else:
+                response = await self.__send(prepared_request)
+            result, headers = self._process_response(url, *response)
+            return Utils.json_loads(result), headers
+        except urllib2.HTTPError as exception:
+            self._raise_client_exception(exception)
+
+    async def close(self):
+        """
+        Closes all idle connections.
+        """
+        idle_connections = self.__idle_connections
+        self.__idle_connections = dict()
+        for connections in idle_connections.values():
+            for reader, writer, released_at in connections:
+                writer.close()
+
+    async def __send(self, prepared_request):
+        parsed_url = urlparse(prepared_request.get_full_url())
+        key = (parsed_url.scheme, parsed_url.hostname, parsed_url.port)
+        path = parsed_url.path or "/"
+        if parsed_url.query:
+            path += "?" + parsed_url.query
+        method = prepared_request.get_method()
+        headers = self._request_headers(prepared_request)
+        if parsed_url.scheme == "http":
+            proxy = ConnectionPool._proxy_for(parsed_url.scheme, parsed_url.hostname)
+            if proxy:
+                # plain http goes through the proxy with absolute request urls
+                path = "{}://{}{}".format(parsed_url.scheme, parsed_url.netloc, path)
+                headers.update(ConnectionPool._proxy_headers(proxy))
+        payload = self.__serialize_request(method, path, parsed_url.netloc, prepared_request.data, headers)
+
+        semaphore = self.__semaphores.get(key)
+        if semaphore is None:
+            semaphore = self.__semaphores.setdefault(key, asyncio.Semaphore(self.__max_connections))
+
+        async with semaphore:
+            reader, writer, reused = await self.__acquire(key)
+            try:
+                try:
+                    response = await self.__perform(reader, writer, payload)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    # the request may have reached the server, resend only idempotent ones;
+                    # timeouts cancel the request and are never retried
+                    if not reused or method.upper() not in ConnectionPool.IDEMPOTENT_METHODS:
+                        raise
+                    # server has dropped the idle keep-alive connection, retry on a fresh one
+                    reader, writer = await self.__open(key)
+                    response = await self.__perform(reader, writer, payload)
+            except BaseException:
+                writer.close()
+                raise
+
+            status, reason, headers, body, will_close = response
+            if will_close:
+                writer.close()
+            else:
+                self.__release(key, reader, writer)
+            return status, reason, headers, body
+
+    async def __acquire(self, key):
+        connections = self.__idle_connections.get(key, [])
+        while connections:
+            reader, writer, released_at = connections.pop()
+            if reader.at_eof() or time.time() - released_at > self.__idle_timeout:
+                writer.close()
+                continue
+            return reader, writer, True
+        reader, writer = await self.__open(key)
+        return reader, writer, False
+
+    def __release(self, key, reader, writer):
+        connections = self.__idle_connections.setdefault(key, [])
+        if len(connections) < self.__max_size:
+            connections.append((reader, writer, time.time()))
+        else:
+            writer.close()
+
+    async def __open(self, key):
+        scheme, host, port = key
+        if scheme not in ("http", "https"):
+            raise ValueError("Unsupported url scheme {}".format(scheme))
+        proxy = ConnectionPool._proxy_for(scheme, host)
+        if scheme == "http":
+            if proxy:
+                return await asyncio.open_connection(proxy.hostname, proxy.port or 80)
+            return await asyncio.open_connection(host, port or 80)
+        if proxy:
+            sock = await asyncio.get_event_loop().run_in_executor(
+                None, self.__open_tunnel, proxy, host, port or 443
+            )
+            return await asyncio.open_connection(
+                sock=sock,
+                ssl=self.__tls_session_cache.context,
+                server_hostname=host
+            )
+        return await asyncio.open_connection(
+            host,
+            port or 443,
+            ssl=self.__tls_session_cache.context,
+            server_hostname=host
+        )
+
+    def __open_tunnel(self, proxy, host, port):
+        # CONNECT handshake is done by httplib on a blocking socket, TLS runs over it in the loop
+        connection = httplib.HTTPConnection(proxy.hostname, proxy.port or 80, timeout=self.__timeout)
+        connection.set_tunnel(host, port, headers=ConnectionPool._proxy_headers(proxy))
+        try:
+            connection.connect()
+        except BaseException:
+            connection.close()
+            raise
+        sock, connection.sock = connection.sock, None
+        sock.settimeout(None)
+        return sock
+
+    @staticmethod
+    def __serialize_request(method, path, host, body, headers):
+        lines = ["{} {} HTTP/1.1".format(method, path)]
+        header_names = set(map(lambda x: x.lower(), headers.keys()))
+        if "host" not in header_names:
+            lines.append("Host: {}".format(host))
+        if "accept-encoding" not in header_names:
+            lines.append("Accept-Encoding: identity")
+        if body is not None or method in ("POST", "PUT"):
+            lines.append("Content-Length: {}".format(len(body or b"")))
+        for name, value in headers.items():
+            lines.append("{}: {}".format(name, value))
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        if body:
+            payload += body
+        return payload
+
+    @staticmethod
+    async def __perform(reader, writer, payload):
+        writer.write(payload)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by the server")
+        version, status, reason = (status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+
+        headers = list()
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, value = line.decode("latin-1").split(":", 1)
+            headers.append((name.strip(), value.strip()))
+        header_values = dict(map(lambda x: (x[0].lower(), x[1].lower()), headers))
+
+        will_close = header_values.get("connection") == "close" or \
+            (version == "HTTP/1.0" and header_values.get("connection") != "keep-alive")
+        if int(status) in (204, 304) or int(status) < 200:
+            body = b""
+        elif header_values.get("transfer-encoding") == "chunked":
+            chunks = list()
+            while True:
+                size = int((await reader.readline()).split(b";", 1)[0].strip(), 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in header_values:
+            body = await reader.readexactly(int(header_values["content-length"]))
+        else:
+            body = await reader.read()
+            will_close = True
+        return int(status), reason, headers, body, will_close
+
+    @property
+    def max_size(self):
+        """
+        Maximum number of idle connections kept per host.
+        """
+        return self.__max_size
+
+    @property
+    def max_connections(self):
+        """
+        Maximum number of simultaneously open connections per host.
+        """
+        return self.__max_connections
@@ -0,0 +1,279 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import base64
+import select
+import socket
+import threading
+import time
+
+from .tls_session_cache import TlsSessionCache
+from .urllib import httplib, urllib2, urlparse
+
+
+class ResumableHTTPSConnection(httplib.HTTPSConnection):
+    """
+    HTTPS connection which performs handshakes through TlsSessionCache
+    to resume previous TLS sessions with the same host.
+    """
+
+    def __init__(self, host, port=None, tls_session_cache=None, **kwargs):
+        self.__tls_session_cache = tls_session_cache or TlsSessionCache.default()
+        httplib.HTTPSConnection.__init__(self, host, port, context=self.__tls_session_cache.context, **kwargs)
+        self.__session_stored = False
+
+    def connect(self):
+        """Connects to the host and performs TLS handshake."""
+        httplib.HTTPConnection.connect(self)
+        self.sock = self.__tls_session_cache.wrap_socket(self.sock, self.__server_hostname, self.port)
+        self.__session_stored = False
+
+    def store_tls_session(self):
+        """Remembers TLS session of the connection, once per handshake."""
+        if self.sock and not self.__session_stored:
+            self.__tls_session_cache.store_session(self.sock, self.__server_hostname, self.port)
+            self.__session_stored = True
+
+    @property
+    def __server_hostname(self):
+        return self._tunnel_host or self.host
+
+
+class ConnectionPool(object):
+    """
+    Thread-safe pool of persistent keep-alive HTTP(S) connections.
+
+    Connections are kept per (scheme, host, port) and reused across requests
+    and threads, so repeated calls to the same service skip TCP and TLS handshakes.
+    Proxies configured by the environment (http_proxy, https_proxy, no_proxy)
+    are honoured, https requests are tunneled through the proxy.
+
+    Args:
+        max_size: Maximum number of idle connections kept per host.
+        idle_timeout: Seconds an idle connection may stay in the pool before it is closed.
+        timeout: Socket timeout for new connections, default socket timeout if None.
+        tls_session_cache: Cache of SSL context and TLS sessions, process-wide cache if None.
+    """
+
+    MAX_SIZE = 10
+    IDLE_TIMEOUT = 60  # 60 seconds
+    IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"))
+
+    def __init__(
+        self,
+        max_size=MAX_SIZE,  # type: int
+        idle_timeout=IDLE_TIMEOUT,  # type: Union[int, float]
+        timeout=None,  # type: Optional[Union[int, float]]
+        tls_session_cache=None  # type: Optional[TlsSessionCache]
+    ):
+        if max_size < 1:
+            raise ValueError("Pool size must be positive")
+        self.__max_size = max_size
+        self.__idle_timeout = idle_timeout
+        self.__timeout = timeout
+        self.__tls_session_cache = tls_session_cache or TlsSessionCache.default()
+        self.__idle_connections = dict()
+        self.__lock = threading.Lock()
+
+    def request(self, method, url, body=None, headers=None):
+        # type: (str, str, Optional[bytes], Optional[dict]) -> Tuple[int, str, List[Tuple[str, str]], bytes]
+        """
+        Sends an HTTP request over a pooled connection.
+
+        Args:
+            method: HTTP method.
+            url: Absolute request url.
+            body: Request body bytes.
+            headers: Request headers.
+
+        Returns:
+            Tuple of response status, reason, headers and body.
+
+        Raises:
+            httplib.HTTPException, socket.error: Connection errors.
+        """
+        parsed_url = urlparse(url)
+        key = (parsed_url.scheme, parsed_url.hostname, parsed_url.port)
+        path = parsed_url.path or "/"
+        if parsed_url.query:
+            path += "?" + parsed_url.query
+        headers = dict(headers or {})
+        proxy = self._proxy_for(parsed_url.scheme, parsed_url.hostname)
+        if proxy and parsed_url.scheme == "http":
+            # plain http goes through the proxy with absolute request urls
+            path = "{}://{}{}".format(parsed_url.scheme, parsed_url.netloc, path)
+            headers.update(self._proxy_headers(proxy))
+
+        connection, reused = self.__acquire(key)
+        try:
+            try:
+                response = self.__perform(connection, method, path, body, headers)
+            except (httplib.HTTPException, socket.error) as e:
+                connection.close()
+                if not reused or isinstance(e, socket.timeout) or method.upper() not in self.IDEMPOTENT_METHODS:
+                    raise
+                # server has dropped the idle keep-alive connection, retry on a fresh one
+                connection = self._create_connection(*key)
+                response = self.__perform(connection, method, path, body, headers)
+            data = response.read()
+            if isinstance(connection, ResumableHTTPSConnection):
+                connection.store_tls_session()
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self.__release(key, connection)
+        return response.status, response.reason, response.getheaders(), data
+
+    def clear(self):
+        """
+        Closes all idle connections.
+        """
+        with self.__lock:
+            idle_connections = self.__idle_connections
+            self.__idle_connections = dict()
+        for connections in idle_connections.values():
+            for connection, released_at in connections:
+                connection.close()
+
+    def _create_connection(self, scheme, host, port):
+        # type: (str, str, Optional[int]) -> httplib.HTTPConnection
+        """
+        Opens a new connection to the specified host.
+        """
+        kwargs = dict()
+        if self.__timeout is not None:
+            kwargs["timeout"] = self.__timeout
+        if scheme not in ("http", "https"):
+            raise ValueError("Unsupported url scheme {}".format(scheme))
+        proxy = self._proxy_for(scheme, host)
+        if scheme == "http":
+            if proxy:
+                return httplib.HTTPConnection(proxy.hostname, proxy.port, **kwargs)
+            return httplib.HTTPConnection(host, port, **kwargs)
+        if proxy:
+            connection = ResumableHTTPSConnection(
+                proxy.hostname, proxy.port, tls_session_cache=self.__tls_session_cache, **kwargs
+            )
+            connection.set_tunnel(host, port, headers=self._proxy_headers(proxy))
+            return connection
+        return ResumableHTTPSConnection(host, port, tls_session_cache=self.__tls_session_cache, **kwargs)
+
+    @staticmethod
+    def _proxy_for(scheme, host):
+        # type: (str, str) -> Optional[ParseResult]
+        """
+        Proxy configured by the environment for the scheme and host, None for a direct connection.
+        """
+        proxy_url = urllib2.getproxies().get(scheme)
+        if not proxy_url or urllib2.proxy_bypass(host):
+            return None
+        if "://" not in proxy_url:
+            proxy_url = "http://" + proxy_url
+        return urlparse(proxy_url)
+
+    @staticmethod
+    def _proxy_headers(proxy):
+        # type: (ParseResult) -> dict
+        """
+        Headers authenticating requests to the proxy.
+        """
+        if proxy.username is None:
+            return {}
+        credentials = "{}:{}".format(proxy.username, proxy.password or "").encode()
+        return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials).decode()}
+
+    def __acquire(self, key):
+        expired = list()
+        connection = None
+        with self.__lock:
+            connections = self.__idle_connections.get(key, [])
+            while connections:
+                candidate, released_at = connections.pop()
+                if candidate.sock is None or time.time() - released_at > self.__idle_timeout or\
+                        self.__is_dropped(candidate):
+                    expired.append(candidate)
+                    continue
+                connection = candidate
+                break
+        for expired_connection in expired:
+            expired_connection.close()
+        if connection:
+            return connection, True
+        return self._create_connection(*key), False
+
+    def __release(self, key, connection):
+        with self.__lock:
+            connections = self.__idle_connections.setdefault(key, [])
+            if len(connections) < self.__max_size:
+                connections.append((connection, time.time()))
+                return
+        connection.close()
+
+    @staticmethod
+    def __is_dropped(connection):
+        # an idle keep-alive socket turns readable only when the server has closed it
+        try:
+            readable, _, _ = select.select([connection.sock], [], [], 0)
+        except (ValueError, select.error, socket.error):
+            return True
+        return bool(readable)
+
+    @staticmethod
+    def __perform(connection, method, path, body, headers):
+        connection.request(method, path, body=body, headers=headers)
+        return connection.getresponse()
+
+    @property
+    def tls_session_cache(self):
+        """
+        Cache of SSL context and TLS sessions used by https connections of the pool.
+        """
+        return self.__tls_session_cache
+
+    @property
+    def max_size(self):
+        """
+        Maximum number of idle connections kept per host.
+        """
+        return self.__max_size
+
+    @property
+    def idle_timeout(self):
+        """
+        Seconds an idle connection may stay in the pool.
+        """
+        return self.__idle_timeout
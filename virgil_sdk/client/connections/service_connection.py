@@ -31,21 +31,24 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
-import ssl
+import io
+import socket
 from virgil_sdk.utils import Utils
 
 from virgil_sdk.client import ClientException, UnauthorizedClientException, ExpiredAuthorizationClientException
 from .base_connection import BaseConnection
-from .urllib import urllib2
+from .tls_session_cache import TlsSessionCache
+from .urllib import urllib2, httplib
 from .urllib import RequestWithMethod
 
 
 class ServiceConnection(BaseConnection):
 
-    def __init__(self, base_url, adapters=None):
-        # type: (str, List[HttpRequestAdapter])->None
+    def __init__(self, base_url, adapters=None, connection_pool=None):
+        # type: (str, List[HttpRequestAdapter], Optional[ConnectionPool])->None
         self.__base_url = base_url
         self.__adapters = adapters
+        self.__connection_pool = connection_pool
 
     def send(self, request):
         # type: (Request) -> Tuple[dict, dict]
@@ -64,48 +67,116 @@ class ServiceConnection(BaseConnection):
         """
         prepared_request = self._prepare_request(request)
 
-        if self.__adapters:
-            for adapter in self.__adapters:
-                prepared_request = adapter.adapt(prepared_request)
-
-        ctx = ssl.create_default_context()
         try:
-            response = urllib2.urlopen(prepared_request, context=ctx)
-            result = response.read()
-            headers = dict()
-            for k, v in dict(response.info()).items():
-                headers.update({k.upper(): v})
-            return Utils.json_loads(result.decode()), headers
+            if self.__connection_pool:
+                result, headers = self.__send_pooled(prepared_request)
+            else:
+                ctx = TlsSessionCache.default().context
+                response = urllib2.urlopen(prepared_request, context=ctx)
+                result = response.read()
+                headers = dict()
+                for k, v in dict(response.info()).items():
+                    headers.update({k.upper(): v})
+            return Utils.json_loads(result), headers
         except urllib2.HTTPError as exception:
-            client_errors = {
-                400: "Request Error",
-                401: "Authorization Error",
-                404: "Entity Not Found",
-                405: "Method Not Allowed",
-                500: "Internal Server Error"
-            }
-            try:
-                error_res = exception.read()
-                if error_res:
-                    error_body = Utils.json_loads(bytes(error_res))
-                else:
-                    error_body = error_res
-                if isinstance(error_body, dict) and "message" in error_body.keys() and "code" in error_body.keys():
-                    if exception.code in client_errors.keys() and exception.code == 401:
-                        if int(error_body["code"]) == 20304:
-                            Utils.raise_from(
-                                ExpiredAuthorizationClientException(client_errors[exception.code], exception.code)
-                            )
-                        Utils.raise_from(UnauthorizedClientException(client_errors[exception.code], exception.code))
-                    Utils.raise_from(ClientException(error_body["message"], error_body["code"]))
-                else:
-                    Utils.raise_from(ClientException(client_errors[exception.code], exception.code))
-            except ValueError:
-                raise exception
+            self._raise_client_exception(exception)
+
+    def __send_pooled(self, prepared_request):
+        # type: (RequestWithMethod) -> Tuple[bytes, dict]
+        url = prepared_request.get_full_url()
+        try:
+            status, reason, response_headers, result = self.__connection_pool.request(
+                prepared_request.get_method(),
+                url,
+                body=prepared_request.data,
+                headers=self._request_headers(prepared_request)
+            )
+        except (httplib.HTTPException, socket.error) as error:
+            # keep the urlopen error contract for transport failures
+            raise urllib2.URLError(error)
+        return self._process_response(url, status, reason, response_headers, result)
+
+    def _raise_client_exception(self, exception):
+        # type: (urllib2.HTTPError) -> None
+        """Converts http error to the corresponding ClientException and raises it.
+
+        Args:
+            exception: HTTPError returned by the service.
+
+        Raises:
+            ClientException: Gets some connection or api errors.
+            UnauthorizedClientException: Request without or wrong access token.
+            HTTPError: Error response is not a service error.
+        """
+        client_errors = {
+            400: "Request Error",
+            401: "Authorization Error",
+            404: "Entity Not Found",
+            405: "Method Not Allowed",
+            500: "Internal Server Error"
+        }
+        try:
+            error_res = exception.read()
+            if error_res:
+                error_body = Utils.json_loads(bytes(error_res))
+            else:
+                error_body = error_res
+            if isinstance(error_body, dict) and "message" in error_body.keys() and "code" in error_body.keys():
+                if exception.code in client_errors.keys() and exception.code == 401:
+                    if int(error_body["code"]) == 20304:
+                        Utils.raise_from(
+                            ExpiredAuthorizationClientException(client_errors[exception.code], exception.code)
+                        )
+                    Utils.raise_from(UnauthorizedClientException(client_errors[exception.code], exception.code))
+                Utils.raise_from(ClientException(error_body["message"], error_body["code"]))
+            else:
+                Utils.raise_from(ClientException(client_errors[exception.code], exception.code))
+        except ValueError:
+            raise exception
+
+    @staticmethod
+    def _request_headers(prepared_request):
+        # type: (RequestWithMethod) -> dict
+        """Gets headers to send with prepared request, including the ones urllib adds by default.
+
+        Args:
+            prepared_request: urllib-compatible request object.
+
+        Returns:
+            Dictionary of request headers.
+        """
+        if prepared_request.data is not None and not prepared_request.has_header("Content-type"):
+            prepared_request.add_unredirected_header("Content-type", "application/x-www-form-urlencoded")
+        return dict(prepared_request.header_items())
+
+    @staticmethod
+    def _process_response(url, status, reason, response_headers, result):
+        # type: (str, int, str, List[Tuple[str, str]], bytes) -> Tuple[bytes, dict]
+        """Normalizes response headers and converts error statuses to HTTPError.
+
+        Args:
+            url: Request url.
+            status: Response status code.
+            reason: Response reason phrase.
+            response_headers: List of response header pairs.
+            result: Response body.
+
+        Returns:
+            Response body and dictionary of upper-cased headers.
+
+        Raises:
+            HTTPError: Error response status.
+        """
+        headers = dict()
+        for k, v in response_headers:
+            headers.update({k.upper(): v})
+        if status >= 400:
+            raise urllib2.HTTPError(url, status, reason, headers, io.BytesIO(result))
+        return result, headers
 
     def _prepare_request(self, request):
         # type (http.Request) -> urllib.RequestWithMethod
-        """Converts http request to urllib-compatible request.
+        """Converts http request to urllib-compatible request and applies adapters.
 
         Args:
             request: http.Request object containing sending request data.
@@ -124,6 +195,9 @@ class ServiceConnection(BaseConnection):
             data=data,
             headers=headers
         )
+        if self.__adapters:
+            for adapter in self.__adapters:
+                prepared_request = adapter.adapt(prepared_request)
         return prepared_request
 
     @property
@@ -132,3 +206,10 @@ class ServiceConnection(BaseConnection):
         Gets api url.
         """
         return self.__base_url
+
+    @property
+    def connection_pool(self):
+        """
+        Gets pool of keep-alive connections, None if every request opens a new connection.
+        """
+        return self.__connection_pool
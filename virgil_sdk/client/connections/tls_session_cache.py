@@ -0,0 +1,144 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import ssl
+import threading
+
+
+class TlsSessionCache(object):
+    """
+    The TlsSessionCache keeps a single SSL context, so the system certificate store
+    is loaded once, and TLS sessions per host, so repeated connections resume
+    a previous session instead of performing a full handshake.
+    """
+
+    __default_cache = None
+    __default_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        ssl_context=None  # type: Optional[ssl.SSLContext]
+    ):
+        self.__ssl_context = ssl_context
+        self.__sessions = dict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    @classmethod
+    def default(cls):
+        # type: () -> TlsSessionCache
+        """
+        Gets process-wide cache shared by all connections by default.
+        """
+        if not cls.__default_cache:
+            with cls.__default_cache_lock:
+                if not cls.__default_cache:
+                    cls.__default_cache = cls()
+        return cls.__default_cache
+
+    def wrap_socket(self, sock, host, port):
+        # type: (socket.socket, str, Optional[int]) -> ssl.SSLSocket
+        """
+        Wraps socket with the shared SSL context resuming a cached session for the host if any.
+
+        Args:
+            sock: Connected socket.
+            host: Server host name.
+            port: Server port.
+
+        Returns:
+            Wrapped socket with finished handshake.
+        """
+        session = None
+        if hasattr(ssl.SSLSocket, "session"):
+            with self.__lock:
+                session = self.__sessions.get((host, port))
+        if session:
+            ssl_sock = self.context.wrap_socket(sock, server_hostname=host, session=session)
+        else:
+            ssl_sock = self.context.wrap_socket(sock, server_hostname=host)
+        with self.__lock:
+            if getattr(ssl_sock, "session_reused", False):
+                self.__hits += 1
+            else:
+                self.__misses += 1
+        return ssl_sock
+
+    def store_session(self, ssl_sock, host, port):
+        # type: (ssl.SSLSocket, str, Optional[int]) -> None
+        """
+        Remembers session of the socket for further resumption.
+
+        Args:
+            ssl_sock: Socket with established TLS session.
+            host: Server host name.
+            port: Server port.
+        """
+        session = getattr(ssl_sock, "session", None)
+        if session is None:
+            return
+        with self.__lock:
+            self.__sessions[(host, port)] = session
+
+    def clear(self):
+        """
+        Forgets all cached sessions.
+        """
+        with self.__lock:
+            self.__sessions.clear()
+
+    @property
+    def context(self):
+        """
+        Shared SSL context.
+        """
+        if not self.__ssl_context:
+            with self.__lock:
+                if not self.__ssl_context:
+                    self.__ssl_context = ssl.create_default_context()
+        return self.__ssl_context
+
+    @property
+    def hits(self):
+        """
+        Number of handshakes which resumed a cached session.
+        """
+        return self.__hits
+
+    @property
+    def misses(self):
+        """
+        Number of full handshakes.
+        """
+        return self.__misses
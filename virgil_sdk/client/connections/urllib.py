@@ -37,8 +37,12 @@ import sys
 PYTHON_VERSION = sys.version_info[0]
 if PYTHON_VERSION == 3:
     import urllib.request as urllib2
+    import http.client as httplib
+    from urllib.parse import urlparse
 else:
     import urllib2
+    import httplib
+    from urlparse import urlparse
 
 
 class RequestWithMethod(urllib2.Request, object):
@@ -31,7 +31,7 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
-import datetime
+import time
 
 from virgil_sdk.utils import Utils
 from .jwt_header_content import JwtHeaderContent
@@ -42,6 +42,9 @@ from virgil_sdk.jwt.abstractions.access_token import AccessToken
 class Jwt(AccessToken):
     """
     The Jwt class implements abstract AccessToken in terms of Virgil JWT.
+
+    Jwt imported from string keeps the original representation and decodes
+    header, body and signature only on first access.
     """
 
     def __init__(
@@ -53,6 +56,8 @@ class Jwt(AccessToken):
         self._header_content = jwt_header_content
         self._body_content = jwt_body_content
         self._signature_data = signature_data
+        self._encoded_parts = None
+        self._body_json = None
         self._without_signature = Utils.b64_encode(Utils.json_dumps(self._header_content.json, sort_keys=True).encode())\
                                   + "." +\
                                   Utils.b64_encode(Utils.json_dumps(self._body_content.json, sort_keys=True).encode())
@@ -68,12 +73,12 @@ class Jwt(AccessToken):
         return self._string_representation
 
     def __bytes__(self):
-        return self._unsigned_data
+        return memoryview(self._unsigned_data).tobytes()
 
     def __eq__(self, other):
         return all([
-            self._body_content == other._body_content,
-            self._header_content == other._header_content,
+            self.body_content == other.body_content,
+            self.header_content == other.header_content,
             self.unsigned_data == other.unsigned_data,
             self.signature_data == other.signature_data,
         ])
@@ -95,21 +100,71 @@ class Jwt(AccessToken):
             ValueError: Wrong jwt format.
         """
         parts = jwt_string.split(".")
-        if len(parts) is not 3:
+        if len(parts) != 3:
             raise ValueError("Wrong JWT format.")
 
+        jwt = cls.__new__(cls)
+        jwt._header_content = None
+        jwt._body_content = None
+        jwt._signature_data = None
+        jwt._body_json = None
+        jwt._encoded_parts = parts
+        jwt._unsigned_data = memoryview(jwt_string.encode())[:len(parts[0]) + 1 + len(parts[1])]
+        jwt._string_representation = jwt_string
+        return jwt
+
+    def peek_expiry(self):
+        # type: () -> int
+        """
+        Reads expiration time without building header and body representations.
+
+        Returns:
+            Expiration time as UTC timestamp.
+
+        Raises:
+            ValueError: Wrong jwt format.
+        """
+        if self._body_content is not None:
+            return self._body_content.expires_at_timestamp
         try:
-            jwt = cls.__new__(cls)
-            jwt._header_content = JwtHeaderContent.from_json(Utils.json_loads(Utils.b64_decode(parts[0])))
-            jwt._body_content = JwtBodyContent.from_json(Utils.json_loads(Utils.b64_decode(parts[1])))
-            jwt._signature_data = bytearray(Utils.b64_decode(parts[2]))
-        except Exception as e:
+            return int(self.__body_json["exp"])
+        except (KeyError, TypeError, ValueError):
             raise ValueError("Wrong JWT format.")
 
-        jwt._body_content._app_id = jwt._body_content.issuer.replace(jwt._body_content.subject_prefix, "")
-        jwt._body_content._identity = jwt._body_content.subject.replace(jwt._body_content.identity_prefix, "")
-        jwt._unsigned_data = bytearray(parts[0] + "." + parts[1], "utf-8")
-        jwt._string_representation = jwt_string
+    @property
+    def __body_json(self):
+        # type: () -> dict
+        if self._body_json is None:
+            try:
+                self._body_json = Utils.json_loads(Utils.b64_decode(self._encoded_parts[1]))
+            except Exception:
+                raise ValueError("Wrong JWT format.")
+        return self._body_json
+
+    @classmethod
+    def _from_unsigned_data(cls, jwt_header_content, jwt_body_content, without_signature, signature_data):
+        # type: (JwtHeaderContent, JwtBodyContent, str, Union[bytes, bytearray]) -> Jwt
+        """
+        Initializes a new instance of the Jwt class from already encoded header and body.
+
+        Args:
+            jwt_header_content: Jwt header.
+            jwt_body_content: Jwt body.
+            without_signature: base64UrlEncode(JWT Header) + "." + base64UrlEncode(JWT Body).
+            signature_data: Jwt signature.
+
+        Returns:
+            Initialized instance of Jwt.
+        """
+        jwt = cls.__new__(cls)
+        jwt._header_content = jwt_header_content
+        jwt._body_content = jwt_body_content
+        jwt._signature_data = signature_data
+        jwt._encoded_parts = None
+        jwt._body_json = None
+        jwt._without_signature = without_signature
+        jwt._unsigned_data = without_signature.encode()
+        jwt._string_representation = without_signature + "." + Utils.b64_encode(bytes(signature_data))
         return jwt
 
     def to_string(self):
@@ -118,15 +173,17 @@ class Jwt(AccessToken):
         """
         return self._string_representation
 
-    def is_expired(self, expiration_timestamp=None):
+    def is_expired(self, expiration_timestamp=None, clock_skew=0):
         """
         Whether or not token is expired.
+
+        Args:
+            expiration_timestamp: UTC timestamp to check against, current time if None.
+            clock_skew: Seconds before expiration from which token is already treated as expired.
         """
         if not expiration_timestamp:
-            expiration_time = datetime.datetime.utcnow()
-        else:
-            expiration_time = datetime.datetime.utcfromtimestamp(expiration_timestamp)
-        return expiration_time >= self._body_content.expires_at
+            expiration_timestamp = int(time.time())
+        return expiration_timestamp + clock_skew >= self.peek_expiry()
 
     @property
     def unsigned_data(self):
@@ -140,19 +197,39 @@ class Jwt(AccessToken):
     @property
     def header_content(self):
         """Gets representation of jwt header"""
+        if self._header_content is None:
+            try:
+                self._header_content = JwtHeaderContent.from_json(
+                    Utils.json_loads(Utils.b64_decode(self._encoded_parts[0]))
+                )
+            except Exception:
+                raise ValueError("Wrong JWT format.")
         return self._header_content
 
     @property
     def body_content(self):
         """Gets representation of jwt body"""
+        if self._body_content is None:
+            try:
+                body_content = JwtBodyContent.from_json(self.__body_json)
+                body_content._app_id = body_content.issuer.replace(body_content.subject_prefix, "")
+                body_content._identity = body_content.subject.replace(body_content.identity_prefix, "")
+            except Exception:
+                raise ValueError("Wrong JWT format.")
+            self._body_content = body_content
         return self._body_content
 
     @property
     def signature_data(self):
         """Gets a digital signature of jwt."""
+        if self._signature_data is None and self._encoded_parts is not None:
+            try:
+                self._signature_data = bytearray(Utils.b64_decode(self._encoded_parts[2]))
+            except Exception:
+                raise ValueError("Wrong JWT format.")
         return self._signature_data
 
     @property
     def identity(self):
         """Jwt identity."""
-        return self._body_content.identity
+        return self.body_content.identity
@@ -40,6 +40,9 @@ from virgil_sdk.utils import Utils
 class JwtBodyContent(object):
     """
     JwtBodyContent represents content of Jwt.
+
+    Issue and expiration times are kept as UTC timestamps, datetime
+    representations are built on first access.
     """
 
     __IDENTITY_PREFIX = "identity-"
@@ -49,22 +52,24 @@ class JwtBodyContent(object):
             self,
             app_id,  # type: str
             identity,  # type: str
-            issued_at,  # type: datetime
-            expires_at,  # type: datetime
+            issued_at,  # type: Union[datetime, int]
+            expires_at,  # type: Union[datetime, int]
             data  # type: dict
     ):
         self._app_id = app_id
         self._identity = identity
-        self._issued_at = issued_at
-        self._expires_at = expires_at
+        self._issued_at_timestamp = self.__timestamp(issued_at)
+        self._expires_at_timestamp = self.__timestamp(expires_at)
+        self._issued_at = None
+        self._expires_at = None
         self._additional_data = data
         self._issuer = str(self.__SUBJECT_PREFIX + self._app_id)
         self.subject = str(self.__IDENTITY_PREFIX + self._identity)
 
     def __eq__(self, other):
         return all([
-            self._issued_at == other._issued_at,
-            self._expires_at == other._expires_at,
+            self._issued_at_timestamp == other._issued_at_timestamp,
+            self._expires_at_timestamp == other._expires_at_timestamp,
             self._additional_data == other._additional_data,
             self.issuer == other.issuer,
             self.subject == other.subject
@@ -75,8 +80,10 @@ class JwtBodyContent(object):
         # type: (Union[str, bytes, bytearray]) -> JwtBodyContent
         """Initializes a new instance of the JwtBodyContent from json representation."""
         body_content = cls.__new__(cls)
-        body_content._issued_at = datetime.datetime.utcfromtimestamp(json_loaded_dict["iat"])
-        body_content._expires_at = datetime.datetime.utcfromtimestamp(json_loaded_dict["exp"])
+        body_content._issued_at_timestamp = int(json_loaded_dict["iat"])
+        body_content._expires_at_timestamp = int(json_loaded_dict["exp"])
+        body_content._issued_at = None
+        body_content._expires_at = None
         body_content._additional_data = json_loaded_dict["ada"] if "ada" in json_loaded_dict.keys() else {}
         body_content._issuer = json_loaded_dict["iss"]
         body_content.subject = json_loaded_dict["sub"]
@@ -86,8 +93,8 @@ class JwtBodyContent(object):
     def json(self):
         """JwtBodyContent json representation."""
         raw = OrderedDict({
-            "iat": Utils.to_timestamp(self._issued_at),
-            "exp": Utils.to_timestamp(self._expires_at),
+            "iat": self._issued_at_timestamp,
+            "exp": self._expires_at_timestamp,
             "ada": self._additional_data,
             "iss": self.issuer,
             "sub": self.subject
@@ -98,6 +105,13 @@ class JwtBodyContent(object):
                 result[key] = raw[key]
         return result
 
+    @staticmethod
+    def __timestamp(date):
+        # type: (Union[datetime, int]) -> int
+        if isinstance(date, datetime.datetime):
+            return Utils.to_timestamp(date)
+        return int(date)
+
     @property
     def subject_prefix(self):
         return self.__SUBJECT_PREFIX
@@ -114,20 +128,26 @@ class JwtBodyContent(object):
     @property
     def issued_at(self):
         """Jwt issued at"""
+        if self._issued_at is None:
+            self._issued_at = datetime.datetime.utcfromtimestamp(self._issued_at_timestamp)
         return self._issued_at
 
     @property
     def issued_at_timestamp(self):
-        return Utils.to_timestamp(self._issued_at)
+        """Jwt issued at as UTC timestamp"""
+        return self._issued_at_timestamp
 
     @property
     def expires_at(self):
         """When jwt expire."""
+        if self._expires_at is None:
+            self._expires_at = datetime.datetime.utcfromtimestamp(self._expires_at_timestamp)
         return self._expires_at
 
     @property
     def expires_at_timestamp(self):
-        return Utils.to_timestamp(self.expires_at)
+        """When jwt expire as UTC timestamp"""
+        return self._expires_at_timestamp
 
     @property
     def identity(self):
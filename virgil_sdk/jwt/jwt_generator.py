@@ -31,7 +31,7 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
-import datetime
+import time
 
 from virgil_sdk.utils import Utils
 from .jwt import Jwt
@@ -65,6 +65,8 @@ class JwtGenerator(object):
         self._lifetime = lifetime
         self._api_public_key_id = api_public_key_id
         self._access_token_signer = access_token_signer
+        self.__jwt_header = None
+        self.__encoded_jwt_header = None
 
     def generate_token(self, identity, data=None):
         # type: (str, Optional[dict]) -> Jwt
@@ -82,20 +84,56 @@ class JwtGenerator(object):
             raise ValueError("Token can't be generated without identity please set it up.")
         if data is not None and not isinstance(data, dict):
             raise TypeError("Wrong type of additional data, it must be dict")
-        issued_at = datetime.datetime.utcnow()
-        expires_at = datetime.datetime.utcfromtimestamp(Utils.to_timestamp(issued_at) + self._lifetime)
+        issued_at_timestamp = int(time.time())
         jwt_body = JwtBodyContent(
             self._app_id,
             identity,
-            issued_at,
-            expires_at,
+            issued_at_timestamp,
+            issued_at_timestamp + self._lifetime,
             data
         )
-        jwt_header = JwtHeaderContent(
-            self._access_token_signer.algorithm,
-            self._api_public_key_id
+        without_signature = self.__encoded_header + "." + Utils.b64_encode(
+            Utils.json_dumps(jwt_body.json, sort_keys=True).encode()
         )
-        unsigned_jwt = Jwt(jwt_header, jwt_body).unsigned_data
-        jwt_bytes = unsigned_jwt
-        signature = self._access_token_signer.generate_token_signature(bytearray(jwt_bytes), self._api_key)
-        return Jwt(jwt_header, jwt_body, bytearray(signature))
+        signature = self._access_token_signer.generate_token_signature(
+            bytearray(without_signature.encode()),
+            self._api_key
+        )
+        return Jwt._from_unsigned_data(self.__header, jwt_body, without_signature, bytearray(signature))
+
+    def generate_tokens(self, identities, data=None, executor=None):
+        # type: (List[str], Optional[dict], Optional[Executor]) -> List[Jwt]
+        """
+        Generates new JWTs for each of specified identities with the same additional data.
+
+        Args:
+            identities: Identities to generate with.
+            data: Dictionary with additional data which will be kept in jwt bodies.
+            executor: concurrent.futures.Executor used to sign tokens in parallel,
+                tokens are signed one by one in the calling thread if None.
+
+        Returns:
+            The list of Jwt in the order of identities.
+        """
+        if executor is None:
+            return [self.generate_token(identity, data) for identity in identities]
+        return list(executor.map(lambda identity: self.generate_token(identity, data), identities))
+
+    @property
+    def __header(self):
+        # type: () -> JwtHeaderContent
+        if self.__jwt_header is None:
+            self.__jwt_header = JwtHeaderContent(
+                self._access_token_signer.algorithm,
+                self._api_public_key_id
+            )
+        return self.__jwt_header
+
+    @property
+    def __encoded_header(self):
+        # type: () -> str
+        if self.__encoded_jwt_header is None:
+            self.__encoded_jwt_header = Utils.b64_encode(
+                Utils.json_dumps(self.__header.json, sort_keys=True).encode()
+            )
+        return self.__encoded_jwt_header
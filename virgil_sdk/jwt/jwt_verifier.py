@@ -31,21 +31,32 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import hashlib
+
+from virgil_sdk.utils import TtlCache
 from .jwt_header_content import JwtHeaderContent
 
 
 class JwtVerifier(object):
-    """The JwtVerifier provides verification for Jwt."""
+    """
+    The JwtVerifier provides verification for Jwt.
+
+    If verified_token_cache_size is set, up to that many verified tokens are
+    remembered by digest until their expiration, so verifying the same token
+    again skips signature verification.
+    """
 
     def __init__(
             self,
             access_token_signer,
             api_public_key,
-            api_public_key_id
+            api_public_key_id,
+            verified_token_cache_size=None  # type: Optional[int]
     ):
         self._access_token_signer = access_token_signer
         self._api_public_key = api_public_key
         self._api_public_key_id = api_public_key_id
+        self.__verified_tokens = TtlCache(verified_token_cache_size) if verified_token_cache_size else None
 
     def verify_token(self, jwt_token):
         # type: (Jwt) -> bool
@@ -58,13 +69,88 @@ class JwtVerifier(object):
         Returns:
             True if token is verified, otherwise False.
         """
-        if jwt_token._header_content.key_id != self._api_public_key_id or\
-           jwt_token._header_content.algorithm != self._access_token_signer.algorithm or\
-           jwt_token._header_content.access_token_type != JwtHeaderContent.ACCESS_TOKEN_TYPE or\
-           jwt_token._header_content.content_type != JwtHeaderContent.CONTENT_TYPE:
+        if self.__verified_tokens is None:
+            return self.__verify_token(jwt_token)
+        token_digest = hashlib.sha256(
+            memoryview(jwt_token.unsigned_data).tobytes() + b"." + memoryview(jwt_token.signature_data).tobytes()
+        ).digest()
+        if self.__verified_tokens.get(token_digest):
+            return True
+        if not self.__verify_token(jwt_token):
+            return False
+        self.__verified_tokens.put(token_digest, True, expires_at=jwt_token.peek_expiry())
+        return True
+
+    def verify_tokens(self, jwt_tokens, executor=None):
+        # type: (List[Jwt], Optional[Executor]) -> List[bool]
+        """
+        To verify specified tokens.
+
+        Tokens with unexpected or malformed header are rejected without signature
+        verification, repeated tokens are verified once. A token that fails to
+        verify with an error is reported as not verified, the rest of the batch
+        is still verified.
+
+        Args:
+            jwt_tokens: The list of Jwt to be verified.
+            executor: concurrent.futures.Executor used to verify signatures in parallel,
+                tokens are verified one by one in the calling thread if None.
+
+        Returns:
+            The list of verification results in the order of jwt_tokens.
+        """
+        results = dict()
+        unique_tokens = dict()
+        for jwt_token in jwt_tokens:
+            token_string = jwt_token.to_string()
+            if token_string in results or token_string in unique_tokens:
+                continue
+            try:
+                has_valid_header = self.__has_valid_header(jwt_token)
+            except Exception:
+                has_valid_header = False
+            if has_valid_header:
+                unique_tokens[token_string] = jwt_token
+            else:
+                results[token_string] = False
+        if executor is None:
+            verified = map(self.__try_verify_token, unique_tokens.values())
+        else:
+            verified = executor.map(self.__try_verify_token, unique_tokens.values())
+        results.update(zip(unique_tokens.keys(), verified))
+        return [results[jwt_token.to_string()] for jwt_token in jwt_tokens]
+
+    def __try_verify_token(self, jwt_token):
+        # type: (Jwt) -> bool
+        try:
+            return self.verify_token(jwt_token)
+        except Exception:
+            return False
+
+    def __has_valid_header(self, jwt_token):
+        # type: (Jwt) -> bool
+        header_content = jwt_token.header_content
+        return header_content.key_id == self._api_public_key_id and\
+            header_content.algorithm == self._access_token_signer.algorithm and\
+            header_content.access_token_type == JwtHeaderContent.ACCESS_TOKEN_TYPE and\
+            header_content.content_type == JwtHeaderContent.CONTENT_TYPE
+
+    def __verify_token(self, jwt_token):
+        # type: (Jwt) -> bool
+        if not self.__has_valid_header(jwt_token):
             return False
         return self._access_token_signer.verify_token_signature(
             bytearray(jwt_token.signature_data),
             bytearray(jwt_token.unsigned_data),
             self._api_public_key
         )
+
+    @property
+    def verified_token_cache(self):
+        """
+        Verified tokens by digest.
+
+        Returns:
+            TtlCache of verified tokens or None if caching is disabled.
+        """
+        return self.__verified_tokens
@@ -31,6 +31,8 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import threading
+import time
 from functools import partial
 
 from virgil_sdk.jwt import Jwt
@@ -41,6 +43,12 @@ class CachingCallbackProvider(AccessTokenProvider):
     """
     The CachingCallbackProvider class provides an opportunity to get cached access token
     or renew it using callback mechanism.
+
+    Only one caller renews the token at a time. Concurrent callers get the cached
+    token while it is still valid, or wait for the renewal otherwise. If
+    refresh_ahead is set, the token is renewed once that fraction of its
+    lifetime has passed instead of after expiration. Tokens are treated as
+    expired clock_skew seconds before their expiration time.
     """
 
     TOKEN_TTL = 5  # 5 seconds
@@ -49,11 +57,22 @@ class CachingCallbackProvider(AccessTokenProvider):
         self,
         renew_jwt_callback,  # type: function
         token_ttl=TOKEN_TTL,  # type: int
-        initial_token=None  # type Jwt
+        initial_token=None,  # type Jwt
+        refresh_ahead=None,  # type: Optional[float]
+        clock_skew=0  # type: int
     ):
+        if refresh_ahead is not None and not 0 < refresh_ahead <= 1:
+            raise ValueError("refresh_ahead must be a fraction of token lifetime in (0, 1]")
         self._token_ttl = token_ttl
         self.__renew_jwt_callback = partial(renew_jwt_callback, token_ttl=token_ttl)
         self.__access_token = initial_token
+        self.__refresh_ahead = refresh_ahead
+        self.__clock_skew = clock_skew
+        self.__condition = threading.Condition(threading.Lock())
+        self.__renewing = False
+        self.__generation = 0
+        self.__renewals = 0
+        self.__waits = 0
 
     def get_token(self, token_context):
         # type: (TokenContext) -> Jwt
@@ -66,8 +85,62 @@ class CachingCallbackProvider(AccessTokenProvider):
         Returns:
             Instance of access token.
         """
-        if self.__access_token:
-            if not self.__access_token.is_expired() and not token_context.force_reload:
-                return self.__access_token
-        self.__access_token = Jwt.from_string(self.__renew_jwt_callback(token_context))
-        return self.__access_token
+        force_reload = token_context.force_reload
+        with self.__condition:
+            while True:
+                access_token = self.__access_token
+                is_valid = not force_reload and access_token is not None and\
+                    not access_token.is_expired(clock_skew=self.__clock_skew)
+                if is_valid and not self.__should_refresh(access_token):
+                    return access_token
+                if not self.__renewing:
+                    self.__renewing = True
+                    break
+                if is_valid:
+                    return access_token
+                self.__waits += 1
+                generation = self.__generation
+                while self.__renewing and self.__generation == generation:
+                    self.__condition.wait()
+                if self.__generation != generation:
+                    return self.__access_token
+
+        try:
+            access_token = Jwt.from_string(self.__renew_jwt_callback(token_context))
+            # reject malformed tokens before caching, parsing is lazy otherwise
+            access_token.peek_expiry()
+        except Exception:
+            with self.__condition:
+                self.__renewing = False
+                self.__condition.notify_all()
+            raise
+
+        with self.__condition:
+            self.__access_token = access_token
+            self.__renewing = False
+            self.__generation += 1
+            self.__renewals += 1
+            self.__condition.notify_all()
+        return access_token
+
+    def __should_refresh(self, access_token):
+        # type: (Jwt) -> bool
+        if self.__refresh_ahead is None:
+            return False
+        body_content = access_token.body_content
+        lifetime = body_content.expires_at_timestamp - body_content.issued_at_timestamp
+        return time.time() >= body_content.issued_at_timestamp + lifetime * self.__refresh_ahead
+
+    @property
+    def renewals(self):
+        """
+        Number of tokens obtained from renew callback.
+        """
+        return self.__renewals
+
+    @property
+    def waits(self):
+        """
+        Number of callers that waited for another caller renewing the token.
+        """
+        return self.__waits
@@ -57,9 +57,11 @@ class CallbackJwtProvider(AccessTokenProvider):
             Instance of access token.
 
         Raises:
-            ValueError: Token context empty.
+            ValueError: Token context empty or wrong jwt format.
         """
         if token_context:
-            return Jwt.from_string(self.__get_token_callback(token_context))
+            access_token = Jwt.from_string(self.__get_token_callback(token_context))
+            access_token.peek_expiry()
+            return access_token
         else:
             raise ValueError("Empty token context")
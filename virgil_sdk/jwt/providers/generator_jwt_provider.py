@@ -31,26 +31,44 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import threading
+import time
 from functools import partial
 
 from virgil_sdk.jwt import Jwt
 from virgil_sdk.jwt.abstractions.access_token_provider import AccessTokenProvider
+from virgil_sdk.utils import TtlCache
 
 
 class GeneratorJwtProvider(AccessTokenProvider):
     """
     Implementation of AccessTokenProvider which provides generated JWTs
+
+    If token_cache_size is set, generated tokens are cached per identity and
+    reused until refresh_margin seconds before their expiration. With
+    background_refresh a token entering the refresh margin is still returned
+    while its replacement is generated in a background thread.
     """
 
+    REFRESH_MARGIN = 30  # 30 seconds
+
     def __init__(
         self,
         jwt_generator,  # type: JwtGenerator
         default_identity,  # type: str
-        additional_data=None  # type: Union[None, dict]
+        additional_data=None,  # type: Union[None, dict]
+        token_cache_size=None,  # type: Optional[int]
+        refresh_margin=REFRESH_MARGIN,  # type: int
+        background_refresh=False  # type: bool
     ):
         self.jwt_generator = jwt_generator
         self.default_identity = default_identity
         self.additional_data = additional_data
+        self.__refresh_margin = refresh_margin
+        self.__background_refresh = background_refresh
+        self.__token_cache = TtlCache(token_cache_size) if token_cache_size else None
+        self.__refreshing = set()
+        self.__refreshing_lock = threading.Lock()
 
     def get_token(self, token_context):
         # type: (TokenContext) -> Jwt
@@ -67,5 +85,55 @@ class GeneratorJwtProvider(AccessTokenProvider):
             identity = token_context.identity
         else:
             identity = self.default_identity
+        if self.__token_cache is None:
+            return self.jwt_generator.generate_token(identity, self.additional_data)
+
+        if not token_context.force_reload:
+            token = self.__token_cache.get(identity)
+            if token is not None:
+                if time.time() < self.__refresh_at(token):
+                    return token
+                if self.__background_refresh:
+                    self.__refresh_in_background(identity)
+                    return token
+        return self.__generate_token(identity)
+
+    def __generate_token(self, identity):
+        # type: (str) -> Jwt
         token = self.jwt_generator.generate_token(identity, self.additional_data)
+        self.__token_cache.put(identity, token, expires_at=token.body_content.expires_at_timestamp)
         return token
+
+    def __refresh_at(self, token):
+        # type: (Jwt) -> float
+        body_content = token.body_content
+        lifetime = body_content.expires_at_timestamp - body_content.issued_at_timestamp
+        return body_content.expires_at_timestamp - min(self.__refresh_margin, lifetime / 2.0)
+
+    def __refresh_in_background(self, identity):
+        # type: (str) -> None
+        with self.__refreshing_lock:
+            if identity in self.__refreshing:
+                return
+            self.__refreshing.add(identity)
+        thread = threading.Thread(target=self.__refresh, args=(identity,))
+        thread.daemon = True
+        thread.start()
+
+    def __refresh(self, identity):
+        # type: (str) -> None
+        try:
+            self.__generate_token(identity)
+        finally:
+            with self.__refreshing_lock:
+                self.__refreshing.discard(identity)
+
+    @property
+    def token_cache(self):
+        """
+        Cached tokens by identity.
+
+        Returns:
+            TtlCache of generated tokens or None if caching is disabled.
+        """
+        return self.__token_cache
@@ -0,0 +1,117 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from functools import partial
+
+from virgil_sdk.jwt import Jwt
+from virgil_sdk.jwt.abstractions.access_token_provider import AccessTokenProvider
+from virgil_sdk.utils import TtlCache
+
+
+class KeyedCachingCallbackProvider(AccessTokenProvider):
+    """
+    The KeyedCachingCallbackProvider class caches access tokens per identity,
+    operation and service of TokenContext and renews them using callback mechanism.
+
+    Each token is kept until clock_skew seconds before its own expiration time,
+    the least recently used tokens are dropped when capacity is reached.
+    """
+
+    TOKEN_TTL = 5  # 5 seconds
+    CAPACITY = 10000
+
+    def __init__(
+        self,
+        renew_jwt_callback,  # type: function
+        token_ttl=TOKEN_TTL,  # type: int
+        capacity=CAPACITY,  # type: int
+        clock_skew=0  # type: int
+    ):
+        self._token_ttl = token_ttl
+        self.__renew_jwt_callback = partial(renew_jwt_callback, token_ttl=token_ttl)
+        self.__tokens = TtlCache(capacity)
+        self.__clock_skew = clock_skew
+
+    def get_token(self, token_context):
+        # type: (TokenContext) -> Jwt
+        """
+        Gets access token for context from cache or renew by provided callback if expired.
+
+        Args:
+            token_context: Access token context.
+
+        Returns:
+            Instance of access token.
+        """
+        key = (token_context.identity, token_context.operation, token_context.service)
+        if not token_context.force_reload:
+            access_token = self.__tokens.get(key)
+            if access_token is not None and not access_token.is_expired(clock_skew=self.__clock_skew):
+                return access_token
+        access_token = Jwt.from_string(self.__renew_jwt_callback(token_context))
+        self.__tokens.put(key, access_token, expires_at=access_token.peek_expiry() - self.__clock_skew)
+        return access_token
+
+    def clear(self):
+        """
+        Drops all cached tokens.
+        """
+        self.__tokens.clear()
+
+    @property
+    def hits(self):
+        """
+        Number of tokens served from the cache.
+        """
+        return self.__tokens.hits
+
+    @property
+    def misses(self):
+        """
+        Number of lookups missed the cache.
+        """
+        return self.__tokens.misses
+
+    @property
+    def evictions(self):
+        """
+        Number of tokens dropped because of capacity or expiration.
+        """
+        return self.__tokens.evictions
+
+    @property
+    def size(self):
+        """
+        Number of cached tokens.
+        """
+        return len(self.__tokens)
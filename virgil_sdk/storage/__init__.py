@@ -34,3 +34,6 @@
 from .private_key_exporter import PrivateKeyExporter
 from .private_key_storage import PrivateKeyStorage
 from .key_storage import KeyStorage
+from .sharded_key_storage import ShardedKeyStorage
+from .sqlite_key_storage import SqliteKeyStorage
+from .key_result import KeyResult
@@ -36,6 +36,8 @@ from virgil_sdk.utils import Utils
 
 class KeyEntry(object):
 
+    FORMAT_VERSION = 2
+
     def __init__(
         self,
         name,  # type: str
@@ -48,11 +50,44 @@ class KeyEntry(object):
 
     def to_json(self):
         return Utils.json_dumps({
+            "version": self.FORMAT_VERSION,
             "name": self.__name,
-            "value": list(self.__value),
+            "value": Utils.b64encode(self.__value),
             "meta": self.__meta
         })
 
+    @classmethod
+    def decode(cls, data):
+        # type: (Union[str, bytes, bytearray, memoryview, dict]) -> dict
+        """
+        Reads a key entry stored in any supported format.
+
+        Version 2 entries keep the value as a base64 string, legacy entries
+        without a version keep it as a list of ints.
+
+        Args:
+            data: Entry json or its parsed dict.
+
+        Returns:
+            Dict with name, value as bytearray and meta of the entry.
+        """
+        if not isinstance(data, dict):
+            data = Utils.json_loads(data)
+        version = data.get("version", 1)
+        if version == 1:
+            value = bytearray(data["value"])
+        elif version == cls.FORMAT_VERSION:
+            value = bytearray(Utils.b64decode(data["value"]))
+        else:
+            raise ValueError("Unsupported key entry format version {}".format(version))
+        return {"name": data["name"], "value": value, "meta": data.get("meta")}
+
+    @classmethod
+    def is_legacy(cls, data):
+        # type: (dict) -> bool
+        """Checks whether a parsed entry uses an older format than the current one."""
+        return data.get("version", 1) < cls.FORMAT_VERSION
+
     @property
     def name(self):
         """Key alias."""
@@ -34,6 +34,9 @@
 import hashlib
 import os
 import platform
+import re
+
+from virgil_sdk.storage.key_entry import KeyEntry
 from virgil_sdk.utils import Utils
 
 
@@ -41,12 +44,24 @@ class KeyStorage(object):
     """The provides protected storage using the user
     credentials to encrypt or decrypt keys."""
 
-    def __init__(self):
-        # type: (...) -> None
-        self._key_storage_path = None
+    def __init__(self, storage_path=None):
+        # type: (Optional[str]) -> None
+        """
+        Args:
+            storage_path: Folder keys are stored in. Defaults to ~/.virgil.
+        """
+        self._key_storage_path = storage_path
+
+    @property
+    def storage_path(self):
+        # type: () -> str
+        """Folder keys are stored in."""
+        return self.__key_storage_path
 
     @property
     def __key_storage_path(self):
+        if self._key_storage_path:
+            return self._key_storage_path
         home = None
         if platform.system() == "Windows":
             home = os.getenv("HOMEDRIVE") + os.getenv("HOMEPATH")
@@ -98,7 +113,7 @@ class KeyStorage(object):
         key_file = open(key_file_path, "rb")
         key_file_data = key_file.read()
         key_file.close()
-        return Utils.json_loads(bytes(key_file_data).decode())
+        return KeyEntry.decode(key_file_data)
 
     def delete(self, name):
         # type: (str) -> None
@@ -117,6 +132,92 @@ class KeyStorage(object):
             raise ValueError("Can't delete key {}, file not found in storage".format(name))
         os.remove(key_file_path)
 
+    def exists(self, name):
+        # type: (str) -> bool
+        """Checks whether a key with the given alias is stored."""
+        return os.path.exists(os.path.join(self.__key_storage_path, self.__secure_key_file_name(name)))
+
+    def store_many(self, key_entries):
+        # type: (List[KeyEntry]) -> None
+        """Stores key entries, either all of them or none.
+
+        Entries stored before a failure are deleted again.
+
+        Args:
+            key_entries: Key entries for store.
+
+        Raises:
+            ValueError: if any key with the same name is already stored.
+        """
+        stored = []
+        try:
+            for key_entry in key_entries:
+                self.store(key_entry)
+                stored.append(key_entry.name)
+        except Exception:
+            for name in stored:
+                self.delete(name)
+            raise
+
+    def delete_many(self, names):
+        # type: (List[str]) -> None
+        """Deletes keys, either all of them or none.
+
+        Args:
+            names: Key names in storage.
+
+        Raises:
+            ValueError: if any key is not found in storage.
+        """
+        for name in names:
+            if not name:
+                raise ValueError("No alias provided for key deleting.")
+            if not self.exists(name):
+                raise ValueError("Can't delete key {}, file not found in storage".format(name))
+        for name in names:
+            self.delete(name)
+
+    def reencode(self):
+        # type: () -> int
+        """
+        Rewrites key files stored in a legacy format using the current KeyEntry format.
+
+        Walks the storage folder recursively, so fan-out layouts are covered too.
+        Each file is replaced atomically.
+
+        Returns:
+            Count of rewritten key files.
+        """
+        reencoded = 0
+        for folder, _, file_names in os.walk(self.__key_storage_path):
+            for file_name in file_names:
+                if not _KEY_FILE_NAME.match(file_name):
+                    continue
+                key_file_path = os.path.join(folder, file_name)
+                with open(key_file_path, "rb") as key_file:
+                    raw_key_entry = Utils.json_loads(key_file.read())
+                if not KeyEntry.is_legacy(raw_key_entry):
+                    continue
+                key_entry = KeyEntry.decode(raw_key_entry)
+                temp_path = key_file_path + ".tmp"
+                with open(temp_path, "wb") as key_file:
+                    key_file.write(KeyEntry(key_entry["name"], key_entry["value"], key_entry["meta"]).to_json().encode())
+                _replace(temp_path, key_file_path)
+                reencoded += 1
+        return reencoded
+
     @staticmethod
     def __secure_key_file_name(key_name):
         return hashlib.sha384(key_name.encode("utf-8")).hexdigest()
+
+
+_KEY_FILE_NAME = re.compile(r"^[0-9a-f]{96}$")
+
+
+def _replace(source, destination):
+    if hasattr(os, "replace"):
+        os.replace(source, destination)
+    else:
+        if os.path.exists(destination) and os.name == "nt":
+            os.remove(destination)
+        os.rename(source, destination)
@@ -33,13 +33,34 @@
 # POSSIBILITY OF SUCH DAMAGE.
 from virgil_sdk.storage.key_storage import KeyStorage
 from virgil_sdk.storage.key_entry import KeyEntry
+from virgil_sdk.storage.key_result import KeyResult
+from virgil_sdk.utils import TtlCache
 
 
 class PrivateKeyStorage(object):
 
-    def __init__(self, key_exporter, key_storage=KeyStorage()):
+    def __init__(
+        self,
+        key_exporter,
+        key_storage=KeyStorage(),
+        cache_size=None,  # type: Optional[int]
+        cache_ttl=None  # type: Optional[float]
+    ):
+        """
+        Args:
+            key_exporter: Exports and imports private keys.
+            key_storage: Storage of exported keys.
+            cache_size: Count of imported keys kept in memory, the cache is disabled if not set.
+            cache_ttl: Seconds an imported key is kept in memory, unlimited if not set.
+
+        Cached keys are the same objects handed out by load, so evicted keys are
+        not wiped, they are released once callers drop their references too.
+        """
         self.key_storage = key_storage
         self.__key_exporter = key_exporter
+        self.__key_cache = None
+        if cache_size:
+            self.__key_cache = TtlCache(cache_size, cache_ttl)
 
     def store(self, private_key, name, meta=None):
         # type: (Any, Union[bytes, bytearray], dict) -> None
@@ -58,6 +79,7 @@ class PrivateKeyStorage(object):
         exported_key_data = self.__key_exporter.export_private_key(private_key)
         key_entry = KeyEntry(name, exported_key_data, meta)
         self.key_storage.store(key_entry)
+        self.evict(name)
 
     def load(self, name):
         # type: (str) -> Tuple(Any, dict)
@@ -73,8 +95,14 @@ class PrivateKeyStorage(object):
         """
         if not name:
             ValueError("No alias provided for key load.")
+        if self.__key_cache is not None:
+            cached = self.__key_cache.get(name)
+            if cached is not None:
+                return cached
         key_entry = self.key_storage.load(name)
         private_key = self.__key_exporter.import_private_key(key_entry["value"]).private_key
+        if self.__key_cache is not None:
+            self.__key_cache.put(name, (private_key, key_entry["meta"]))
         return private_key, key_entry["meta"]
 
     def delete(self, name):
@@ -87,4 +115,139 @@ class PrivateKeyStorage(object):
         """
         if not name:
             ValueError("No alias provided for key delete.")
+        self.evict(name)
         self.key_storage.delete(name)
+
+    def store_many(self, keys, executor=None):
+        # type: (List[Tuple], Optional[Executor]) -> List[KeyResult]
+        """
+        Stores keys in bulk.
+
+        Keys are exported first, in parallel if an executor is given, and then
+        written to the key storage as a single batch. If the batch fails, keys
+        are written one by one to report which of them failed.
+
+        Args:
+            keys: Tuples of private key, name and optionally meta data.
+            executor: concurrent.futures.Executor used to export keys in parallel,
+                keys are exported one by one in the calling thread if None.
+
+        Returns:
+            The list of KeyResult in the order of keys.
+        """
+        def export_key(key):
+            private_key, name = key[0], key[1]
+            try:
+                if not name:
+                    raise ValueError("No name provided for store.")
+                if not private_key:
+                    raise ValueError("No key provided for store.")
+                meta = key[2] if len(key) > 2 else None
+                return KeyEntry(name, self.__key_exporter.export_private_key(private_key), meta), None
+            except Exception as e:
+                return None, e
+
+        exported = self.__map(export_key, keys, executor)
+        key_entries = [key_entry for key_entry, _ in exported if key_entry is not None]
+        errors = {}
+        try:
+            self.key_storage.store_many(key_entries)
+        except Exception:
+            for key_entry in key_entries:
+                try:
+                    self.key_storage.store(key_entry)
+                except Exception as e:
+                    errors[id(key_entry)] = e
+        results = []
+        for key, (key_entry, error) in zip(keys, exported):
+            if key_entry is not None:
+                error = errors.get(id(key_entry))
+                self.evict(key_entry.name)
+            results.append(KeyResult(key[1], None, None, error))
+        return results
+
+    def load_many(self, names, executor=None):
+        # type: (List[str], Optional[Executor]) -> List[KeyResult]
+        """
+        Loads keys in bulk.
+
+        Args:
+            names: Key names in storage.
+            executor: concurrent.futures.Executor used to read and import keys in parallel,
+                keys are loaded one by one in the calling thread if None.
+
+        Returns:
+            The list of KeyResult with loaded keys and meta data in the order of names.
+        """
+        def load_key(name):
+            try:
+                private_key, meta = self.load(name)
+                return KeyResult(name, private_key, meta, None)
+            except Exception as e:
+                return KeyResult(name, None, None, e)
+
+        return self.__map(load_key, names, executor)
+
+    def delete_many(self, names):
+        # type: (List[str]) -> List[KeyResult]
+        """
+        Deletes keys in bulk.
+
+        Keys are deleted from the key storage as a single batch. If the batch
+        fails, keys are deleted one by one to report which of them failed.
+
+        Args:
+            names: Key names in storage.
+
+        Returns:
+            The list of KeyResult in the order of names.
+        """
+        for name in names:
+            self.evict(name)
+        try:
+            self.key_storage.delete_many(names)
+            return [KeyResult(name, None, None, None) for name in names]
+        except Exception:
+            pass
+        results = []
+        for name in names:
+            try:
+                if not name:
+                    raise ValueError("No alias provided for key delete.")
+                self.key_storage.delete(name)
+                results.append(KeyResult(name, None, None, None))
+            except Exception as e:
+                results.append(KeyResult(name, None, None, e))
+        return results
+
+    def evict(self, name):
+        # type: (str) -> None
+        """
+        Drops the imported key from the cache, the next load imports it again.
+
+        Args:
+            name: Key alias in storage.
+        """
+        if self.__key_cache is not None:
+            self.__key_cache.pop(name)
+
+    def clear_cache(self):
+        # type: () -> None
+        """Drops all imported keys from the cache."""
+        if self.__key_cache is not None:
+            self.__key_cache.clear()
+
+    @property
+    def key_cache(self):
+        # type: () -> Optional[TtlCache]
+        """
+        Returns:
+            TtlCache of imported keys or None if caching is disabled.
+        """
+        return self.__key_cache
+
+    @staticmethod
+    def __map(function, items, executor):
+        if executor is None:
+            return [function(item) for item in items]
+        return list(executor.map(function, items))
@@ -0,0 +1,338 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import errno
+import hashlib
+import os
+import threading
+
+from virgil_sdk.storage.key_entry import KeyEntry
+from virgil_sdk.storage.key_storage import KeyStorage, _replace
+from virgil_sdk.utils import Utils
+
+
+class ShardedKeyStorage(KeyStorage):
+    """
+    Key storage for large key counts.
+
+    Key files are spread over fan-out folders named after the leading
+    characters of the file name hash, so no single folder grows huge.
+    Stored names are tracked in an append-only index journal, which serves
+    listing and existence checks without touching the key folders.
+    """
+
+    INDEX_FILE_NAME = "index.journal"
+
+    __ADDED = b"+"
+    __DELETED = b"-"
+
+    def __init__(self, storage_path=None, fan_out_levels=2, fan_out_width=2):
+        # type: (Optional[str], int, int) -> None
+        """
+        Args:
+            storage_path: Folder keys are stored in. Defaults to ~/.virgil.
+            fan_out_levels: Count of nested folders above each key file.
+            fan_out_width: Count of hash characters in each folder name.
+        """
+        super(ShardedKeyStorage, self).__init__(storage_path)
+        if fan_out_levels < 1 or fan_out_width < 1 or fan_out_levels * fan_out_width > 96:
+            raise ValueError("Invalid fan out layout")
+        self.__fan_out_levels = fan_out_levels
+        self.__fan_out_width = fan_out_width
+        self.__lock = threading.RLock()
+        self.__names = set()
+        self.__index_offset = 0
+        self.__index_identity = None
+        self.__root_created = False
+
+    def store(self, key_entry):
+        # type: (KeyEntry) -> None
+        """Stores the key and data to the given alias.
+
+        Args:
+            key_entry: Given key entry for store.
+
+        Raises:
+            ValueError: if a key with the same name is already stored.
+        """
+        if not key_entry:
+            raise ValueError("No key entry for store.")
+        self.__write_key_file(self.__key_file_path(key_entry.name), key_entry.name, key_entry.to_json().encode())
+        self.__append_index(self.__ADDED, key_entry.name)
+
+    def load(self, name):
+        # type: (str) -> dict
+        """Loads the key associated with the given alias.
+
+        Args:
+            name: Key name in storage.
+
+        Returns:
+            The requested key.
+
+        Raises:
+            ValueError: if the key is not found in storage.
+        """
+        if not name:
+            raise ValueError("No alias provided for load key.")
+        try:
+            with open(self.__key_file_path(name), "rb") as key_file:
+                key_file_data = key_file.read()
+        except (IOError, OSError) as error:
+            if error.errno == errno.ENOENT:
+                raise ValueError("Can't load key {}, not found in storage".format(name))
+            raise
+        return KeyEntry.decode(key_file_data)
+
+    def delete(self, name):
+        # type: (str) -> None
+        """Deletes the key associated with the given alias.
+
+        Args:
+            name: Key name in storage.
+
+        Raises:
+            ValueError: if the key is not found in storage.
+        """
+        if not name:
+            raise ValueError("No alias provided for key deleting.")
+        try:
+            os.remove(self.__key_file_path(name))
+        except OSError as error:
+            if error.errno == errno.ENOENT:
+                raise ValueError("Can't delete key {}, file not found in storage".format(name))
+            raise
+        self.__append_index(self.__DELETED, name)
+
+    def exists(self, name):
+        # type: (str) -> bool
+        """Checks whether a key with the given alias is stored, using the index."""
+        with self.__lock:
+            self.__refresh_index()
+            return name in self.__names
+
+    def __contains__(self, name):
+        return self.exists(name)
+
+    def names(self):
+        # type: () -> List[str]
+        """Names of all stored keys, read from the index."""
+        with self.__lock:
+            self.__refresh_index()
+            return list(self.__names)
+
+    def __len__(self):
+        with self.__lock:
+            self.__refresh_index()
+            return len(self.__names)
+
+    def compact_index(self):
+        # type: () -> None
+        """
+        Rewrites the index journal keeping a single record per stored key.
+
+        Must not run while another process writes to the same storage.
+        """
+        with self.__lock:
+            self.__refresh_index()
+            self.__write_index(self.__names)
+
+    def rebuild_index(self):
+        # type: () -> int
+        """
+        Rebuilds the index journal from key files found in the fan-out folders.
+
+        Returns:
+            Count of indexed keys.
+        """
+        names = set()
+        root = self.storage_path
+        for folder, _, file_names in os.walk(root):
+            if folder == root:
+                continue
+            for file_name in file_names:
+                with open(os.path.join(folder, file_name), "rb") as key_file:
+                    names.add(Utils.json_loads(key_file.read())["name"])
+        with self.__lock:
+            self.__write_index(names)
+        return len(names)
+
+    def migrate(self, source_storage_path=None, remove_source=False):
+        # type: (Optional[str], bool) -> int
+        """
+        Moves keys from the flat one-folder layout used by KeyStorage into this storage.
+
+        Key files are copied as is. Keys already present here are skipped,
+        their source files are removed only if both files are identical.
+
+        Args:
+            source_storage_path: Folder of the flat storage. Defaults to ~/.virgil.
+            remove_source: Removes migrated files from the source folder.
+
+        Returns:
+            Count of migrated keys.
+        """
+        source_path = KeyStorage(source_storage_path).storage_path
+        if not os.path.isdir(source_path):
+            return 0
+        migrated = 0
+        for file_name in os.listdir(source_path):
+            file_path = os.path.join(source_path, file_name)
+            if len(file_name) != 96 or not os.path.isfile(file_path):
+                continue
+            with open(file_path, "rb") as key_file:
+                key_file_data = key_file.read()
+            name = Utils.json_loads(key_file_data)["name"]
+            if hashlib.sha384(name.encode("utf-8")).hexdigest() != file_name:
+                continue
+            key_file_path = self.__key_file_path(name)
+            try:
+                self.__write_key_file(key_file_path, name, key_file_data)
+            except ValueError:
+                with open(key_file_path, "rb") as key_file:
+                    copied = key_file.read() == key_file_data
+            else:
+                self.__append_index(self.__ADDED, name)
+                migrated += 1
+                copied = True
+            if remove_source and copied:
+                os.remove(file_path)
+        return migrated
+
+    def __key_file_path(self, name):
+        file_name = hashlib.sha384(name.encode("utf-8")).hexdigest()
+        width = self.__fan_out_width
+        folders = [file_name[level * width:(level + 1) * width] for level in range(self.__fan_out_levels)]
+        return os.path.join(self.storage_path, *(folders + [file_name]))
+
+    def __write_key_file(self, key_file_path, name, data):
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(key_file_path, flags, 0o600)
+        except OSError as error:
+            if error.errno == errno.EEXIST:
+                raise ValueError("Can't store key {}, key with the same name already stored".format(name))
+            if error.errno != errno.ENOENT:
+                raise
+            self.__make_dirs(os.path.dirname(key_file_path))
+            fd = os.open(key_file_path, flags, 0o600)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        except Exception:
+            os.close(fd)
+            os.remove(key_file_path)
+            raise
+        os.close(fd)
+
+    @staticmethod
+    def __make_dirs(path):
+        try:
+            os.makedirs(path)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+
+    def __ensure_root(self):
+        if not self.__root_created:
+            self.__make_dirs(self.storage_path)
+            self.__root_created = True
+
+    @property
+    def __index_path(self):
+        return os.path.join(self.storage_path, self.INDEX_FILE_NAME)
+
+    @staticmethod
+    def __index_record(operation, name):
+        return operation + Utils.json_dumps(name).encode("utf-8") + b"\n"
+
+    def __append_index(self, operation, name):
+        self.__ensure_root()
+        record = self.__index_record(operation, name)
+        with self.__lock:
+            fd = os.open(self.__index_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o600)
+            try:
+                os.write(fd, record)
+            finally:
+                os.close(fd)
+
+    def __write_index(self, names):
+        self.__ensure_root()
+        temp_path = self.__index_path + ".tmp"
+        with open(temp_path, "wb") as index_file:
+            for name in names:
+                index_file.write(self.__index_record(self.__ADDED, name))
+            index_file.flush()
+            os.fsync(index_file.fileno())
+            offset = index_file.tell()
+        _replace(temp_path, self.__index_path)
+        self.__names = set(names)
+        self.__index_offset = offset
+        self.__index_identity = self.__file_identity(os.stat(self.__index_path))
+
+    def __refresh_index(self):
+        # Applies records appended since the last read, including ones written by other processes.
+        try:
+            index_file = open(self.__index_path, "rb")
+        except (IOError, OSError) as error:
+            if error.errno != errno.ENOENT:
+                raise
+            self.__names = set()
+            self.__index_offset = 0
+            self.__index_identity = None
+            return
+        with index_file:
+            identity = self.__file_identity(os.fstat(index_file.fileno()))
+            index_file.seek(0, os.SEEK_END)
+            if identity != self.__index_identity or index_file.tell() < self.__index_offset:
+                # the journal was replaced by compaction in another instance, replay it from the start
+                self.__names = set()
+                self.__index_offset = 0
+                self.__index_identity = identity
+            index_file.seek(self.__index_offset)
+            data = index_file.read()
+        complete = data.rfind(b"\n") + 1
+        for record in data[:complete].splitlines():
+            if not record:
+                continue
+            name = Utils.json_loads(record[1:])
+            if record[:1] == self.__ADDED:
+                self.__names.add(name)
+            else:
+                self.__names.discard(name)
+        self.__index_offset += complete
+
+    @staticmethod
+    def __file_identity(stat_result):
+        return stat_result.st_dev, stat_result.st_ino
@@ -0,0 +1,280 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import errno
+import os
+import sqlite3
+import sys
+import threading
+
+from virgil_sdk.storage.key_storage import KeyStorage
+from virgil_sdk.utils import Utils
+
+if sys.version_info[0] == 2:
+    from __builtin__ import unichr
+else:
+    unichr = chr
+
+
+class SqliteKeyStorage(KeyStorage):
+    """
+    Key storage backed by an embedded SQLite database.
+
+    Key values are kept as binary blobs and meta data as json. The database
+    runs in WAL mode, so readers in other threads and processes on the same
+    host are not blocked by a writer. Each thread uses its own connection.
+    """
+
+    DATABASE_FILE_NAME = "keys.sqlite3"
+
+    def __init__(self, storage_path=None, database_file=None, timeout=30.0):
+        # type: (Optional[str], Optional[str], float) -> None
+        """
+        Args:
+            storage_path: Folder the database is created in. Defaults to ~/.virgil.
+            database_file: Database file path, overrides storage_path.
+            timeout: Seconds to wait for a lock held by another writer.
+        """
+        super(SqliteKeyStorage, self).__init__(storage_path)
+        self.__database_file = database_file
+        self.__timeout = timeout
+        self.__local = threading.local()
+
+    @property
+    def database_file(self):
+        # type: () -> str
+        """Path of the database file."""
+        if not self.__database_file:
+            self.__database_file = os.path.join(self.storage_path, self.DATABASE_FILE_NAME)
+        return self.__database_file
+
+    def store(self, key_entry):
+        # type: (KeyEntry) -> None
+        """Stores the key and data to the given alias.
+
+        Args:
+            key_entry: Given key entry for store.
+
+        Raises:
+            ValueError: if a key with the same name is already stored.
+        """
+        if not key_entry:
+            raise ValueError("No key entry for store.")
+        self.store_many([key_entry])
+
+    def store_many(self, key_entries):
+        # type: (List[KeyEntry]) -> None
+        """Stores key entries in a single transaction, either all of them or none.
+
+        Args:
+            key_entries: Key entries for store.
+
+        Raises:
+            ValueError: if any key with the same name is already stored.
+        """
+        if any(not key_entry for key_entry in key_entries):
+            raise ValueError("No key entry for store.")
+        with self.__transaction() as connection:
+            for key_entry in key_entries:
+                try:
+                    connection.execute(
+                        "INSERT INTO keys (name, value, meta) VALUES (?, ?, ?)",
+                        (key_entry.name, sqlite3.Binary(bytes(key_entry.value)), Utils.json_dumps(key_entry.meta))
+                    )
+                except sqlite3.IntegrityError:
+                    raise ValueError(
+                        "Can't store key {}, key with the same name already stored".format(key_entry.name)
+                    )
+
+    def load(self, name):
+        # type: (str) -> dict
+        """Loads the key associated with the given alias.
+
+        Args:
+            name: Key name in storage.
+
+        Returns:
+            The requested key.
+
+        Raises:
+            ValueError: if the key is not found in storage.
+        """
+        if not name:
+            raise ValueError("No alias provided for load key.")
+        row = self.__connection.execute("SELECT value, meta FROM keys WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise ValueError("Can't load key {}, not found in storage".format(name))
+        return {"name": name, "value": bytearray(row[0]), "meta": Utils.json_loads(row[1])}
+
+    def delete(self, name):
+        # type: (str) -> None
+        """Deletes the key associated with the given alias.
+
+        Args:
+            name: Key name in storage.
+
+        Raises:
+            ValueError: if the key is not found in storage.
+        """
+        if not name:
+            raise ValueError("No alias provided for key deleting.")
+        self.delete_many([name])
+
+    def delete_many(self, names):
+        # type: (List[str]) -> None
+        """Deletes keys in a single transaction, either all of them or none.
+
+        Args:
+            names: Key names in storage.
+
+        Raises:
+            ValueError: if any key is not found in storage.
+        """
+        if any(not name for name in names):
+            raise ValueError("No alias provided for key deleting.")
+        with self.__transaction() as connection:
+            for name in names:
+                if connection.execute("DELETE FROM keys WHERE name = ?", (name,)).rowcount != 1:
+                    raise ValueError("Can't delete key {}, not found in storage".format(name))
+
+    def exists(self, name):
+        # type: (str) -> bool
+        """Checks whether a key with the given alias is stored."""
+        return self.__connection.execute("SELECT 1 FROM keys WHERE name = ?", (name,)).fetchone() is not None
+
+    def __contains__(self, name):
+        return self.exists(name)
+
+    def __len__(self):
+        return self.__connection.execute("SELECT COUNT(*) FROM keys").fetchone()[0]
+
+    def names(self, prefix=None, meta=None):
+        # type: (Optional[str], Optional[dict]) -> List[str]
+        """
+        Names of stored keys in sorted order.
+
+        Args:
+            prefix: Lists only names starting with the prefix.
+            meta: Lists only keys whose meta data contains all the given items.
+
+        Returns:
+            List of key names.
+        """
+        query = "SELECT name, meta FROM keys" if meta else "SELECT name FROM keys"
+        conditions = []
+        params = []
+        if prefix:
+            conditions.append("name >= ?")
+            params.append(prefix)
+            upper_bound = self.__prefix_upper_bound(prefix)
+            if upper_bound:
+                conditions.append("name < ?")
+                params.append(upper_bound)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        rows = self.__connection.execute(query + " ORDER BY name", params)
+        if not meta:
+            return [row[0] for row in rows]
+        names = []
+        for name, raw_meta in rows:
+            key_meta = Utils.json_loads(raw_meta) or {}
+            if all(item in key_meta and key_meta[item] == value for item, value in meta.items()):
+                names.append(name)
+        return names
+
+    def reencode(self):
+        # type: () -> int
+        """Values are stored as binary blobs already, there is nothing to rewrite."""
+        return 0
+
+    def close(self):
+        # type: () -> None
+        """Closes the database connection of the calling thread."""
+        connection = getattr(self.__local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.__local.connection = None
+
+    @staticmethod
+    def __prefix_upper_bound(prefix):
+        # smallest string greater than every string starting with the prefix
+        while prefix and ord(prefix[-1]) == 0x10ffff:
+            prefix = prefix[:-1]
+        if not prefix:
+            return None
+        return prefix[:-1] + unichr(ord(prefix[-1]) + 1)
+
+    @property
+    def __connection(self):
+        connection = getattr(self.__local, "connection", None)
+        if connection is None or self.__local.pid != os.getpid():
+            connection = self.__connect()
+            self.__local.connection = connection
+            self.__local.pid = os.getpid()
+        return connection
+
+    def __connect(self):
+        database_folder = os.path.dirname(self.database_file)
+        if database_folder:
+            try:
+                os.makedirs(database_folder)
+            except OSError as error:
+                if error.errno != errno.EEXIST:
+                    raise
+        connection = sqlite3.connect(self.database_file, timeout=self.__timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS keys (name TEXT PRIMARY KEY, value BLOB NOT NULL, meta TEXT)"
+        )
+        return connection
+
+    def __transaction(self):
+        return _Transaction(self.__connection)
+
+
+class _Transaction(object):
+
+    def __init__(self, connection):
+        self.__connection = connection
+
+    def __enter__(self):
+        self.__connection.execute("BEGIN IMMEDIATE")
+        return self.__connection
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.__connection.execute("COMMIT")
+        else:
+            self.__connection.execute("ROLLBACK")
+        return False
@@ -0,0 +1,151 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import sys
+import unittest
+
+from virgil_crypto.card_crypto import CardCrypto
+
+from virgil_sdk import VirgilCardVerifier
+from virgil_sdk.cards import Card
+from virgil_sdk.tests import BaseTest
+from virgil_sdk.tests.stub_server import StubServer
+from virgil_sdk.utils import Utils
+from virgil_sdk.verification import CardVerificationException
+
+if sys.version_info >= (3, 5):
+    import asyncio
+
+    from virgil_sdk.cards import AsyncCardManager
+    from virgil_sdk.client import AsyncCardClient
+    from virgil_sdk.client.connections.async_service_connection import AsyncServiceConnection
+
+
+@unittest.skipIf(sys.version_info < (3, 5), "asyncio clients require Python 3.5 or newer")
+class AsyncCardManagerTest(BaseTest):
+
+    class EchoTokenProvider(object):
+
+        def get_token(self, token_context):
+            return "token"
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = StubServer()
+        self.server.start()
+        key_pair = self._crypto.generate_key_pair()
+        self.raw_card = self._data_generator.generate_raw_signed_model(key_pair, True)
+        self.card_id = Card.from_signed_model(CardCrypto(), self.raw_card).id
+        raw_card_json = Utils.json_loads(self.raw_card.to_json())
+        self.server.route("GET", "/card/v5/{}".format(self.card_id), raw_card_json)
+        self.server.route("POST", "/card/v5/actions/search", [raw_card_json])
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        self.server.stop()
+
+    def test_get_card(self):
+        manager = self.__manager(self.server.base_url)
+        card = self.loop.run_until_complete(manager.get_card(self.card_id))
+        self.assertEqual(card.id, self.card_id)
+        self.assertEqual(card.identity, "test")
+        self.assertFalse(card.is_outdated)
+        self.loop.run_until_complete(manager.close())
+
+    def test_search_card(self):
+        manager = self.__manager(self.server.base_url)
+        cards = self.loop.run_until_complete(manager.search_card("test"))
+        self.assertEqual(len(cards), 1)
+        self.assertEqual(cards[0].id, self.card_id)
+        method, path, headers, body = self.server.requests[-1]
+        self.assertEqual(Utils.json_loads(body), {"identity": "test"})
+        self.assertEqual(headers["Authorization"], "Virgil token")
+        self.loop.run_until_complete(manager.close())
+
+    def test_verification_failed(self):
+        manager = self.__manager(self.server.base_url, verify_virgil_signature=True)
+        self.assertRaises(
+            CardVerificationException,
+            self.loop.run_until_complete,
+            manager.get_card(self.card_id)
+        )
+        self.assertRaises(
+            CardVerificationException,
+            self.loop.run_until_complete,
+            manager.search_card("test")
+        )
+        self.loop.run_until_complete(manager.close())
+
+    def test_concurrent_get_card_on_one_loop(self):
+        connection = AsyncServiceConnection(self.server.base_url, max_connections=5)
+        manager = self.__manager(self.server.base_url)
+        manager.card_client = AsyncCardClient(self.server.base_url, connection=connection)
+        cards = self.loop.run_until_complete(
+            asyncio.gather(*[manager.get_card(self.card_id) for _ in range(200)])
+        )
+        self.assertEqual(len(cards), 200)
+        self.assertTrue(all(map(lambda x: x.id == self.card_id, cards)))
+        self.assertLessEqual(self.server.connections_count, 5)
+        self.loop.run_until_complete(manager.close())
+
+    def test_get_cards(self):
+        connection = AsyncServiceConnection(self.server.base_url, max_connections=3)
+        manager = self.__manager(self.server.base_url)
+        manager.card_client = AsyncCardClient(self.server.base_url, connection=connection)
+        results = self.loop.run_until_complete(
+            manager.get_cards([self.card_id, "missing", self.card_id], max_concurrency=3)
+        )
+        self.assertEqual([result.card_id for result in results], [self.card_id, "missing", self.card_id])
+        self.assertTrue(results[0].is_success)
+        self.assertEqual(results[0].card.id, self.card_id)
+        self.assertFalse(results[1].is_success)
+        self.assertIsNotNone(results[1].error)
+        self.assertIs(results[2].card, results[0].card)
+        self.assertLessEqual(self.server.connections_count, 3)
+        self.loop.run_until_complete(manager.close())
+
+    def test_get_cards_verification_failed(self):
+        manager = self.__manager(self.server.base_url, verify_virgil_signature=True)
+        results = self.loop.run_until_complete(manager.get_cards([self.card_id]))
+        self.assertIsInstance(results[0].error, CardVerificationException)
+        self.loop.run_until_complete(manager.close())
+
+    def __manager(self, api_url, verify_virgil_signature=False):
+        return AsyncCardManager(
+            CardCrypto(),
+            self.EchoTokenProvider(),
+            VirgilCardVerifier(CardCrypto(), verify_virgil_signature=verify_virgil_signature),
+            api_url=api_url
+        )
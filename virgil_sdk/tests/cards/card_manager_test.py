@@ -44,7 +44,7 @@ from virgil_crypto.card_crypto import CardCrypto
 from virgil_sdk.jwt.providers import CallbackJwtProvider, CachingCallbackProvider
 from virgil_sdk.tests import config
 from virgil_sdk.tests.base_test import BaseTest
-from virgil_sdk.cards import RawCardContent, Card
+from virgil_sdk.cards import RawCardContent, Card, MemoryCardCache
 from virgil_sdk.client import RawSignedModel, ClientException, ExpiredAuthorizationClientException
 from virgil_sdk import CardManager, VirgilCardVerifier
 from virgil_sdk.jwt import JwtGenerator, TokenContext
@@ -703,3 +703,116 @@ class CardManagerTest(BaseTest):
             key_pair.private_key
         )
         return model
+
+    def test_get_cards_returns_results_in_input_order(self):
+
+        class FakeCardClient(object):
+
+            def __init__(self, raw_signed_models):
+                self._raw_signed_models = raw_signed_models
+
+            def get_card(self, card_id, access_token):
+                sleep(0.01)
+                if card_id not in self._raw_signed_models:
+                    raise ClientException("Card not found", {10001: "Card not found"})
+                return self._raw_signed_models[card_id], False
+
+        class CountingTokenProvider(object):
+
+            def __init__(self):
+                self.calls = 0
+
+            def get_token(self, token_context):
+                self.calls += 1
+                return "token"
+
+        card_crypto = CardCrypto()
+        models = {}
+        for _ in range(20):
+            model = self._data_generator.generate_raw_signed_model(self._crypto.generate_key_pair(), True)
+            models[Card.from_signed_model(card_crypto, model).id] = model
+        missing_card_id = self._data_generator.generate_card_id()
+        card_ids = list(models.keys())
+        card_ids.insert(5, missing_card_id)
+
+        token_provider = CountingTokenProvider()
+        manager = CardManager(
+            card_crypto=card_crypto,
+            access_token_provider=token_provider,
+            card_verifier=self.PositiveVerifier()
+        )
+        manager.card_client = FakeCardClient(models)
+        results = manager.get_cards(card_ids, max_concurrency=4)
+
+        self.assertEqual(token_provider.calls, 1)
+        self.assertEqual(list(map(lambda x: x.card_id, results)), card_ids)
+        self.assertFalse(results[5].is_success)
+        self.assertIsNone(results[5].card)
+        self.assertIsInstance(results[5].error, ClientException)
+        for result in results[:5] + results[6:]:
+            self.assertTrue(result.is_success)
+            self.assertEqual(result.card.id, result.card_id)
+
+        manager._card_verifier = self.NegativeVerifier()
+        results = manager.get_cards(card_ids[:3])
+        self.assertTrue(all(map(lambda x: isinstance(x.error, CardVerificationException), results)))
+        self.assertEqual(manager.get_cards([]), [])
+
+    def test_card_cache_serves_repeated_lookups(self):
+
+        class CountingCardClient(object):
+
+            def __init__(self, raw_signed_models):
+                self._raw_signed_models = raw_signed_models
+                self.requests = 0
+
+            def publish_card(self, raw_signed_model, access_token):
+                self.requests += 1
+                return raw_signed_model
+
+            def get_card(self, card_id, access_token):
+                self.requests += 1
+                return self._raw_signed_models[card_id], False
+
+            def search_card(self, identity, access_token):
+                self.requests += 1
+                identities = identity if isinstance(identity, list) else [identity]
+                return list(filter(
+                    lambda x: RawCardContent.from_signed_model(CardCrypto(), x).identity in identities,
+                    self._raw_signed_models.values()
+                ))
+
+        card_crypto = CardCrypto()
+        model = self._data_generator.generate_raw_signed_model(self._crypto.generate_key_pair(), True)
+        card_id = Card.from_signed_model(card_crypto, model).id
+        client = CountingCardClient({card_id: model})
+        card_cache = MemoryCardCache()
+        manager = CardManager(
+            card_crypto=card_crypto,
+            access_token_provider=self.EchoTokenProvider("token"),
+            card_verifier=self.PositiveVerifier(),
+            card_cache=card_cache
+        )
+        manager.card_client = client
+
+        self.assertIs(manager.get_card(card_id), manager.get_card(card_id))
+        self.assertEqual(client.requests, 1)
+        self.assertEqual(manager.get_cards([card_id])[0].card.id, card_id)
+        self.assertEqual(client.requests, 1)
+
+        self.assertEqual(len(manager.search_card("test")), 1)
+        self.assertEqual(len(manager.search_card(["test"])), 1)
+        self.assertEqual(manager.search_card("unknown"), [])
+        self.assertEqual(manager.search_card(["test", "unknown"])[0].id, card_id)
+        self.assertEqual(client.requests, 3)
+        self.assertEqual(card_cache.hits, 5)
+        self.assertEqual(card_cache.misses, 3)
+
+        new_key_pair = self._crypto.generate_key_pair()
+        raw_card = manager.generate_raw_card(
+            new_key_pair.private_key, new_key_pair.public_key, "test", previous_card_id=card_id
+        )
+        new_card = manager.publish_card(raw_card)
+        self.assertIsNone(card_cache.get_card(card_id))
+        self.assertIsNone(card_cache.get_identity_cards("test"))
+        self.assertIs(card_cache.get_card(new_card.id), new_card)
@@ -0,0 +1,108 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import os
+import sys
+import unittest
+
+from virgil_sdk.client.connections.request import Request
+from virgil_sdk.tests import BaseTest
+from virgil_sdk.tests.stub_server import StubServer
+
+if sys.version_info >= (3, 5):
+    import asyncio
+
+    from virgil_sdk.client.connections.async_service_connection import AsyncServiceConnection
+
+
+@unittest.skipIf(sys.version_info < (3, 5), "asyncio clients require Python 3.5 or newer")
+class AsyncServiceConnectionTest(BaseTest):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = StubServer()
+        self.server.route("GET", "/card/v5/some_id", {"content_snapshot": "snapshot"})
+        self.server.route("POST", "/card/v5/actions/search", [])
+        self.server.start()
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        self.server.stop()
+
+    def test_only_idempotent_requests_retried_on_reused_connection(self):
+        connection = AsyncServiceConnection(self.server.base_url)
+        perform = connection._AsyncServiceConnection__perform
+        failures = list()
+
+        async def failing_perform(reader, writer, payload):
+            if failures:
+                raise failures.pop(0)
+            return await perform(reader, writer, payload)
+
+        connection._AsyncServiceConnection__perform = failing_perform
+        search_request = Request("/card/v5/actions/search", {"identity": "alice"}, Request.POST)
+        self.loop.run_until_complete(connection.send(Request("/card/v5/some_id")))
+
+        failures.append(asyncio.IncompleteReadError(b"", 10))
+        response, headers = self.loop.run_until_complete(connection.send(Request("/card/v5/some_id")))
+        self.assertEqual(response, {"content_snapshot": "snapshot"})
+        self.assertEqual(self.server.connections_count, 2)
+
+        failures.append(asyncio.IncompleteReadError(b"", 10))
+        self.assertRaises(
+            asyncio.IncompleteReadError,
+            self.loop.run_until_complete,
+            connection.send(search_request)
+        )
+        self.assertEqual(self.server.connections_count, 2)
+        self.loop.run_until_complete(connection.close())
+
+    def test_http_proxy_from_environment(self):
+        self.server.route("GET", "http://virgil.invalid/card/v5/some_id", {"proxied": True})
+        environment = dict(os.environ)
+        os.environ["http_proxy"] = "http://user:secret@{}".format(self.server.base_url.split("://")[1])
+        os.environ.pop("no_proxy", None)
+        os.environ.pop("NO_PROXY", None)
+        try:
+            connection = AsyncServiceConnection("http://virgil.invalid")
+            response, headers = self.loop.run_until_complete(connection.send(Request("/card/v5/some_id")))
+            self.loop.run_until_complete(connection.close())
+        finally:
+            os.environ.clear()
+            os.environ.update(environment)
+        self.assertEqual(response, {"proxied": True})
+        method, path, headers, body = self.server.requests[-1]
+        self.assertEqual(path, "http://virgil.invalid/card/v5/some_id")
+        self.assertEqual(headers["Proxy-Authorization"], "Basic dXNlcjpzZWNyZXQ=")
@@ -0,0 +1,216 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import os
+import socket
+import ssl
+import threading
+import time
+import unittest
+
+from virgil_sdk.client import ClientException
+from virgil_sdk.client.connections.connection_pool import ConnectionPool
+from virgil_sdk.client.connections.request import Request
+from virgil_sdk.client.connections.service_connection import ServiceConnection
+from virgil_sdk.client.connections.tls_session_cache import TlsSessionCache
+from virgil_sdk.client.connections.urllib import httplib, urllib2
+from virgil_sdk.tests import BaseTest
+from virgil_sdk.tests.stub_server import StubServer
+
+
+class ServiceConnectionTest(BaseTest):
+
+    def setUp(self):
+        self.server = StubServer()
+        self.server.route("GET", "/card/v5/some_id", {"content_snapshot": "snapshot"})
+        self.server.route("POST", "/card/v5/actions/search", [])
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_pooled_connection_is_reused(self):
+        pool = ConnectionPool()
+        connection = ServiceConnection(self.server.base_url, connection_pool=pool)
+        for _ in range(5):
+            response, headers = connection.send(Request("/card/v5/some_id"))
+            self.assertEqual(response, {"content_snapshot": "snapshot"})
+        response, headers = connection.send(Request("/card/v5/actions/search", {"identity": "alice"}, Request.POST))
+        self.assertEqual(response, [])
+        self.assertEqual(self.server.connections_count, 1)
+        pool.clear()
+
+    def test_pooled_connection_sends_body_and_headers(self):
+        connection = ServiceConnection(self.server.base_url, connection_pool=ConnectionPool())
+        request = Request("/card/v5/actions/search", {"identity": "alice"}, Request.POST)
+        request.authorization("token")
+        connection.send(request)
+        method, path, headers, body = self.server.requests[-1]
+        self.assertEqual(method, "POST")
+        self.assertEqual(body, b'{"identity": "alice"}')
+        self.assertEqual(headers["Authorization"], "Virgil token")
+
+    def test_pooled_connection_raises_client_exception(self):
+        connection = ServiceConnection(self.server.base_url, connection_pool=ConnectionPool())
+        self.assertRaises(ClientException, connection.send, Request("/card/v5/unknown_id"))
+        response, headers = connection.send(Request("/card/v5/some_id"))
+        self.assertEqual(response, {"content_snapshot": "snapshot"})
+        self.assertEqual(self.server.connections_count, 1)
+
+    def test_idle_connection_expires(self):
+        connection = ServiceConnection(self.server.base_url, connection_pool=ConnectionPool(idle_timeout=0.1))
+        connection.send(Request("/card/v5/some_id"))
+        time.sleep(0.2)
+        connection.send(Request("/card/v5/some_id"))
+        self.assertEqual(self.server.connections_count, 2)
+
+    def test_pool_shared_between_threads(self):
+        pool = ConnectionPool(max_size=2)
+        connection = ServiceConnection(self.server.base_url, connection_pool=pool)
+        errors = list()
+
+        def worker():
+            try:
+                for _ in range(10):
+                    connection.send(Request("/card/v5/some_id"))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLess(self.server.connections_count, 40)
+        connections_count = self.server.connections_count
+        connection.send(Request("/card/v5/some_id"))
+        self.assertEqual(self.server.connections_count, connections_count)
+        pool.clear()
+
+    def test_only_idempotent_requests_retried_on_reused_connection(self):
+        pool = _FailingConnectionPool()
+        connection = ServiceConnection(self.server.base_url, connection_pool=pool)
+        search_request = Request("/card/v5/actions/search", {"identity": "alice"}, Request.POST)
+        connection.send(Request("/card/v5/some_id"))
+        self.assertEqual(pool.created, 1)
+
+        _FailingConnection.failures.append(httplib.BadStatusLine("''"))
+        response, headers = connection.send(Request("/card/v5/some_id"))
+        self.assertEqual(response, {"content_snapshot": "snapshot"})
+        self.assertEqual(pool.created, 2)
+
+        _FailingConnection.failures.append(httplib.BadStatusLine("''"))
+        with self.assertRaises(urllib2.URLError) as context:
+            connection.send(search_request)
+        self.assertIsInstance(context.exception.reason, httplib.BadStatusLine)
+        self.assertEqual(pool.created, 2)
+
+        connection.send(search_request)
+        _FailingConnection.failures.append(socket.timeout())
+        with self.assertRaises(urllib2.URLError) as context:
+            connection.send(Request("/card/v5/some_id"))
+        self.assertIsInstance(context.exception.reason, socket.timeout)
+        self.assertEqual(pool.created, 3)
+        pool.clear()
+
+    def test_pooled_transport_error_raises_url_error(self):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+        listener.close()
+        connection = ServiceConnection("http://127.0.0.1:{}".format(port), connection_pool=ConnectionPool())
+        self.assertRaises(urllib2.URLError, connection.send, Request("/card/v5/some_id"))
+
+    def test_http_proxy_from_environment(self):
+        self.server.route("GET", "http://virgil.invalid/card/v5/some_id", {"proxied": True})
+        environment = dict(os.environ)
+        os.environ["http_proxy"] = "http://user:secret@{}".format(self.server.base_url.split("://")[1])
+        os.environ.pop("no_proxy", None)
+        os.environ.pop("NO_PROXY", None)
+        try:
+            connection = ServiceConnection("http://virgil.invalid", connection_pool=ConnectionPool())
+            response, headers = connection.send(Request("/card/v5/some_id"))
+        finally:
+            os.environ.clear()
+            os.environ.update(environment)
+        self.assertEqual(response, {"proxied": True})
+        method, path, headers, body = self.server.requests[-1]
+        self.assertEqual(path, "http://virgil.invalid/card/v5/some_id")
+        self.assertEqual(headers["Proxy-Authorization"], "Basic dXNlcjpzZWNyZXQ=")
+
+    @unittest.skipUnless(hasattr(ssl, "PROTOCOL_TLS_SERVER"), "TLS stub server requires Python 3.6 or newer")
+    def test_tls_session_resumed(self):
+        tls_server = StubServer(tls=True)
+        tls_server.route("GET", "/card/v5/some_id", {"content_snapshot": "snapshot"})
+        tls_server.start()
+        try:
+            context = ssl.create_default_context(cafile=StubServer.CERTIFICATE_PATH)
+            tls_session_cache = TlsSessionCache(context)
+            for _ in range(3):
+                pool = ConnectionPool(tls_session_cache=tls_session_cache)
+                connection = ServiceConnection(tls_server.base_url, connection_pool=pool)
+                response, headers = connection.send(Request("/card/v5/some_id"))
+                self.assertEqual(response, {"content_snapshot": "snapshot"})
+                pool.clear()
+            self.assertEqual(tls_server.connections_count, 3)
+            self.assertEqual(tls_session_cache.misses, 1)
+            self.assertEqual(tls_session_cache.hits, 2)
+        finally:
+            tls_server.stop()
+
+    def test_default_tls_session_cache_is_shared(self):
+        self.assertIs(TlsSessionCache.default(), TlsSessionCache.default())
+        self.assertIs(ConnectionPool().tls_session_cache, ConnectionPool().tls_session_cache)
+        self.assertIs(TlsSessionCache.default().context, TlsSessionCache.default().context)
+
+
+class _FailingConnection(httplib.HTTPConnection):
+
+    failures = list()
+
+    def getresponse(self, *args, **kwargs):
+        if self.failures:
+            raise self.failures.pop(0)
+        return httplib.HTTPConnection.getresponse(self, *args, **kwargs)
+
+
+class _FailingConnectionPool(ConnectionPool):
+
+    def __init__(self):
+        super(_FailingConnectionPool, self).__init__()
+        self.created = 0
+
+    def _create_connection(self, scheme, host, port):
+        self.created += 1
+        return _FailingConnection(host, port)
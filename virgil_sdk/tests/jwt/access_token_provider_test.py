@@ -31,14 +31,16 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import datetime
+import threading
 import time
 
 from virgil_crypto.access_token_signer import AccessTokenSigner
 from virgil_sdk.tests import config
 
 from virgil_sdk.tests.base_test import BaseTest
-from virgil_sdk.jwt import TokenContext, JwtGenerator
-from virgil_sdk.jwt.providers import CachingCallbackProvider
+from virgil_sdk.jwt import TokenContext, JwtGenerator, Jwt, JwtHeaderContent, JwtBodyContent
+from virgil_sdk.jwt.providers import CachingCallbackProvider, KeyedCachingCallbackProvider
 
 
 class CachingJwtProviderTest(BaseTest):
@@ -126,3 +128,165 @@ class CachingJwtProviderTest(BaseTest):
         self.assertEqual(jwt_from_context_1, initial_token)
         self.assertNotEqual(jwt_from_context_2, initial_token)
         self.assertNotEqual(jwt_from_context_1, jwt_from_context_2)
+
+    @staticmethod
+    def _token_string(identity, issued_seconds_ago, expires_in_seconds):
+        now = datetime.datetime.utcnow()
+        return Jwt(
+            JwtHeaderContent("VEDS512", "key_id"),
+            JwtBodyContent(
+                "app_id",
+                identity,
+                now - datetime.timedelta(seconds=issued_seconds_ago),
+                now + datetime.timedelta(seconds=expires_in_seconds),
+                None
+            ),
+            bytearray(b"signature")
+        ).to_string()
+
+    def test_single_flight_renewal(self):
+        renewals = []
+
+        def renew_jwt_callback(token_context, token_ttl):
+            renewals.append(token_context)
+            time.sleep(0.2)
+            return self._token_string(token_context.identity, 0, token_ttl)
+
+        provider = CachingCallbackProvider(renew_jwt_callback, 60)
+        start = threading.Event()
+        tokens = []
+
+        def worker():
+            start.wait()
+            tokens.append(provider.get_token(TokenContext("alice", "get")))
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(renewals), 1)
+        self.assertEqual(provider.renewals, 1)
+        self.assertEqual(provider.waits, 19)
+        self.assertTrue(all(map(lambda x: x is tokens[0], tokens)))
+
+    def test_failed_renewal_is_retried_by_waiter(self):
+        attempts = []
+
+        def renew_jwt_callback(token_context, token_ttl):
+            attempts.append(token_context)
+            time.sleep(0.1)
+            if len(attempts) == 1:
+                raise RuntimeError("auth backend is unavailable")
+            return self._token_string(token_context.identity, 0, token_ttl)
+
+        provider = CachingCallbackProvider(renew_jwt_callback, 60)
+        errors = []
+        tokens = []
+
+        def worker():
+            try:
+                tokens.append(provider.get_token(TokenContext("alice", "get")))
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.02)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(len(tokens), 1)
+        self.assertEqual(provider.renewals, 1)
+
+    def test_malformed_token_is_not_cached(self):
+        tokens = ["a.b.c", None]
+
+        def renew_jwt_callback(token_context, token_ttl):
+            token = tokens.pop(0)
+            return token or self._token_string(token_context.identity, 0, token_ttl)
+
+        provider = CachingCallbackProvider(renew_jwt_callback, 60)
+        self.assertRaises(ValueError, provider.get_token, TokenContext("alice", "get"))
+        self.assertEqual(provider.get_token(TokenContext("alice", "get")).identity, "alice")
+        self.assertEqual(tokens, [])
+        self.assertEqual(provider.renewals, 1)
+
+    def test_force_reload_skips_expiration_check(self):
+        callbacks = []
+
+        def renew_jwt_callback(token_context, token_ttl):
+            callbacks.append(token_context)
+            return self._token_string(token_context.identity, 0, token_ttl)
+
+        provider = CachingCallbackProvider(renew_jwt_callback, 60, initial_token=Jwt.from_string("a.b.c"))
+        token = provider.get_token(TokenContext("alice", "get", True))
+        self.assertEqual(token.identity, "alice")
+        self.assertEqual(len(callbacks), 1)
+
+    def test_refresh_ahead(self):
+        renewed = threading.Event()
+        release = threading.Event()
+
+        def renew_jwt_callback(token_context, token_ttl):
+            renewed.set()
+            release.wait(5)
+            return self._token_string(token_context.identity, 0, token_ttl)
+
+        initial_token = Jwt.from_string(self._token_string("alice", 80, 20))
+        provider = CachingCallbackProvider(renew_jwt_callback, 100, initial_token=initial_token, refresh_ahead=0.5)
+        tokens = []
+        renewer = threading.Thread(target=lambda: tokens.append(provider.get_token(TokenContext("alice", "get"))))
+        renewer.start()
+        renewed.wait(5)
+        self.assertIs(provider.get_token(TokenContext("alice", "get")), initial_token)
+        self.assertEqual(provider.waits, 0)
+        release.set()
+        renewer.join()
+        self.assertIsNot(tokens[0], initial_token)
+        self.assertIs(provider.get_token(TokenContext("alice", "get")), tokens[0])
+        self.assertEqual(provider.renewals, 1)
+        self.assertRaises(ValueError, CachingCallbackProvider, renew_jwt_callback, 100, None, 1.5)
+
+
+class KeyedCachingJwtProviderTest(BaseTest):
+
+    def test_tokens_cached_per_context(self):
+        renewals = []
+
+        def renew_jwt_callback(token_context, token_ttl):
+            renewals.append(token_context)
+            return CachingJwtProviderTest._token_string(token_context.identity, 0, token_ttl)
+
+        provider = KeyedCachingCallbackProvider(renew_jwt_callback, 60, capacity=3)
+        alice_get = provider.get_token(TokenContext("alice", "get"))
+        alice_search = provider.get_token(TokenContext("alice", "search"))
+        bob_get = provider.get_token(TokenContext("bob", "get"))
+        self.assertEqual(len(renewals), 3)
+        self.assertIs(provider.get_token(TokenContext("alice", "get")), alice_get)
+        self.assertIs(provider.get_token(TokenContext("alice", "search")), alice_search)
+        self.assertIs(provider.get_token(TokenContext("bob", "get")), bob_get)
+        self.assertEqual(provider.hits, 3)
+        self.assertEqual(bob_get.identity, "bob")
+
+        self.assertIsNot(provider.get_token(TokenContext("alice", "get", force_reload=True)), alice_get)
+        provider.get_token(TokenContext("alice", "get", service="cards"))
+        self.assertEqual(provider.evictions, 1)
+        self.assertEqual(provider.size, 3)
+        provider.get_token(TokenContext("alice", "search"))
+        self.assertEqual(len(renewals), 6)
+        self.assertEqual(provider.misses, 5)
+
+    def test_expired_token_renewed(self):
+        tokens = [
+            CachingJwtProviderTest._token_string("alice", 10, -1),
+            CachingJwtProviderTest._token_string("alice", 0, 60)
+        ]
+        provider = KeyedCachingCallbackProvider(lambda token_context, token_ttl: tokens.pop(0))
+        token_1 = provider.get_token(TokenContext("alice", "get"))
+        token_2 = provider.get_token(TokenContext("alice", "get"))
+        self.assertTrue(token_1.is_expired())
+        self.assertFalse(token_2.is_expired())
+        self.assertIs(provider.get_token(TokenContext("alice", "get")), token_2)
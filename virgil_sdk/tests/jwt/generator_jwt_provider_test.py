@@ -31,7 +31,10 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
-from virgil_sdk.jwt import JwtGenerator
+import datetime
+from time import sleep
+
+from virgil_sdk.jwt import JwtGenerator, JwtHeaderContent, JwtBodyContent
 from virgil_sdk.jwt import TokenContext
 from virgil_sdk.jwt import Jwt
 from virgil_sdk.jwt.providers import GeneratorJwtProvider
@@ -97,3 +100,73 @@ class GeneratorJwtProviderTest(BaseTest):
         self.assertIsNotNone(token_3)
         self.assertIsNotNone(token_4)
         self.assertNotEqual(token_3, token_4)
+
+    class FakeJwtGenerator(object):
+
+        def __init__(self, lifetime_left, token_lifetime):
+            self.lifetime_left = lifetime_left
+            self.token_lifetime = token_lifetime
+            self.generated = 0
+
+        def generate_token(self, identity, data=None):
+            self.generated += 1
+            expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=self.lifetime_left)
+            issued_at = expires_at - datetime.timedelta(seconds=self.token_lifetime)
+            return Jwt(
+                JwtHeaderContent("VEDS512", "key_id"),
+                JwtBodyContent("app_id", identity, issued_at, expires_at, data),
+                bytearray(b"signature")
+            )
+
+    def test_cached_tokens(self):
+        crypto = VirgilCrypto()
+        jwt_generator = JwtGenerator(
+            "app_id",
+            crypto.generate_key_pair().private_key,
+            "api_public_key_id",
+            600,
+            AccessTokenSigner()
+        )
+        jwt_provider = GeneratorJwtProvider(jwt_generator, "default", token_cache_size=10)
+        token_1 = jwt_provider.get_token(TokenContext("alice", "get"))
+        self.assertIs(jwt_provider.get_token(TokenContext("alice", "search")), token_1)
+        self.assertEqual(jwt_provider.get_token(TokenContext(None, "get")).identity, "default")
+
+        token_2 = jwt_provider.get_token(TokenContext("alice", "get", force_reload=True))
+        self.assertIsNot(token_2, token_1)
+        self.assertIs(jwt_provider.get_token(TokenContext("alice", "get")), token_2)
+        self.assertEqual(jwt_provider.token_cache.hits, 2)
+        self.assertIsNone(GeneratorJwtProvider(jwt_generator, "default").token_cache)
+
+    def test_refresh_margin(self):
+        jwt_generator = self.FakeJwtGenerator(lifetime_left=20, token_lifetime=600)
+        jwt_provider = GeneratorJwtProvider(jwt_generator, "default", token_cache_size=10, refresh_margin=60)
+        token_1 = jwt_provider.get_token(TokenContext("alice", "get"))
+        self.assertIsNot(jwt_provider.get_token(TokenContext("alice", "get")), token_1)
+        self.assertEqual(jwt_generator.generated, 2)
+
+        jwt_generator.lifetime_left = 120
+        token_2 = jwt_provider.get_token(TokenContext("alice", "get", force_reload=True))
+        self.assertIs(jwt_provider.get_token(TokenContext("alice", "get")), token_2)
+        self.assertEqual(jwt_generator.generated, 3)
+
+    def test_background_refresh(self):
+        jwt_generator = self.FakeJwtGenerator(lifetime_left=20, token_lifetime=600)
+        jwt_provider = GeneratorJwtProvider(
+            jwt_generator,
+            "default",
+            token_cache_size=10,
+            refresh_margin=60,
+            background_refresh=True
+        )
+        token_1 = jwt_provider.get_token(TokenContext("alice", "get"))
+        jwt_generator.lifetime_left = 300
+        self.assertIs(jwt_provider.get_token(TokenContext("alice", "get")), token_1)
+        for _ in range(100):
+            if jwt_provider.token_cache.get("alice") is not token_1:
+                break
+            sleep(0.01)
+        token_2 = jwt_provider.get_token(TokenContext("alice", "get"))
+        self.assertIsNot(token_2, token_1)
+        self.assertIs(jwt_provider.get_token(TokenContext("alice", "get")), token_2)
+        self.assertEqual(jwt_generator.generated, 2)
@@ -31,7 +31,11 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
-from virgil_sdk.jwt import JwtGenerator
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from virgil_sdk.jwt import JwtGenerator, JwtVerifier, Jwt, JwtBodyContent, JwtHeaderContent
 from virgil_sdk.utils import Utils
 from virgil_crypto.access_token_signer import AccessTokenSigner
 
@@ -68,3 +72,55 @@ class JwtGeneratorTest(BaseTest):
             jwt_generator.generate_token,
             None
         )
+
+    def test_generate_tokens(self):
+        crypto = VirgilCrypto()
+        key_pair = crypto.generate_key_pair()
+        access_token_signer = AccessTokenSigner()
+        jwt_generator = JwtGenerator("app_id", key_pair.private_key, "api_public_key_id", 600, access_token_signer)
+        jwt_verifier = JwtVerifier(access_token_signer, key_pair.public_key, "api_public_key_id")
+
+        token = jwt_generator.generate_token("alice", {"role": "admin"})
+        imported_token = Jwt.from_string(token.to_string())
+        self.assertEqual(token, imported_token)
+        self.assertEqual(token.unsigned_data, bytes(imported_token.unsigned_data))
+        self.assertEqual(token.body_content.additional_data, {"role": "admin"})
+        self.assertEqual(token.body_content.expires_at_timestamp - token.body_content.issued_at_timestamp, 600)
+        self.assertTrue(jwt_verifier.verify_token(token))
+        self.assertTrue(jwt_verifier.verify_token(imported_token))
+
+        identities = ["identity{}".format(i) for i in range(20)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tokens = jwt_generator.generate_tokens(identities, executor=executor)
+        self.assertEqual(list(map(lambda x: x.identity, tokens)), identities)
+        self.assertTrue(all(map(jwt_verifier.verify_token, tokens)))
+        self.assertEqual(
+            list(map(lambda x: x.identity, jwt_generator.generate_tokens(identities[:3]))),
+            identities[:3]
+        )
+        self.assertRaises(ValueError, jwt_generator.generate_tokens, ["alice", None])
+
+    def test_body_content_timestamps(self):
+        issued_at = datetime.datetime(2020, 1, 1, 12, 0, 0)
+        expires_at = datetime.datetime(2020, 1, 1, 12, 10, 0)
+        body_from_dates = JwtBodyContent("app_id", "alice", issued_at, expires_at, {"role": "admin"})
+        body_from_timestamps = JwtBodyContent("app_id", "alice", 1577880000, 1577880600, {"role": "admin"})
+        self.assertEqual(body_from_dates, body_from_timestamps)
+        self.assertEqual(body_from_timestamps.issued_at, issued_at)
+        self.assertEqual(body_from_timestamps.expires_at, expires_at)
+        self.assertEqual(body_from_dates.expires_at_timestamp, 1577880600)
+        self.assertEqual(body_from_dates.json["exp"], 1577880600)
+        self.assertEqual(JwtBodyContent.from_json(body_from_dates.json), body_from_dates)
+
+    def test_is_expired_with_clock_skew(self):
+        now = int(time.time())
+        token = Jwt(
+            JwtHeaderContent("VEDS512", "key_id"),
+            JwtBodyContent("app_id", "alice", now - 100, now + 30, None),
+            bytearray(b"signature")
+        )
+        self.assertFalse(token.is_expired())
+        self.assertTrue(token.is_expired(clock_skew=60))
+        self.assertTrue(token.is_expired(now + 30))
+        self.assertFalse(token.is_expired(now + 29))
+        self.assertFalse(Jwt.from_string(token.to_string()).is_expired(now + 20, clock_skew=5))
@@ -31,6 +31,8 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+from concurrent.futures import ThreadPoolExecutor
+
 from virgil_sdk.tests import config
 from virgil_sdk.tests import BaseTest
 
@@ -211,3 +213,98 @@ class JwtVerifierTest(BaseTest):
         )
         token = jwt_generator.generate_token(identity="some_username")
         self.assertFalse(token.is_expired())
+
+    def test_verified_token_cache(self):
+        key_pair = self._crypto.generate_key_pair()
+        signer = AccessTokenSigner()
+        jwt_generator = JwtGenerator("app_id", key_pair.private_key, "api_public_key_id", 300, signer)
+        verifier = JwtVerifier(signer, key_pair.public_key, "api_public_key_id", verified_token_cache_size=10)
+
+        token = jwt_generator.generate_token("alice")
+        self.assertTrue(verifier.verify_token(token))
+        self.assertTrue(verifier.verify_token(Jwt.from_string(token.to_string())))
+        self.assertEqual(verifier.verified_token_cache.hits, 1)
+
+        other_token = jwt_generator.generate_token("bob")
+        forged_parts = other_token.to_string().split(".")
+        forged_parts[2] = token.to_string().split(".")[2]
+        self.assertFalse(verifier.verify_token(Jwt.from_string(".".join(forged_parts))))
+
+        foreign_generator = JwtGenerator(
+            "app_id", self._crypto.generate_key_pair().private_key, "api_public_key_id", 300, signer
+        )
+        foreign_token = foreign_generator.generate_token("alice")
+        self.assertFalse(verifier.verify_token(foreign_token))
+        self.assertFalse(verifier.verify_token(foreign_token))
+        self.assertEqual(len(verifier.verified_token_cache), 1)
+        self.assertIsNone(JwtVerifier(signer, key_pair.public_key, "api_public_key_id").verified_token_cache)
+
+    def test_lazy_token_import(self):
+        key_pair = self._crypto.generate_key_pair()
+        signer = AccessTokenSigner()
+        jwt_generator = JwtGenerator("app_id", key_pair.private_key, "api_public_key_id", 300, signer)
+        token = jwt_generator.generate_token("alice", {"role": "admin"})
+
+        imported_token = Jwt.from_string(token.to_string())
+        self.assertIsInstance(imported_token.unsigned_data, memoryview)
+        self.assertEqual(bytes(imported_token.unsigned_data), bytes(token.unsigned_data))
+        self.assertEqual(imported_token.peek_expiry(), token.body_content.expires_at_timestamp)
+        self.assertIsNone(imported_token._body_content)
+        self.assertIsNone(imported_token._header_content)
+
+        verifier = JwtVerifier(signer, key_pair.public_key, "api_public_key_id")
+        self.assertTrue(verifier.verify_token(imported_token))
+        self.assertIsNone(imported_token._body_content)
+        self.assertEqual(imported_token.identity, "alice")
+        self.assertEqual(imported_token.body_content.additional_data, {"role": "admin"})
+        self.assertEqual(imported_token.body_content.app_id, "app_id")
+        self.assertEqual(imported_token.to_string(), token.to_string())
+        self.assertEqual(imported_token, token)
+
+        self.assertRaises(ValueError, Jwt.from_string, "header.body")
+        malformed_token = Jwt.from_string("header.body.signature")
+        self.assertRaises(ValueError, malformed_token.peek_expiry)
+        self.assertRaises(ValueError, lambda: malformed_token.header_content)
+        self.assertRaises(ValueError, lambda: malformed_token.body_content)
+
+    def test_verify_tokens(self):
+        key_pair = self._crypto.generate_key_pair()
+        signer = AccessTokenSigner()
+        jwt_generator = JwtGenerator("app_id", key_pair.private_key, "api_public_key_id", 300, signer)
+        foreign_generator = JwtGenerator(
+            "app_id", self._crypto.generate_key_pair().private_key, "api_public_key_id", 300, signer
+        )
+        other_key_generator = JwtGenerator("app_id", key_pair.private_key, "other_key_id", 300, signer)
+        verifier = JwtVerifier(signer, key_pair.public_key, "api_public_key_id")
+
+        token = jwt_generator.generate_token("alice")
+        tokens = [
+            token,
+            foreign_generator.generate_token("alice"),
+            Jwt.from_string(token.to_string()),
+            other_key_generator.generate_token("alice"),
+            jwt_generator.generate_token("bob"),
+        ]
+        expected = [True, False, True, False, True]
+        self.assertEqual(verifier.verify_tokens(tokens), expected)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual(verifier.verify_tokens(tokens, executor), expected)
+        self.assertEqual(verifier.verify_tokens([]), [])
+
+    def test_verify_tokens_with_malformed_tokens(self):
+        key_pair = self._crypto.generate_key_pair()
+        signer = AccessTokenSigner()
+        jwt_generator = JwtGenerator("app_id", key_pair.private_key, "api_public_key_id", 300, signer)
+        verifier = JwtVerifier(signer, key_pair.public_key, "api_public_key_id")
+        token = jwt_generator.generate_token("alice")
+        header, body, _ = token.to_string().split(".")
+        tokens = [
+            token,
+            Jwt.from_string("a.b.c"),
+            Jwt.from_string(".".join((header, body, Utils.b64_encode(b"corrupted signature")))),
+            jwt_generator.generate_token("bob"),
+        ]
+        expected = [True, False, False, True]
+        self.assertEqual(verifier.verify_tokens(tokens), expected)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual(verifier.verify_tokens(tokens, executor), expected)
@@ -34,11 +34,14 @@
 import binascii
 import hashlib
 import os
+import shutil
+import tempfile
 
 from virgil_sdk.storage import KeyStorage
 from virgil_sdk.storage.key_entry import KeyEntry
 
 from virgil_sdk.tests import BaseTest
+from virgil_sdk.utils import Utils
 
 
 class KeyStorageTest(BaseTest):
@@ -128,6 +131,52 @@ class KeyStorageTest(BaseTest):
         key_storage = KeyStorage()
         self.assertRaises(ValueError, key_storage.delete, None)
 
+    def test_load_legacy_entry_and_reencode(self):
+        storage_path = tempfile.mkdtemp()
+        try:
+            key_storage = KeyStorage(storage_path)
+            key_data = self._crypto.export_private_key(self._crypto.generate_key_pair().private_key)
+            key_storage.store(KeyEntry("current", key_data, {}))
+            legacy_file_path = os.path.join(storage_path, hashlib.sha384(b"legacy").hexdigest())
+            with open(legacy_file_path, "wb") as legacy_file:
+                legacy_file.write(Utils.json_dumps(
+                    {"name": "legacy", "value": list(bytearray(key_data)), "meta": {"some_key": "some_value"}}
+                ).encode())
+            self.assertEqual(key_storage.load("legacy")["value"], bytearray(key_data))
+            self.assertEqual(key_storage.reencode(), 1)
+            self.assertEqual(key_storage.reencode(), 0)
+            with open(legacy_file_path, "rb") as legacy_file:
+                raw_key_entry = Utils.json_loads(legacy_file.read())
+            self.assertEqual(raw_key_entry["version"], KeyEntry.FORMAT_VERSION)
+            self.assertEqual(raw_key_entry["value"], Utils.b64encode(key_data))
+            loaded_key_entry = key_storage.load("legacy")
+            self.assertEqual(loaded_key_entry["value"], bytearray(key_data))
+            self.assertDictEqual(loaded_key_entry["meta"], {"some_key": "some_value"})
+            self.assertEqual(key_storage.load("current")["value"], bytearray(key_data))
+        finally:
+            shutil.rmtree(storage_path)
+
+    def test_store_many_and_delete_many_are_all_or_nothing(self):
+        storage_path = tempfile.mkdtemp()
+        try:
+            key_storage = KeyStorage(storage_path)
+            key_data = self._crypto.export_private_key(self._crypto.generate_key_pair().private_key)
+            key_storage.store(KeyEntry("second", key_data, {}))
+            key_entries = [KeyEntry(name, key_data, {}) for name in ("first", "second", "third")]
+            self.assertRaises(ValueError, key_storage.store_many, key_entries)
+            self.assertFalse(key_storage.exists("first"))
+            self.assertFalse(key_storage.exists("third"))
+            key_storage.store_many([key_entries[0], key_entries[2]])
+            self.assertRaises(ValueError, key_storage.delete_many, ["first", "missing"])
+            self.assertTrue(key_storage.exists("first"))
+            key_storage.delete_many(["first", "second", "third"])
+            self.assertEqual(os.listdir(storage_path), [])
+        finally:
+            shutil.rmtree(storage_path)
+
+    def test_load_unsupported_entry_version(self):
+        self.assertRaises(ValueError, KeyEntry.decode, '{"version": 3, "name": "key", "value": "", "meta": {}}')
+
     def __filename_for_clean(self, key_storage, key_name):
         file_name = hashlib.sha384(key_name.encode("utf-8")).hexdigest()
         return os.path.join(key_storage._KeyStorage__key_storage_path, file_name)
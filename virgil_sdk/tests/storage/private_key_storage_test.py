@@ -34,9 +34,15 @@
 import binascii
 import hashlib
 import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from virgil_sdk.storage import PrivateKeyExporter
 from virgil_sdk.storage import PrivateKeyStorage
+from virgil_sdk.storage import KeyStorage
+from virgil_sdk.storage import SqliteKeyStorage
 from virgil_sdk.tests import BaseTest
 
 
@@ -142,6 +148,92 @@ class PrivateKeyStorageTest(BaseTest):
         private_key_storage = PrivateKeyStorage(private_key_exporter)
         self.assertRaises(ValueError, private_key_storage.delete, None)
 
+    def test_load_cached(self):
+        storage_path = tempfile.mkdtemp()
+        try:
+            key_exporter = _CountingKeyExporter(PrivateKeyExporter(self._crypto))
+            private_key_storage = PrivateKeyStorage(key_exporter, KeyStorage(storage_path), cache_size=1, cache_ttl=0.5)
+            for key_name in ("first", "second"):
+                private_key_storage.store(self._crypto.generate_key_pair().private_key, key_name, {"name": key_name})
+            first_key, meta = private_key_storage.load("first")
+            self.assertDictEqual(meta, {"name": "first"})
+            self.assertIs(private_key_storage.load("first")[0], first_key)
+            self.assertEqual(key_exporter.imports, 1)
+            private_key_storage.load("second")
+            # evicted keys stay usable by callers holding them
+            self.assertTrue(self._crypto.export_private_key(first_key))
+            private_key_storage.load("first")
+            self.assertEqual(key_exporter.imports, 3)
+            time.sleep(0.6)
+            private_key_storage.load("first")
+            self.assertEqual(key_exporter.imports, 4)
+            private_key_storage.evict("first")
+            private_key_storage.load("first")
+            private_key_storage.clear_cache()
+            private_key_storage.load("first")
+            self.assertEqual(key_exporter.imports, 6)
+            private_key_storage.delete("first")
+            self.assertEqual(private_key_storage.key_cache.keys(), [])
+            self.assertRaises(ValueError, private_key_storage.load, "first")
+        finally:
+            shutil.rmtree(storage_path)
+
+    def test_cache_disabled_by_default(self):
+        private_key_storage = PrivateKeyStorage(PrivateKeyExporter(self._crypto))
+        self.assertIsNone(private_key_storage.key_cache)
+        private_key_storage.evict("first")
+        private_key_storage.clear_cache()
+
+    def test_bulk_operations(self):
+        storage_path = tempfile.mkdtemp()
+        try:
+            for key_storage in (KeyStorage(storage_path), SqliteKeyStorage(storage_path)):
+                self.__check_bulk_operations(PrivateKeyStorage(PrivateKeyExporter(self._crypto), key_storage))
+        finally:
+            shutil.rmtree(storage_path)
+
+    def __check_bulk_operations(self, private_key_storage):
+        key_pairs = [self._crypto.generate_key_pair() for _ in range(3)]
+        private_key_storage.store(key_pairs[0].private_key, "first")
+        with ThreadPoolExecutor(4) as executor:
+            results = private_key_storage.store_many([
+                (key_pairs[0].private_key, "first"),
+                (key_pairs[1].private_key, "second", {"some_key": "some_value"}),
+                (key_pairs[2].private_key, None),
+            ], executor)
+            self.assertEqual([result.name for result in results], ["first", "second", None])
+            self.assertEqual([result.is_success for result in results], [False, True, False])
+            self.assertTrue(all(isinstance(result.error, ValueError) for result in results if result.error))
+            results = private_key_storage.store_many([(key_pair.private_key, str(i)) for i, key_pair in enumerate(key_pairs)])
+            self.assertTrue(all(result.is_success for result in results))
+            results = private_key_storage.load_many(["second", "missing", "0", "1", "2"], executor)
+        self.assertEqual([result.is_success for result in results], [True, False, True, True, True])
+        self.assertDictEqual(results[0].meta, {"some_key": "some_value"})
+        for key_pair, result in zip(key_pairs, results[2:]):
+            self.assertEqual(
+                self._crypto.export_private_key(result.private_key),
+                self._crypto.export_private_key(key_pair.private_key)
+            )
+        results = private_key_storage.delete_many(["0", "1", "2"])
+        self.assertTrue(all(result.is_success for result in results))
+        results = private_key_storage.delete_many(["first", "missing", "second"])
+        self.assertEqual([result.is_success for result in results], [True, False, True])
+        self.assertFalse(any(result.is_success for result in private_key_storage.load_many(["first", "second", "0"])))
+
     def __filename_for_clean(self, private_key_storage, key_name):
         file_name = hashlib.sha384(key_name.encode("utf-8")).hexdigest()
         return os.path.join(private_key_storage.key_storage._KeyStorage__key_storage_path, file_name)
+
+
+class _CountingKeyExporter(object):
+
+    def __init__(self, key_exporter):
+        self.key_exporter = key_exporter
+        self.imports = 0
+
+    def export_private_key(self, private_key):
+        return self.key_exporter.export_private_key(private_key)
+
+    def import_private_key(self, key_data):
+        self.imports += 1
+        return self.key_exporter.import_private_key(key_data)
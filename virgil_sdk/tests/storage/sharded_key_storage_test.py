@@ -0,0 +1,133 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import hashlib
+import os
+import shutil
+import tempfile
+
+from virgil_sdk.storage import KeyStorage, ShardedKeyStorage
+from virgil_sdk.storage.key_entry import KeyEntry
+
+from virgil_sdk.tests import BaseTest
+
+
+class ShardedKeyStorageTest(BaseTest):
+
+    def setUp(self):
+        super(ShardedKeyStorageTest, self).setUp()
+        self.storage_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.storage_path, ignore_errors=True)
+
+    def __key_entry(self, name, meta=None):
+        key_pair = self._crypto.generate_key_pair()
+        return KeyEntry(name, self._crypto.export_private_key(key_pair.private_key), meta or {})
+
+    def test_store_load_delete(self):
+        key_storage = ShardedKeyStorage(os.path.join(self.storage_path, "keys"))
+        key_entry = self.__key_entry("test_key", {"some_key": "some_value"})
+        key_storage.store(key_entry)
+        file_name = hashlib.sha384(b"test_key").hexdigest()
+        self.assertTrue(os.path.exists(
+            os.path.join(self.storage_path, "keys", file_name[:2], file_name[2:4], file_name)
+        ))
+        self.assertRaises(ValueError, key_storage.store, key_entry)
+        loaded_key_entry = key_storage.load("test_key")
+        self.assertEqual(loaded_key_entry["name"], "test_key")
+        self.assertEqual(bytearray(loaded_key_entry["value"]), key_entry.value)
+        self.assertDictEqual(loaded_key_entry["meta"], {"some_key": "some_value"})
+        self.assertTrue("test_key" in key_storage)
+        key_storage.delete("test_key")
+        self.assertFalse(key_storage.exists("test_key"))
+        self.assertRaises(ValueError, key_storage.load, "test_key")
+        self.assertRaises(ValueError, key_storage.delete, "test_key")
+
+    def test_index_shared_between_instances(self):
+        key_storage = ShardedKeyStorage(self.storage_path)
+        other_key_storage = ShardedKeyStorage(self.storage_path)
+        self.assertEqual(other_key_storage.names(), [])
+        for name in ("first", "second", u"ключ\n"):
+            key_storage.store(self.__key_entry(name))
+        key_storage.delete("second")
+        self.assertEqual(sorted(other_key_storage.names()), sorted(["first", u"ключ\n"]))
+        key_storage.compact_index()
+        other_key_storage.store(self.__key_entry("third"))
+        self.assertEqual(len(key_storage), 3)
+        self.assertEqual(len(other_key_storage), 3)
+
+    def test_index_replayed_after_compaction_by_other_instance(self):
+        key_storage = ShardedKeyStorage(self.storage_path)
+        other_key_storage = ShardedKeyStorage(self.storage_path)
+        for i in range(5):
+            key_storage.store(self.__key_entry("key{}".format(i)))
+        for i in range(4):
+            key_storage.delete("key{}".format(i))
+        self.assertEqual(key_storage.names(), ["key4"])
+        other_key_storage.compact_index()
+        for i in range(10):
+            other_key_storage.store(self.__key_entry("other_key{}".format(i)))
+        self.assertEqual(
+            sorted(key_storage.names()),
+            sorted(["key4"] + ["other_key{}".format(i) for i in range(10)])
+        )
+
+    def test_rebuild_index(self):
+        key_storage = ShardedKeyStorage(self.storage_path)
+        key_storage.store(self.__key_entry("first"))
+        key_storage.store(self.__key_entry("second"))
+        os.remove(os.path.join(self.storage_path, ShardedKeyStorage.INDEX_FILE_NAME))
+        self.assertEqual(ShardedKeyStorage(self.storage_path).names(), [])
+        self.assertEqual(key_storage.rebuild_index(), 2)
+        self.assertEqual(sorted(ShardedKeyStorage(self.storage_path).names()), ["first", "second"])
+
+    def test_migrate(self):
+        source_path = os.path.join(self.storage_path, "flat")
+        flat_key_storage = KeyStorage(source_path)
+        key_entry = self.__key_entry("first", {"some_key": "some_value"})
+        flat_key_storage.store(key_entry)
+        flat_key_storage.store(self.__key_entry("second"))
+        flat_key_storage.store(self.__key_entry("third"))
+        key_storage = ShardedKeyStorage(os.path.join(self.storage_path, "sharded"))
+        key_storage.store(self.__key_entry("second"))
+        key_storage.store(KeyEntry("third", flat_key_storage.load("third")["value"], {}))
+        self.assertEqual(key_storage.migrate(source_path, remove_source=True), 1)
+        # conflicting "second" is kept in the source, identical "third" is removed
+        self.assertEqual(os.listdir(source_path), [hashlib.sha384(b"second").hexdigest()])
+        self.assertEqual(key_storage.migrate(source_path, remove_source=True), 0)
+        self.assertEqual(len(os.listdir(source_path)), 1)
+        self.assertEqual(sorted(key_storage.names()), ["first", "second", "third"])
+        loaded_key_entry = key_storage.load("first")
+        self.assertEqual(bytearray(loaded_key_entry["value"]), key_entry.value)
+        self.assertDictEqual(loaded_key_entry["meta"], {"some_key": "some_value"})
@@ -0,0 +1,124 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import os
+import shutil
+import tempfile
+import threading
+
+from virgil_sdk.storage import PrivateKeyExporter, PrivateKeyStorage, SqliteKeyStorage
+from virgil_sdk.storage.key_entry import KeyEntry
+
+from virgil_sdk.tests import BaseTest
+
+
+class SqliteKeyStorageTest(BaseTest):
+
+    def setUp(self):
+        super(SqliteKeyStorageTest, self).setUp()
+        self.storage_path = tempfile.mkdtemp()
+        self.key_storage = SqliteKeyStorage(os.path.join(self.storage_path, "keys"))
+
+    def tearDown(self):
+        self.key_storage.close()
+        shutil.rmtree(self.storage_path, ignore_errors=True)
+
+    def __key_entry(self, name, meta=None):
+        key_pair = self._crypto.generate_key_pair()
+        return KeyEntry(name, self._crypto.export_private_key(key_pair.private_key), meta)
+
+    def test_store_load_delete(self):
+        key_entry = self.__key_entry("test_key", {"some_key": "some_value"})
+        self.key_storage.store(key_entry)
+        self.assertRaises(ValueError, self.key_storage.store, key_entry)
+        loaded_key_entry = self.key_storage.load("test_key")
+        self.assertEqual(loaded_key_entry["name"], "test_key")
+        self.assertEqual(loaded_key_entry["value"], key_entry.value)
+        self.assertDictEqual(loaded_key_entry["meta"], {"some_key": "some_value"})
+        self.assertTrue("test_key" in self.key_storage)
+        self.key_storage.delete("test_key")
+        self.assertFalse(self.key_storage.exists("test_key"))
+        self.assertRaises(ValueError, self.key_storage.load, "test_key")
+        self.assertRaises(ValueError, self.key_storage.delete, "test_key")
+        self.assertRaises(ValueError, self.key_storage.load, None)
+
+    def test_batches_are_transactional(self):
+        self.key_storage.store(self.__key_entry("second"))
+        key_entries = [self.__key_entry(name) for name in ("first", "second", "third")]
+        self.assertRaises(ValueError, self.key_storage.store_many, key_entries)
+        self.assertEqual(self.key_storage.names(), ["second"])
+        self.key_storage.store_many([key_entries[0], key_entries[2]])
+        self.assertRaises(ValueError, self.key_storage.delete_many, ["first", "missing"])
+        self.assertEqual(len(self.key_storage), 3)
+        self.key_storage.delete_many(["first", "third"])
+        self.assertEqual(self.key_storage.names(), ["second"])
+
+    def test_names(self):
+        self.key_storage.store_many([
+            self.__key_entry("device/1", {"owner": "alice", "kind": "device"}),
+            self.__key_entry("device/2", {"owner": "bob", "kind": "device"}),
+            self.__key_entry("devices", {"owner": "alice"}),
+            self.__key_entry("user/alice", None),
+        ])
+        self.assertEqual(self.key_storage.names(prefix="device/"), ["device/1", "device/2"])
+        self.assertEqual(self.key_storage.names(meta={"owner": "alice"}), ["device/1", "devices"])
+        self.assertEqual(self.key_storage.names(prefix="device", meta={"owner": "alice", "kind": "device"}), ["device/1"])
+        self.assertEqual(self.key_storage.names(prefix="x"), [])
+        self.assertEqual(len(self.key_storage.names()), 4)
+
+    def test_shared_between_threads_and_instances(self):
+        self.key_storage.store(self.__key_entry("test_key"))
+        other_key_storage = SqliteKeyStorage(database_file=self.key_storage.database_file)
+        loaded = []
+
+        def load():
+            loaded.append(other_key_storage.load("test_key")["value"])
+            other_key_storage.close()
+
+        threads = [threading.Thread(target=load) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(loaded, [self.key_storage.load("test_key")["value"]] * 4)
+
+    def test_private_key_storage(self):
+        private_key_storage = PrivateKeyStorage(PrivateKeyExporter(self._crypto), self.key_storage)
+        key_pair = self._crypto.generate_key_pair()
+        private_key_storage.store(key_pair.private_key, "test_key", {"some_key": "some_value"})
+        private_key, meta = private_key_storage.load("test_key")
+        self.assertEqual(
+            self._crypto.export_private_key(private_key),
+            self._crypto.export_private_key(key_pair.private_key)
+        )
+        self.assertDictEqual(meta, {"some_key": "some_value"})
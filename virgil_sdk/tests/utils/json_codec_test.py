@@ -0,0 +1,119 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import json
+import random
+import unittest
+from collections import OrderedDict
+
+from virgil_sdk.utils import Utils, JsonCodec, available_json_codecs
+
+
+class JsonCodecTest(unittest.TestCase):
+
+    SAMPLES = [
+        {
+            "identity": "alice",
+            "public_key": "MCowBQYDK2VwAyEA6d9bQQFuEnU8vSmx9fDo0Wxec42JdNg4VR4FOr4/BUk=",
+            "version": "5.0",
+            "created_at": 1523827200,
+            "previous_card_id": "a666318071274adb738af3f67b8c7ec29d954de2cabfd71a942e6ea38e59fff9"
+        },
+        OrderedDict([("sub", "identity-alice"), ("iss", "virgil-app"), ("iat", 1), ("exp", 2), ("ada", {"b": 1, "a": 2})]),
+        {"unicode": u"é中\U0001f600", "del": u"\x7f", "control": u"\x00\x1f\n\t\"\\", "slash": "</script>"},
+        {"floats": [0.1, 1.5, -0.0, 1e16, 1e-7, 123456.789, float("nan"), float("inf")]},
+        {"small_floats": [1e-5, 5e-5, 3.05e-05, 9.99e-05]},
+        {"ints": [0, -1, 2 ** 53, 2 ** 63, 2 ** 64, 10 ** 30, -(2 ** 63) - 1]},
+        {"nested": [{"z": None, "a": [True, False, []]}, {}, [[[]]]], "empty": ""},
+        {"text": "1e5 and null inside string"},
+        [1, "two", 3.0, None],
+        "plain string",
+        42,
+    ]
+
+    def test_canonical_dumps_parity(self):
+        for codec in available_json_codecs():
+            for sample in self.SAMPLES:
+                self.assertEqual(
+                    codec.dumps(sample, sort_keys=True, separators=(",", ":")),
+                    json.dumps(sample, sort_keys=True, separators=(",", ":")),
+                    "{} differs on {!r}".format(codec.name, sample)
+                )
+
+    def test_canonical_dumps_float_parity(self):
+        rand = random.Random(0)
+        floats = [rand.uniform(-1, 1) * 10 ** rand.randint(-20, 20) for _ in range(2000)]
+        for codec in available_json_codecs():
+            for value in floats:
+                sample = {"value": value, "list": [1, value]}
+                self.assertEqual(
+                    codec.dumps(sample, sort_keys=True, separators=(",", ":")),
+                    json.dumps(sample, sort_keys=True, separators=(",", ":")),
+                    "{} differs on {!r}".format(codec.name, value)
+                )
+
+    def test_non_canonical_dumps_parity(self):
+        for codec in available_json_codecs():
+            for sample in self.SAMPLES:
+                self.assertEqual(codec.dumps(sample), json.dumps(sample))
+                self.assertEqual(codec.dumps(sample, sort_keys=True), json.dumps(sample, sort_keys=True))
+
+    def test_loads_parity(self):
+        for codec in available_json_codecs():
+            for sample in self.SAMPLES:
+                document = json.dumps(sample, sort_keys=True, separators=(",", ":"))
+                expected = json.loads(document)
+                for source in (document, document.encode(), bytearray(document.encode()), memoryview(document.encode())):
+                    loaded = codec.loads(source)
+                    self.assertEqual(
+                        json.dumps(loaded, sort_keys=True),
+                        json.dumps(expected, sort_keys=True),
+                        "{} differs on {!r}".format(codec.name, source)
+                    )
+
+    def test_invalid_input(self):
+        for codec in available_json_codecs():
+            self.assertRaises(ValueError, codec.loads, "{invalid")
+            self.assertRaises(ValueError, codec.loads, b"")
+            self.assertRaises(TypeError, codec.dumps, {"bytes": b"value"}, sort_keys=True, separators=(",", ":"))
+            self.assertRaises(TypeError, codec.dumps, {"set": {1}}, sort_keys=True, separators=(",", ":"))
+
+    def test_set_json_codec(self):
+        default_codec = Utils.get_json_codec()
+        self.assertIsInstance(default_codec, JsonCodec)
+        try:
+            Utils.set_json_codec(JsonCodec())
+            self.assertEqual(Utils.get_json_codec().name, "json")
+            self.assertEqual(Utils.json_loads(memoryview(b'{"a":1}')), {"a": 1})
+        finally:
+            Utils.set_json_codec(default_codec)
@@ -0,0 +1,118 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import threading
+import unittest
+
+from virgil_sdk.utils import TtlCache
+
+
+class TtlCacheTest(unittest.TestCase):
+
+    class FakeClock(object):
+
+        def __init__(self):
+            self.now = 1000.0
+
+        def __call__(self):
+            return self.now
+
+    def test_get_missing(self):
+        cache = TtlCache()
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get("key", "default"), "default")
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 0)
+
+    def test_lru_eviction(self):
+        evicted = []
+        cache = TtlCache(capacity=2, on_evict=lambda key, value: evicted.append((key, value)))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertEqual(evicted, [("b", 2)])
+        self.assertEqual(cache.keys(), ["a", "c"])
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_ttl_expiration(self):
+        clock = self.FakeClock()
+        evicted = []
+        cache = TtlCache(ttl=10, clock=clock, on_evict=lambda key, value: evicted.append(key))
+        cache.put("a", 1)
+        cache.put("b", 2, ttl=100)
+        cache.put("c", 3, expires_at=clock.now + 5)
+        clock.now += 5
+        self.assertNotIn("c", cache)
+        self.assertEqual(cache.get("a"), 1)
+        clock.now += 5
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.purge_expired(), 1)
+        self.assertEqual(evicted, ["a", "c"])
+        self.assertEqual(cache.evictions, 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_pop_and_clear(self):
+        evicted = []
+        cache = TtlCache(on_evict=lambda key, value: evicted.append(key))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("b", 3)
+        self.assertEqual(evicted, ["b"])
+        self.assertEqual(cache.pop("a"), 1)
+        self.assertIsNone(cache.pop("a"))
+        cache.clear()
+        self.assertEqual(evicted, ["b", "b"])
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, TtlCache, 0)
+        self.assertRaises(ValueError, TtlCache, 10, 0)
+
+    def test_concurrent_access(self):
+        cache = TtlCache(capacity=50)
+
+        def worker(offset):
+            for i in range(1000):
+                cache.put((offset + i) % 100, i)
+                cache.get((offset + i * 7) % 100)
+
+        threads = [threading.Thread(target=worker, args=(i * 13,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(cache.hits + cache.misses, 8000)
@@ -0,0 +1,70 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import base64
+import os
+import unittest
+
+from virgil_sdk.utils import Utils
+
+
+class UtilsTest(unittest.TestCase):
+
+    def test_b64_url_round_trip(self):
+        for length in range(0, 70):
+            data = os.urandom(length)
+            encoded = Utils.b64_encode(data)
+            self.assertNotIn("=", encoded)
+            self.assertEqual(encoded, base64.urlsafe_b64encode(data).decode().rstrip("="))
+            for source in (encoded, encoded.encode(), bytearray(encoded.encode()), memoryview(encoded.encode())):
+                self.assertEqual(Utils.b64_decode(source), data)
+            padded = base64.urlsafe_b64encode(data)
+            self.assertEqual(Utils.b64_decode(padded), data)
+            self.assertEqual(Utils.b64_encode(bytearray(data)), encoded)
+            self.assertEqual(Utils.b64_encode(memoryview(data)), encoded)
+
+    def test_b64_url_text(self):
+        self.assertEqual(Utils.b64_encode(u"{\"alg\":\"VEDS512\"}"), "eyJhbGciOiJWRURTNTEyIn0")
+        self.assertEqual(Utils.b64_decode("eyJhbGciOiJWRURTNTEyIn0"), b"{\"alg\":\"VEDS512\"}")
+        self.assertEqual(Utils.b64_decode("-_8"), b"\xfb\xff")
+
+    def test_b64_standard(self):
+        data = os.urandom(33)
+        encoded = base64.b64encode(data).decode()
+        self.assertEqual(Utils.b64encode(data), encoded)
+        self.assertEqual(Utils.b64encode(bytearray(data)), encoded)
+        self.assertEqual(Utils.b64encode(memoryview(data)), encoded)
+        self.assertEqual(Utils.b64encode(list(bytearray(data))), encoded)
+        for source in (encoded, encoded.encode(), memoryview(encoded.encode())):
+            self.assertEqual(Utils.b64decode(source), data)
+        self.assertRaises(ValueError, Utils.b64decode, "AQI")
@@ -32,13 +32,15 @@
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+from concurrent.futures import ThreadPoolExecutor
+
 from virgil_crypto.card_crypto import CardCrypto
 
 from virgil_sdk import CardManager, VirgilCardVerifier
 from virgil_sdk.jwt.providers import CallbackJwtProvider
 from virgil_sdk.tests import BaseTest
 from virgil_sdk.utils import Utils
-from virgil_sdk.verification import WhiteList, VerifierCredentials
+from virgil_sdk.verification import WhiteList, VerifierCredentials, CardVerificationException
 
 
 class CardVerifierTest(BaseTest):
@@ -231,3 +233,179 @@ class CardVerifierTest(BaseTest):
         creds_2 = VerifierCredentials(signer="extra", public_key_base64=public_key_1_base64)
         card_verifier.white_lists = WhiteList(creds_2)
         self.assertTrue(card_verifier.verify_card(card_from_string))
+
+    def test_verification_cache_respects_configuration(self):
+        card_verifier = VirgilCardVerifier(
+            CardCrypto(),
+            verify_self_signature=False,
+            verify_virgil_signature=False,
+            white_lists=[],
+            verification_cache_size=16
+        )
+        card_manager = CardManager(
+            card_crypto=CardCrypto(),
+            access_token_provider=CallbackJwtProvider(self._get_token_from_server),
+            card_verifier=card_verifier,
+            sign_callback=self.sign_callback
+        )
+        card_from_string = card_manager.import_card(self._compatibility_data["STC-11.as_string"])
+        self.assertEqual(card_verifier.verification_cache.misses, 1)
+        self.assertTrue(card_verifier.verify_card(card_from_string))
+        self.assertEqual(card_verifier.verification_cache.hits, 1)
+
+        card_verifier.verify_self_signature = True
+        self.assertFalse(card_verifier.verify_card(card_from_string))
+        self.assertFalse(card_verifier.verify_card(card_from_string))
+        self.assertEqual(card_verifier.verification_cache.hits, 2)
+
+        card_verifier.verify_self_signature = False
+        creds = VerifierCredentials(signer="extra", public_key_base64=self._compatibility_data["STC-16.public_key1_base64"])
+        card_verifier.white_lists = WhiteList(creds)
+        self.assertFalse(card_verifier.verify_card(card_from_string))
+        self.assertEqual(card_verifier.verification_cache.misses, 3)
+        self.assertEqual(len(card_verifier.verification_cache), 3)
+
+        white_list = card_verifier.white_lists[0]
+        fingerprint = white_list.fingerprint
+        self.assertFalse(card_verifier.verify_card(card_from_string))
+        self.assertIs(white_list.fingerprint, fingerprint)
+        self.assertEqual(card_verifier.verification_cache.hits, 3)
+        white_list.verifiers_credentials = [creds, creds]
+        self.assertNotEqual(white_list.fingerprint, fingerprint)
+        self.assertFalse(card_verifier.verify_card(card_from_string))
+        self.assertEqual(card_verifier.verification_cache.misses, 4)
+
+        self.assertIsNone(VirgilCardVerifier(CardCrypto()).verification_cache)
+
+    def test_public_keys_imported_once(self):
+
+        class CountingCardCrypto(CardCrypto):
+
+            def __init__(self):
+                super(CountingCardCrypto, self).__init__()
+                self.imports = 0
+
+            def import_public_key(self, public_key):
+                self.imports += 1
+                return super(CountingCardCrypto, self).import_public_key(public_key)
+
+        card_crypto = CountingCardCrypto()
+        card_verifier = VirgilCardVerifier(card_crypto, verify_self_signature=False)
+        card_manager = CardManager(
+            card_crypto=CardCrypto(),
+            access_token_provider=CallbackJwtProvider(self._get_token_from_server),
+            card_verifier=card_verifier,
+            sign_callback=self.sign_callback
+        )
+        card_from_string = card_manager.import_card(self._compatibility_data["STC-10.as_string"])
+        self.assertTrue(card_verifier.verify_card(card_from_string))
+        self.assertEqual(card_crypto.imports, 1)
+
+        private_key_1 = self._crypto.import_private_key(
+            bytearray(Utils.b64decode(self._compatibility_data["STC-10.private_key1_base64"]))
+        ).private_key
+        public_key_1 = self._crypto.extract_public_key(private_key_1)
+        public_key_1_base64 = Utils.b64encode(self._crypto.export_public_key(public_key_1))
+        creds = VerifierCredentials(signer="extra", public_key_base64=public_key_1_base64)
+        card_verifier.white_lists = [WhiteList(creds)]
+        for _ in range(3):
+            self.assertTrue(card_verifier.verify_card(card_from_string))
+        self.assertEqual(card_crypto.imports, 3)
+
+    def test_verify_cards(self):
+        card_verifier = VirgilCardVerifier(CardCrypto(), verify_virgil_signature=False)
+        card_manager = CardManager(
+            card_crypto=CardCrypto(),
+            access_token_provider=CallbackJwtProvider(self._get_token_from_server),
+            card_verifier=VirgilCardVerifier(CardCrypto(), verify_self_signature=False, verify_virgil_signature=False),
+            sign_callback=self.sign_callback
+        )
+        cards = card_manager.import_cards([
+            self._compatibility_data["STC-10.as_string"],
+            self._compatibility_data["STC-11.as_string"],
+            self._compatibility_data["STC-10.as_string"]
+        ])
+        self.assertEqual(card_verifier.verify_cards(cards), [True, False, True])
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            self.assertEqual(card_verifier.verify_cards(cards, executor), [True, False, True])
+        self.assertEqual(card_verifier.verify_cards([]), [])
+
+        card_manager = CardManager(
+            card_crypto=CardCrypto(),
+            access_token_provider=CallbackJwtProvider(self._get_token_from_server),
+            card_verifier=card_verifier,
+            sign_callback=self.sign_callback
+        )
+        self.assertRaises(
+            CardVerificationException,
+            card_manager.import_cards,
+            [self._compatibility_data["STC-10.as_string"], self._compatibility_data["STC-11.as_string"]]
+        )
+
+    def test_large_white_lists(self):
+        card_verifier = VirgilCardVerifier(CardCrypto(), verify_self_signature=False, verify_virgil_signature=False)
+        card_manager = CardManager(
+            card_crypto=CardCrypto(),
+            access_token_provider=CallbackJwtProvider(self._get_token_from_server),
+            card_verifier=card_verifier,
+            sign_callback=self.sign_callback
+        )
+        card_from_string = card_manager.import_card(self._compatibility_data["STC-10.as_string"])
+        private_key_1 = self._crypto.import_private_key(
+            bytearray(Utils.b64decode(self._compatibility_data["STC-10.private_key1_base64"]))
+        ).private_key
+        public_key_1_base64 = Utils.b64encode(
+            self._crypto.export_public_key(self._crypto.extract_public_key(private_key_1))
+        )
+        public_key_2_base64 = Utils.b64encode(
+            self._crypto.export_public_key(self._crypto.generate_key_pair().public_key)
+        )
+
+        partner_creds = [
+            VerifierCredentials(signer="partner{}".format(i), public_key_base64=public_key_2_base64)
+            for i in range(1000)
+        ]
+        white_list = WhiteList(partner_creds + [
+            VerifierCredentials(signer="extra", public_key_base64=public_key_2_base64),
+            VerifierCredentials(signer="extra", public_key_base64=public_key_1_base64)
+        ])
+        self.assertEqual(len(white_list.signer_index["extra"]), 2)
+        card_verifier.white_lists = [white_list, WhiteList(partner_creds)]
+        self.assertFalse(card_verifier.verify_card(card_from_string))
+        card_verifier.white_lists = [white_list] * 50
+        self.assertTrue(card_verifier.verify_card(card_from_string))
+
+        white_list.verifiers_credentials = partner_creds
+        self.assertNotIn("extra", white_list.signer_index)
+        self.assertFalse(card_verifier.verify_card(card_from_string))
+        self.assertEqual(WhiteList().verifiers_credentials, [])
+
+    def test_white_list_not_affected_by_outside_mutation(self):
+        public_key_base64 = Utils.b64encode(
+            self._crypto.export_public_key(self._crypto.generate_key_pair().public_key)
+        )
+        creds = [VerifierCredentials(signer="partner", public_key_base64=public_key_base64)]
+        white_list = WhiteList(creds)
+        fingerprint = white_list.fingerprint
+        creds.append(VerifierCredentials(signer="extra", public_key_base64=public_key_base64))
+        white_list.verifiers_credentials.append(creds[1])
+        self.assertEqual(len(white_list.verifiers_credentials), 1)
+        self.assertNotIn("extra", white_list.signer_index)
+        self.assertEqual(white_list.fingerprint, fingerprint)
+        white_list.verifiers_credentials = creds
+        self.assertIn("extra", white_list.signer_index)
+        self.assertNotEqual(white_list.fingerprint, fingerprint)
+
+    def test_raw_content_snapshot_shared(self):
+        card_manager = CardManager(
+            card_crypto=CardCrypto(),
+            access_token_provider=CallbackJwtProvider(self._get_token_from_server),
+            card_verifier=VirgilCardVerifier(CardCrypto(), verify_virgil_signature=False),
+            sign_callback=self.sign_callback
+        )
+        card = card_manager.import_card(self._compatibility_data["STC-10.as_string"])
+        raw_content_snapshot = card.raw_content_snapshot
+        self.assertIsInstance(raw_content_snapshot, memoryview)
+        self.assertTrue(raw_content_snapshot.readonly)
+        self.assertEqual(raw_content_snapshot.tobytes(), Utils.b64_decode(card.content_snapshot))
+        self.assertIs(raw_content_snapshot.obj, card.raw_content_snapshot.obj)
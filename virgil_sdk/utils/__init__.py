@@ -32,3 +32,5 @@
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 from .utils import Utils
+from .ttl_cache import TtlCache
+from .json_codec import JsonCodec, OrjsonCodec, UjsonCodec, available_json_codecs
@@ -0,0 +1,178 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import json
+import re
+import sys
+
+
+class JsonCodec(object):
+    """
+    The JsonCodec serializes and deserializes json with the standard library.
+
+    Subclasses provide faster backends and must give byte-identical output,
+    falling back to this implementation whenever they can't guarantee it.
+    """
+
+    name = "json"
+
+    def loads(self, source):
+        # type: (Union[str, bytes, bytearray, memoryview]) -> Any
+        """
+        Deserializes json document.
+
+        Args:
+            source: Json document as text or utf-8 encoded buffer.
+
+        Returns:
+            Deserialized python object.
+        """
+        if isinstance(source, memoryview):
+            source = source.tobytes()
+        if isinstance(source, bytearray) and sys.version_info[0] == 2:
+            source = bytes(source)
+        elif isinstance(source, (bytes, bytearray)) and (3, 0) <= sys.version_info < (3, 6):
+            source = source.decode()
+        return json.loads(source)
+
+    def dumps(self, source, *args, **kwargs):
+        # type: (Any) -> str
+        """
+        Serializes python object to json.
+
+        Accepts the same arguments as json.dumps.
+
+        Returns:
+            Json document.
+        """
+        return json.dumps(source, *args, **kwargs)
+
+
+class _FastJsonCodec(JsonCodec):
+    """
+    Base of third-party backends.
+
+    Only canonical output (sorted keys, compact separators, ASCII only) is
+    produced by the backend, everything else goes to the standard library.
+    """
+
+    # output the standard library may render differently: raw non-ASCII
+    # characters and DEL, NaN/Infinity rendered as null and any float token,
+    # since float formatting differs between backends
+    __UNSAFE_OUTPUT = re.compile(b"[^\\x00-\\x7e]|null|(?:^|[:,\\[])-?[0-9]+[.eE]")
+    # integers beyond 64 bits may lose precision in the backend
+    __LONG_NUMBER = re.compile(b"[0-9]{19}")
+    __LONG_NUMBER_TEXT = re.compile(u"[0-9]{19}")
+
+    def loads(self, source):
+        # type: (Union[str, bytes, bytearray, memoryview]) -> Any
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            has_long_number = self.__LONG_NUMBER.search(source)
+        else:
+            has_long_number = self.__LONG_NUMBER_TEXT.search(source)
+        if not has_long_number:
+            try:
+                return self._loads(source)
+            except Exception:
+                pass
+        return super(_FastJsonCodec, self).loads(source)
+
+    def dumps(self, source, *args, **kwargs):
+        # type: (Any) -> str
+        if args or kwargs != {"sort_keys": True, "separators": (",", ":")}:
+            return super(_FastJsonCodec, self).dumps(source, *args, **kwargs)
+        try:
+            result = self._dumps_canonical(source)
+        except Exception:
+            result = None
+        if result is None or self.__UNSAFE_OUTPUT.search(result):
+            return super(_FastJsonCodec, self).dumps(source, *args, **kwargs)
+        return result.decode()
+
+    def _loads(self, source):
+        raise NotImplementedError()
+
+    def _dumps_canonical(self, source):
+        # type: (Any) -> bytes
+        raise NotImplementedError()
+
+
+class OrjsonCodec(_FastJsonCodec):
+    """JsonCodec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self.__orjson = orjson
+
+    def _loads(self, source):
+        return self.__orjson.loads(source)
+
+    def _dumps_canonical(self, source):
+        return self.__orjson.dumps(source, option=self.__orjson.OPT_SORT_KEYS)
+
+
+class UjsonCodec(_FastJsonCodec):
+    """JsonCodec backed by ujson."""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self.__ujson = ujson
+
+    def _loads(self, source):
+        if isinstance(source, memoryview):
+            source = source.tobytes()
+        return self.__ujson.loads(source)
+
+    def _dumps_canonical(self, source):
+        result = self.__ujson.dumps(source, sort_keys=True, ensure_ascii=True, escape_forward_slashes=False)
+        return result.encode()
+
+
+def available_json_codecs():
+    # type: () -> List[JsonCodec]
+    """
+    Returns:
+        Instances of all importable JsonCodec backends, the fastest first.
+    """
+    codecs = list()
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    codecs.append(JsonCodec())
+    return codecs
@@ -0,0 +1,224 @@
+# Copyright (C) 2016-2019 Virgil Security Inc.
+#
+# Lead Maintainer: Virgil Security Inc. <support@virgilsecurity.com>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#     (1) Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#     (2) Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#     (3) Neither the name of the copyright holder nor the names of its
+#     contributors may be used to endorse or promote products derived from
+#     this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ''AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import threading
+import time
+from collections import OrderedDict
+
+
+class TtlCache(object):
+    """
+    Thread-safe in-memory cache with least-recently-used eviction and per-entry expiration.
+
+    Args:
+        capacity: Maximum number of entries, None for unbounded.
+        ttl: Default entry lifetime in seconds, None for entries that never expire.
+        on_evict: Callable receiving (key, value) of every entry dropped by
+            capacity, expiration, replacement or clear.
+        clock: Callable returning the current time in seconds.
+    """
+
+    def __init__(self, capacity=1024, ttl=None, on_evict=None, clock=time.time):
+        # type: (Optional[int], Optional[float], Optional[Callable[[Any, Any], None]], Callable[[], float]) -> None
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.__capacity = capacity
+        self.__ttl = ttl
+        self.__on_evict = on_evict
+        self.__clock = clock
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, key, default=None):
+        # type: (Hashable, Any) -> Any
+        """
+        Gets a live entry and marks it as recently used.
+
+        Args:
+            key: Entry key.
+            default: Value returned if the entry is missing or expired.
+
+        Returns:
+            Cached value or default.
+        """
+        evicted = None
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if entry is not None and entry[1] is not None and entry[1] <= self.__clock():
+                evicted = [(key, entry[0])]
+                self.__evictions += 1
+                entry = None
+            if entry is None:
+                self.__misses += 1
+            else:
+                self.__entries[key] = entry
+                self.__hits += 1
+        self.__notify(evicted)
+        return default if entry is None else entry[0]
+
+    def put(self, key, value, ttl=None, expires_at=None):
+        # type: (Hashable, Any, Optional[float], Optional[float]) -> None
+        """
+        Stores an entry, evicting the least recently used ones above capacity.
+
+        Args:
+            key: Entry key.
+            value: Value to be cached.
+            ttl: Entry lifetime in seconds, overrides the cache default.
+            expires_at: Absolute expiration time, overrides ttl.
+        """
+        evicted = []
+        with self.__lock:
+            now = self.__clock()
+            if expires_at is None:
+                ttl = self.__ttl if ttl is None else ttl
+                expires_at = None if ttl is None else now + ttl
+            previous = self.__entries.pop(key, None)
+            if previous is not None and previous[0] is not value:
+                evicted.append((key, previous[0]))
+            self.__entries[key] = (value, expires_at)
+            if self.__capacity is not None:
+                while len(self.__entries) > self.__capacity:
+                    evicted_key, evicted_entry = self.__entries.popitem(last=False)
+                    evicted.append((evicted_key, evicted_entry[0]))
+                    self.__evictions += 1
+        self.__notify(evicted)
+
+    def pop(self, key, default=None):
+        # type: (Hashable, Any) -> Any
+        """
+        Removes an entry without notifying the eviction callback.
+
+        Args:
+            key: Entry key.
+            default: Value returned if the entry is missing.
+
+        Returns:
+            Removed value or default.
+        """
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def purge_expired(self):
+        # type: () -> int
+        """
+        Drops all expired entries.
+
+        Returns:
+            Number of dropped entries.
+        """
+        with self.__lock:
+            now = self.__clock()
+            expired = [
+                (key, entry[0]) for key, entry in self.__entries.items()
+                if entry[1] is not None and entry[1] <= now
+            ]
+            for key, _ in expired:
+                del self.__entries[key]
+            self.__evictions += len(expired)
+        self.__notify(expired)
+        return len(expired)
+
+    def clear(self):
+        # type: () -> None
+        """
+        Drops all entries.
+        """
+        with self.__lock:
+            dropped = [(key, entry[0]) for key, entry in self.__entries.items()]
+            self.__entries.clear()
+        self.__notify(dropped)
+
+    def keys(self):
+        # type: () -> List[Hashable]
+        """
+        Returns:
+            Keys of the cached entries from least to most recently used.
+        """
+        with self.__lock:
+            return list(self.__entries.keys())
+
+    def __notify(self, evicted):
+        if self.__on_evict and evicted:
+            for key, value in evicted:
+                self.__on_evict(key, value)
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__entries)
+
+    def __contains__(self, key):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            return entry is not None and (entry[1] is None or entry[1] > self.__clock())
+
+    @property
+    def capacity(self):
+        """
+        Maximum number of entries.
+        """
+        return self.__capacity
+
+    @property
+    def ttl(self):
+        """
+        Default entry lifetime in seconds.
+        """
+        return self.__ttl
+
+    @property
+    def hits(self):
+        """
+        Number of lookups served from the cache.
+        """
+        return self.__hits
+
+    @property
+    def misses(self):
+        """
+        Number of lookups of missing or expired entries.
+        """
+        return self.__misses
+
+    @property
+    def evictions(self):
+        """
+        Number of entries dropped because of capacity or expiration.
+        """
+        return self.__evictions
@@ -34,9 +34,10 @@
 import base64
 import binascii
 import datetime
-import json
 import sys
 
+from .json_codec import available_json_codecs
+
 if sys.version_info[0] == 2:
     from __builtin__ import unicode
 
@@ -53,34 +54,35 @@ else:
     def check_unicode(source):
         return False
 
+_URLSAFE_DECODE_TRANSLATION = bytes(bytearray(
+    ord("+") if i == ord("-") else ord("/") if i == ord("_") else i for i in range(256)
+))
+
 
 class Utils(object):
 
+    _json_codec = available_json_codecs()[0]
+
     @staticmethod
     def b64_decode(source):
         """Decode base64, padding being optional.
 
         Args:
-            source: Base64 data as an ASCII byte string
+            source: Base64 data as an ASCII string or bytes-like object
 
         Returns:
             The decoded byte string.
 
         """
-        try:
-            if isinstance(source, bytes):
-                return base64.urlsafe_b64decode(source)
-            return base64.urlsafe_b64decode(bytearray(source, "utf-8"))
-        except (binascii.Error, TypeError) as e:
-            missing_padding = len(source) % 4
-            if missing_padding != 0:
-                if isinstance(source, str) or check_unicode(source):
-                    source += '=' * (4 - missing_padding)
-                if isinstance(source, bytes) or isinstance(source, bytearray):
-                    source += b'=' * (4 - missing_padding)
-            if isinstance(source, bytes):
-                return base64.urlsafe_b64decode(source)
-            return base64.urlsafe_b64decode(bytearray(source, "utf-8"))
+        if isinstance(source, memoryview):
+            source = source.tobytes()
+        elif not isinstance(source, (bytes, bytearray)):
+            source = source.encode("ascii")
+        missing_padding = -len(source) % 4
+        source = bytes(source).translate(_URLSAFE_DECODE_TRANSLATION)
+        if missing_padding:
+            source += b"=" * missing_padding
+        return binascii.a2b_base64(source)
 
     @staticmethod
     def b64_encode(source):
@@ -93,11 +95,9 @@ class Utils(object):
         Returns:
             Encoded data without '=' sign
         """
-        if isinstance(source, bytes):
-            encoded = base64.urlsafe_b64encode(source)
-        else:
-            encoded = base64.urlsafe_b64encode(bytearray(source, "utf-8"))
-        return bytearray(encoded).decode().rstrip("=")
+        if not isinstance(source, (bytes, bytearray, memoryview)):
+            source = source.encode("utf-8")
+        return base64.urlsafe_b64encode(source).rstrip(b"=").decode("ascii")
 
     @staticmethod
     def strtobytes(source):
@@ -113,31 +113,48 @@ class Utils(object):
 
     @staticmethod
     def b64encode(source):
-        # type: (Union[str, bytes]) -> str
-        """Convert source to bytearray and encode using base64."""
-        return base64.b64encode(bytearray(source)).decode("utf-8", "ignore")
+        # type: (Union[bytes, bytearray, memoryview, Iterable[int]]) -> str
+        """Encode bytes-like source or sequence of byte values using base64."""
+        if not isinstance(source, (bytes, bytearray, memoryview)):
+            source = bytearray(source)
+        return base64.b64encode(source).decode("ascii")
 
     @staticmethod
     def b64decode(source):
-        # type: (Union[str, bytes]) -> str
-        """Convert source to bytearray and decode using base64."""
-        if isinstance(source, bytes):
-            return base64.b64decode(source)
-        return base64.b64decode(bytearray(source, "utf-8"))
+        # type: (Union[str, bytes, bytearray, memoryview]) -> bytes
+        """Decode source using base64."""
+        if not isinstance(source, (bytes, bytearray, memoryview)):
+            source = source.encode("ascii")
+        return binascii.a2b_base64(source)
 
-    @staticmethod
-    def json_loads(source):
-        # type: (Union[str, bytes, bytearray]) -> dict
-        """Convert source to bytearray and deserialize from json to python dict object."""
-        if isinstance(source, bytes):
-            return json.loads(bytearray(source).decode())
-        return json.loads(bytearray(source, "utf-8").decode())
+    @classmethod
+    def json_loads(cls, source):
+        # type: (Union[str, bytes, bytearray, memoryview]) -> dict
+        """Deserialize source from json to python dict object."""
+        return cls._json_codec.loads(source)
 
-    @staticmethod
-    def json_dumps(source, *args, **kwargs):
+    @classmethod
+    def json_dumps(cls, source, *args, **kwargs):
         # type: (object) -> str
         """Convert python dict to json string"""
-        return json.dumps(source, *args, **kwargs)
+        return cls._json_codec.dumps(source, *args, **kwargs)
+
+    @classmethod
+    def set_json_codec(cls, json_codec):
+        # type: (JsonCodec) -> None
+        """
+        Replaces json backend used by the SDK.
+
+        Args:
+            json_codec: An instance of JsonCodec.
+        """
+        cls._json_codec = json_codec
+
+    @classmethod
+    def get_json_codec(cls):
+        # type: () -> JsonCodec
+        """Gets json backend used by the SDK."""
+        return cls._json_codec
 
     @staticmethod
     def to_timestamp(date):
@@ -51,3 +51,20 @@ class CardVerifier(object):
             True if card is verified, False otherwise
         """
         raise NotImplementedError()
+
+    def verify_cards(self, cards, executor=None):
+        # type: (List[Card], Optional[Executor]) -> List[bool]
+        """
+        Verify the specified cards.
+
+        Args:
+            cards: The list of Card to be verified.
+            executor: concurrent.futures.Executor used to verify cards in parallel,
+                cards are verified one by one in the calling thread if None.
+
+        Returns:
+            The list of verification results in the order of cards.
+        """
+        if executor is None:
+            return list(map(self.verify_card, cards))
+        return list(executor.map(self.verify_card, cards))
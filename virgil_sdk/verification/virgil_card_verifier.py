@@ -31,15 +31,21 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import hashlib
+import threading
 
 from virgil_sdk.signers.model_signer import ModelSigner
-from virgil_sdk.utils import Utils
+from virgil_sdk.utils import Utils, TtlCache
 from .card_verifier import CardVerifier
 
 
 class VirgilCardVerifier(CardVerifier):
     """
     The VirgilCardVerifier represents card verification process.
+
+    If verification_cache_size is set, results are memoized for up to that many
+    cards. A result is reused only for the same card content, signatures and
+    verifier configuration, so changing the rules never returns a stale result.
     """
 
     def __init__(
@@ -47,13 +53,19 @@ class VirgilCardVerifier(CardVerifier):
         crypto,
         verify_self_signature=True,  # type: bool
         verify_virgil_signature=True,  # type: bool
-        white_lists=list()  # type: List[WhiteList]
+        white_lists=list(),  # type: List[WhiteList]
+        verification_cache_size=None  # type: Optional[int]
     ):
         self._crypto = crypto
         self.verify_self_signature = verify_self_signature
         self.verify_virgil_signature = verify_virgil_signature
         self.__white_lists = white_lists
         self.__virgil_public_key_base64 = "MCowBQYDK2VwAyEAljOYGANYiVq1WbvVvoYIKtvZi2ji9bAhxyu6iV/LF8M="
+        self.__public_keys = dict()
+        self.__public_keys_lock = threading.Lock()
+        self.__verification_cache = None
+        if verification_cache_size:
+            self.__verification_cache = TtlCache(verification_cache_size)
 
     def verify_card(self, card):
         # type: (Card) -> bool
@@ -70,67 +82,107 @@ class VirgilCardVerifier(CardVerifier):
         Returns:
             True is card is verified according to set rules, otherwise False.
         """
-        if self.verify_self_signature and not self.__validate_signer_signature(
+        if self.__verification_cache is None:
+            return self.__verify_card(card)
+        key = self.__verification_key(card)
+        verified = self.__verification_cache.get(key)
+        if verified is None:
+            verified = self.__verify_card(card)
+            self.__verification_cache.put(key, verified)
+        return verified
+
+    def __verify_card(self, card):
+        # type: (Card) -> bool
+        signatures = dict()
+        for signature in card.signatures:
+            signatures.setdefault(signature.signer, signature)
+
+        if self.verify_self_signature and not self.__validate_signature(
                 card,
-                card.public_key,
-                ModelSigner.SELF_SIGNER
+                signatures.get(ModelSigner.SELF_SIGNER),
+                card.public_key
         ):
             return False
 
-        if self.verify_virgil_signature and not self.__validate_signer_signature(
+        if self.verify_virgil_signature and not self.__validate_signature(
                 card,
-                self.__get_public_key(self.__virgil_public_key_base64),
-                ModelSigner.VIRGIL_SIGNER
+                signatures.get(ModelSigner.VIRGIL_SIGNER),
+                self.__get_public_key(self.__virgil_public_key_base64)
         ):
             return False
 
         if not any(self.white_lists):
             return True
 
-        signers = list(map(lambda x: x.signer, card.signatures))
-        verifiers_credentials_lists = list(map(lambda x: x.verifiers_credentials, self.white_lists))
-
-        for verifiers_credentials in verifiers_credentials_lists:
-
-            intersected_creds = list(filter(lambda x: x.signer in signers, verifiers_credentials))
-
-            if not any(intersected_creds):
+        for white_list in self.white_lists:
+            if not self.__validate_white_list(card, signatures, white_list.signer_index):
                 return False
-
-            for intersected_cred in intersected_creds:
-                signer_public_key = self.__get_public_key(intersected_cred.public_key_base64)
-                if self.__validate_signer_signature(card, signer_public_key, intersected_cred.signer):
-                    break
-                if intersected_cred is intersected_creds[-1]:
-                    return False
         return True
 
-    def __get_public_key(self, signer_public_key_base64):
-        public_key_bytes = Utils.b64_decode(signer_public_key_base64)
-        return self._crypto.import_public_key(bytearray(public_key_bytes))
+    def __validate_white_list(self, card, signatures, signer_index):
+        # type: (Card, Dict[str, CardSignature], Dict[str, List[VerifierCredentials]]) -> bool
+        for signer, signature in signatures.items():
+            for credentials in signer_index.get(signer, ()):
+                if self.__validate_signature(card, signature, self.__get_public_key(credentials.public_key_base64)):
+                    return True
+        return False
 
-    def __validate_signer_signature(self, card, signer_public_key, signer_type):
-        signature = None
-        for sign in card.signatures:
-            if sign.signer == signer_type:
-                signature = sign
-                break
+    def __verification_key(self, card):
+        # type: (Card) -> bytes
+        parts = [
+            card.id,
+            self.verify_self_signature,
+            self.verify_virgil_signature,
+            self.__virgil_public_key_base64 if self.verify_virgil_signature else ""
+        ]
+        for white_list in self.white_lists or []:
+            parts.append(white_list.fingerprint)
+        for signature in card.signatures:
+            parts += [signature.signer, signature.signature, signature.snapshot or ""]
+        digest = hashlib.sha256()
+        for part in parts:
+            if not isinstance(part, (bytes, bytearray)):
+                part = str(part).encode()
+            digest.update(str(len(part)).encode() + b":" + bytes(part))
+        return digest.digest()
 
+    def __get_public_key(self, signer_public_key_base64):
+        public_key = self.__public_keys.get(signer_public_key_base64)
+        if public_key is None:
+            with self.__public_keys_lock:
+                public_key = self.__public_keys.get(signer_public_key_base64)
+                if public_key is None:
+                    public_key_bytes = Utils.b64_decode(signer_public_key_base64)
+                    public_key = self._crypto.import_public_key(bytearray(public_key_bytes))
+                    self.__public_keys[signer_public_key_base64] = public_key
+        return public_key
+
+    def __validate_signature(self, card, signature, signer_public_key):
         if signature:
             if signature.snapshot:
-                extended_snapshot = bytearray(Utils.b64_decode(card.content_snapshot))\
-                                    + bytearray(Utils.b64_decode(signature.snapshot))
+                extended_snapshot = bytearray(card.raw_content_snapshot)
+                extended_snapshot += Utils.b64_decode(signature.snapshot)
             else:
-                extended_snapshot = bytearray(Utils.b64_decode(card.content_snapshot))
+                extended_snapshot = card.raw_content_snapshot
 
             if self._crypto.verify_signature(
-                bytearray(signature.signature),
+                signature.signature,
                 extended_snapshot,
                 signer_public_key
             ):
                 return True
         return False
 
+    @property
+    def verification_cache(self):
+        """
+        Memoized verification results.
+
+        Returns:
+            TtlCache of verification results or None if memoization is disabled.
+        """
+        return self.__verification_cache
+
     @property
     def white_lists(self):
         """Get white lists."""
@@ -138,6 +190,8 @@ class VirgilCardVerifier(CardVerifier):
 
     @white_lists.setter
     def white_lists(self, value):
+        with self.__public_keys_lock:
+            self.__public_keys = dict()
         if value:
             self.__white_lists = list()
             if not isinstance(value, list):
@@ -31,6 +31,7 @@
 # STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import hashlib
 
 
 class WhiteList(object):
@@ -41,21 +42,55 @@ class WhiteList(object):
         # type: (Union[List[VerifierCredentials], VerifierCredentaials])->None
         if verifier_credentials is None:
             self.__verifiers_credentials = list()
-        if isinstance(verifier_credentials, list):
-            self.__verifiers_credentials = verifier_credentials
+        elif isinstance(verifier_credentials, list):
+            self.__verifiers_credentials = list(verifier_credentials)
         else:
             self.__verifiers_credentials = [verifier_credentials]
+        self.__signer_index = None
+        self.__fingerprint = None
 
     @property
     def verifiers_credentials(self):
         """
         The collection of VerifierCredentials
         that is used for card verification in VirgilCardVerifier.
+        Returns a copy, assign the property to change the collection.
         """
-        return self.__verifiers_credentials
+        return list(self.__verifiers_credentials)
 
     @verifiers_credentials.setter
     def verifiers_credentials(self, value):
         if value:
             self.__verifiers_credentials = list()
             self.__verifiers_credentials += value
+            self.__signer_index = None
+            self.__fingerprint = None
+
+    @property
+    def signer_index(self):
+        """
+        The VerifierCredentials grouped by signer in the original order.
+        """
+        signer_index = self.__signer_index
+        if signer_index is None:
+            signer_index = dict()
+            for credentials in self.__verifiers_credentials:
+                signer_index.setdefault(credentials.signer, []).append(credentials)
+            self.__signer_index = signer_index
+        return signer_index
+
+    @property
+    def fingerprint(self):
+        """
+        Digest of the VerifierCredentials identifying this whitelist in verification results.
+        """
+        fingerprint = self.__fingerprint
+        if fingerprint is None:
+            digest = hashlib.sha256()
+            for credentials in self.__verifiers_credentials:
+                for part in (credentials.signer, credentials.public_key_base64):
+                    part = part if isinstance(part, bytes) else str(part).encode()
+                    digest.update(str(len(part)).encode() + b":" + part)
+            fingerprint = digest.digest()
+            self.__fingerprint = fingerprint
+        return fingerprint